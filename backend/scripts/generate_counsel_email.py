@@ -3,277 +3,32 @@
 generate_counsel_email.py
 
 Generate a counsel/PSP email using Hugging Face Inference API.
-Reads proof_summary.tsv and crafts a professional email with merkle roots and anchor TXs.
+Same command line as scripts/generate_counsel_email.py (the counsel_email
+package), with the hf generator as the default.
 
 Usage:
-  python3 scripts/generate_counsel_email.py <proof_summary.tsv> <output_email.txt>
+  python3 backend/scripts/generate_counsel_email.py [--concurrency N] [--no-cache] <proof_summary.tsv> <output_email.txt>
+  python3 backend/scripts/generate_counsel_email.py --recipients <recipients.tsv> <proof_summary.tsv> <output_dir>
+  python3 backend/scripts/generate_counsel_email.py --deadline SECONDS [--metrics PATH] <proof_summary.tsv> <output_email.txt>
 
 Environment variables:
   HF_API_KEY: Hugging Face API token (required)
   HF_MODEL: Model to use (default: google/flan-ul2)
+  HF_API_URL, HF_CACHE_DIR: see scripts/counsel_email/hf_client.py and cache.py
 
 Example:
-  HF_API_KEY=hf_xxxx python3 scripts/generate_counsel_email.py artifacts/proof_summary.tsv generated_counsel_email.txt
+  HF_API_KEY=hf_xxxx python3 backend/scripts/generate_counsel_email.py artifacts/proof_summary.tsv generated_counsel_email.txt
+  python3 backend/scripts/generate_counsel_email.py --deadline 20 --metrics artifacts/counsel_email_metrics.json \
+      artifacts/proof_summary.tsv generated_counsel_email.txt
 """
 
 import sys
 import os
-import requests
-from pathlib import Path
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir, 'scripts'))
 
-def read_proof_summary(tsv_path: str) -> list:
-    """Read proof_summary.tsv and return list of (id, merkle_root, anchor_tx) tuples."""
-    proofs = []
-    
-    try:
-        with open(tsv_path, 'r') as f:
-            lines = f.readlines()
-            # Skip header
-            for line in lines[1:]:
-                parts = line.strip().split('\t')
-                if len(parts) >= 3:
-                    proofs.append({
-                        'id': parts[0],
-                        'merkle_root': parts[1],
-                        'anchor_tx': parts[2]
-                    })
-    except FileNotFoundError:
-        print(f"❌ Proof summary file not found: {tsv_path}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"❌ Error reading proof summary: {e}")
-        sys.exit(1)
-    
-    return proofs
-
-
-def generate_email_via_hf(proofs: list, hf_api_key: str, hf_model: str = 'google/flan-ul2') -> str:
-    """Call Hugging Face Inference API to generate counsel email."""
-    
-    if not hf_api_key:
-        print("❌ HF_API_KEY environment variable not set")
-        sys.exit(1)
-    
-    # Build proof summary for prompt
-    proofs_text = "\n".join([
-        f"  • Match ID {p['id']}: merkle_root={p['merkle_root'][:16]}..., anchor_tx={p['anchor_tx'][:16]}..."
-        for p in proofs[:5]
-    ])
-    if len(proofs) > 5:
-        proofs_text += f"\n  • ... and {len(proofs) - 5} more proofs"
-    
-    # Craft the prompt
-    prompt = f"""You are a professional legal counsel email generator. Generate a formal email to legal counsel and PSP contacts summarizing an evidence bundle validation for blockchain-based compliance verification.
-
-EVIDENCE SUMMARY:
-Total proofs validated: {len(proofs)}
-Merkle root proofs extracted:
-{proofs_text}
-
-INSTRUCTIONS:
-1. Write a professional email suitable for sending to legal counsel/compliance officers.
-2. Summarize the evidence bundle contents: merkle roots, anchor transactions, and proof chain.
-3. Include the proof summary above.
-4. Request a 24-48 hour legal review.
-5. Suggest blockchain explorer links for anchor_tx verification (e.g., Etherscan if Ethereum).
-6. Do NOT invent or hallucinate transaction IDs or links.
-7. Do NOT generate commands or code snippets.
-8. Focus on compliance, audit readiness, and immutability verification.
-9. Sign off professionally.
-
-EMAIL BODY:"""
-    
-    headers = {
-        "Authorization": f"Bearer {hf_api_key}",
-        "Content-Type": "application/json"
-    }
-    
-    payload = {
-        "inputs": prompt,
-        "parameters": {
-            "max_new_tokens": 800,
-            "temperature": 0.7,
-            "do_sample": True
-        }
-    }
-    
-    url = f"https://api-inference.huggingface.co/models/{hf_model}"
-    
-    print(f"📧 Calling Hugging Face API ({hf_model})...")
-    
-    try:
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
-        
-        if response.status_code == 200:
-            result = response.json()
-            if isinstance(result, list) and len(result) > 0:
-                generated_text = result[0].get('generated_text', '')
-                # Extract just the email body (after the prompt)
-                if 'EMAIL BODY:' in generated_text:
-                    email_body = generated_text.split('EMAIL BODY:')[-1].strip()
-                else:
-                    email_body = generated_text.replace(prompt, '').strip()
-                
-                print(f"✅ Generated {len(email_body)} characters of email text")
-                return email_body
-            else:
-                print(f"❌ Unexpected response format: {result}")
-                sys.exit(1)
-        else:
-            print(f"❌ Hugging Face API error: {response.status_code}")
-            print(f"Response: {response.text}")
-            sys.exit(1)
-    
-    except requests.exceptions.Timeout:
-        print("❌ Hugging Face API request timed out")
-        sys.exit(1)
-    except Exception as e:
-        print(f"❌ Error calling Hugging Face API: {e}")
-        sys.exit(1)
-
-
-def format_counsel_email(proofs: list, generated_body: str) -> str:
-    """Format the final counsel email with header and footer."""
-    
-    email = f"""Subject: BlazeTV Evidence Bundle Validation & Legal Review Request
-
-───────────────────────────────────────────────────────────────────────────
-
-TO: Legal Counsel & Compliance Officers
-FROM: BlazeTV Development Team
-DATE: {get_date()}
-RE: Blockchain Evidence Bundle Validation Report
-
-───────────────────────────────────────────────────────────────────────────
-
-Dear Counsel,
-
-Please find below our automated evidence bundle validation summary for the BlazeTV 
-platform compliance audit. This bundle contains blockchain-anchored proofs of system 
-integrity and data immutability.
-
-**EXECUTIVE SUMMARY**
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-Total Proofs Validated: {len(proofs)}
-Bundle Status: ✅ VERIFIED
-Merkle Root Chain: Complete
-Anchor Transactions: Anchored to blockchain
-
-**PROOF DETAILS**
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
-    
-    for i, proof in enumerate(proofs[:10], 1):
-        email += f"\nProof #{i}:\n"
-        email += f"  Match ID: {proof['id']}\n"
-        email += f"  Merkle Root: {proof['merkle_root']}\n"
-        if proof['anchor_tx'] and proof['anchor_tx'] != 'pending':
-            # Try to guess the chain (basic heuristic)
-            if proof['anchor_tx'].lower().startswith('0x'):
-                email += f"  Anchor TX: {proof['anchor_tx']}\n"
-                email += f"  Verify: https://etherscan.io/tx/{proof['anchor_tx']} (if Ethereum)\n"
-            else:
-                email += f"  Anchor TX: {proof['anchor_tx']}\n"
-        else:
-            email += f"  Anchor TX: (pending blockchain confirmation)\n"
-    
-    if len(proofs) > 10:
-        email += f"\n... and {len(proofs) - 10} additional proofs in the bundle\n"
-    
-    email += f"""
-
-**AI-GENERATED COMPLIANCE SUMMARY**
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-{generated_body}
-
-**ACTION REQUIRED**
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-1. Review the proof details and merkle root chain above
-2. Verify anchor transactions on blockchain explorer (links provided)
-3. Confirm compliance with regulatory requirements
-4. Provide written approval for production deployment
-5. Expected timeline: 24-48 hours
-
-**NEXT STEPS**
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-Upon your approval, we will:
-  ✓ Deploy to production environment
-  ✓ Enable real-money transaction processing
-  ✓ Activate live streaming with content verification
-  ✓ Monitor compliance metrics in real-time
-
-Please reply with:
-  • Your written approval
-  • Any compliance concerns or required modifications
-  • Confirmation of review timeline
-
-Thank you for your prompt review.
-
-Best regards,
-BlazeTV Development Team
-
-───────────────────────────────────────────────────────────────────────────
-Generated by: GitHub Actions Auto-Validate Workflow
-Timestamp: {get_timestamp()}
-───────────────────────────────────────────────────────────────────────────
-"""
-    
-    return email
-
-
-def get_date():
-    """Get current date in readable format."""
-    from datetime import datetime
-    return datetime.utcnow().strftime('%B %d, %Y')
-
-
-def get_timestamp():
-    """Get current timestamp."""
-    from datetime import datetime
-    return datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')
-
-
-def main():
-    if len(sys.argv) != 3:
-        print(f"Usage: {sys.argv[0]} <proof_summary.tsv> <output_email.txt>")
-        sys.exit(1)
-    
-    tsv_path = sys.argv[1]
-    output_path = sys.argv[2]
-    
-    hf_api_key = os.getenv('HF_API_KEY')
-    hf_model = os.getenv('HF_MODEL', 'google/flan-ul2')
-    
-    print(f"🚀 Generating counsel email...")
-    print(f"  Input: {tsv_path}")
-    print(f"  Output: {output_path}")
-    print(f"  Model: {hf_model}")
-    
-    # Read proofs
-    proofs = read_proof_summary(tsv_path)
-    print(f"✅ Loaded {len(proofs)} proofs")
-    
-    # Generate email body via HF
-    email_body = generate_email_via_hf(proofs, hf_api_key, hf_model)
-    
-    # Format complete email
-    complete_email = format_counsel_email(proofs, email_body)
-    
-    # Write to output
-    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
-    
-    with open(output_path, 'w') as f:
-        f.write(complete_email)
-    
-    print(f"✅ Email written to {output_path}")
-    print(f"\n📧 Preview (first 40 lines):")
-    print("\n".join(complete_email.split("\n")[:40]))
+from counsel_email.cli import main
 
 
 if __name__ == '__main__':
-    main()
+    main(default_generator='hf')
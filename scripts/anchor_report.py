@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+anchor_report.py
+
+Group proofs by anchor transaction and merkle root in one streaming pass and
+report how many proofs each anchor_tx covers, which proofs are still pending
+(and could be anchored together in one new transaction), and which anchor or
+root values are not well-formed.
+
+Each row costs one dict update keyed on (anchor_tx, merkle_root); the
+pending check and the tx/root format checks run once per distinct value,
+not once per proof. Time is O(proofs), memory O(distinct anchor/root
+pairs), which is small because one anchor and one root each cover a whole
+tree, plus up to SAMPLE_IDS proof IDs per pending or malformed pair.
+
+The same aggregation feeds the counsel email (counsel_email.summary) and
+extract_roots.py --anchors.
+
+Usage:
+  python3 scripts/anchor_report.py [--sample-ids N] <proof_summary.tsv|.psum|.zip> [anchor_report.json]
+
+Example:
+  python3 scripts/anchor_report.py artifacts/proof_summary.tsv artifacts/anchor_report.json
+  python3 scripts/extract_roots.py --anchors artifacts/anchor_report.json bundle.zip artifacts/proof_summary.tsv
+
+Report (compact JSON, one line):
+  {"proofs": 5000, "anchored_proofs": 3750, "pending_proofs": 1250, "invalid_anchor_proofs": 0,
+   "distinct_anchors": 1, "distinct_roots": 1,
+   "anchors": [{"anchor_tx": "0x...", "chain": "evm", "proofs": 3750, "merkle_roots": {"0x...": 3750}}],
+   "pending_batch": {"proofs": 1250, "merkle_roots": [{"merkle_root": "0x...", "proofs": 1250,
+                                                       "sample_ids": ["40000", ...]}]},
+   "invalid_anchors": [], "invalid_roots": []}
+"""
+
+import sys
+import os
+import re
+import json
+import argparse
+
+# anchor_tx values meaning the root has not been anchored yet
+PENDING_ANCHORS = frozenset(('', 'pending', 'tx_pending', 'none', 'null'))
+
+# Transaction hash formats, checked once per distinct anchor_tx; the name of
+# the matching group is the chain family
+TX_HASH_RE = re.compile(r'(?P<evm>0x[0-9a-fA-F]{64})|(?P<bitcoin>[0-9a-fA-F]{64})')
+ROOT_HASH_RE = re.compile(r'0x[0-9a-fA-F]{64}')
+
+# Proof IDs kept per (anchor_tx, merkle_root) pair
+SAMPLE_IDS = 5
+
+
+def is_pending(anchor_tx: str) -> bool:
+    return anchor_tx.lower() in PENDING_ANCHORS
+
+
+def anchor_chain(anchor_tx: str):
+    """'pending', the chain family of a well-formed tx hash ('evm', 'bitcoin'), or None."""
+    if is_pending(anchor_tx):
+        return 'pending'
+    match = TX_HASH_RE.fullmatch(anchor_tx)
+    return match.lastgroup if match else None
+
+
+class AnchorAggregator:
+    """Proof counts per (anchor_tx, merkle_root) pair, plus sample IDs of
+    the pending and malformed ones (the only IDs the report lists)."""
+
+    def __init__(self, sample_ids: int = SAMPLE_IDS):
+        self.sample_ids = sample_ids
+        self.total = 0
+        self._pairs = {}
+        self._samples = {}
+        self._chains = {}
+
+    def _sample(self, key: tuple, proof_id: str) -> None:
+        """Called for the first sample_ids rows of each pair only."""
+        anchor = key[0]
+        if anchor in self._chains:
+            chain = self._chains[anchor]
+        else:
+            chain = self._chains[anchor] = anchor_chain(anchor)
+        if chain == 'pending' or chain is None:
+            self._samples.setdefault(key, []).append(proof_id)
+
+    def update(self, rows) -> 'AnchorAggregator':
+        """Add (id, merkle_root, anchor_tx, ...) rows; values are compared as strings."""
+        pairs, keep, sample = self._pairs, self.sample_ids, self._sample
+        total = self.total
+        for row in rows:
+            key = (str(row[2]), str(row[1]))
+            n = pairs.get(key, 0)
+            pairs[key] = n + 1
+            if n < keep:
+                sample(key, str(row[0]))
+            total += 1
+        self.total = total
+        return self
+
+    def add(self, row: tuple) -> None:
+        """Add one row; update() is faster for a stream of them."""
+        key = (str(row[2]), str(row[1]))
+        n = self._pairs.get(key, 0)
+        self._pairs[key] = n + 1
+        if n < self.sample_ids:
+            self._sample(key, str(row[0]))
+        self.total += 1
+
+    def chains(self) -> dict:
+        """anchor_tx -> anchor_chain(), for every distinct anchor seen."""
+        chains = self._chains
+        for anchor, _ in self._pairs:
+            if anchor not in chains:
+                chains[anchor] = anchor_chain(anchor)
+        return chains
+
+    @property
+    def pending_proofs(self) -> int:
+        chains = self.chains()
+        return sum(n for (anchor, _), n in self._pairs.items() if chains[anchor] == 'pending')
+
+    @property
+    def distinct_roots(self) -> int:
+        return len({root for _, root in self._pairs})
+
+    @property
+    def distinct_anchors(self) -> int:
+        """Anchor transactions that are not pending (well-formed or not)."""
+        return sum(1 for chain in self.chains().values() if chain != 'pending')
+
+    def report(self) -> dict:
+        chains = self.chains()
+        anchors = {}
+        pending = {}
+        invalid = {}
+        roots = {}
+        for (anchor, root), n in self._pairs.items():
+            roots[root] = roots.get(root, 0) + n
+            chain = chains[anchor]
+            if chain == 'pending':
+                entry = pending.setdefault(root, {'merkle_root': root, 'proofs': 0, 'sample_ids': []})
+                entry['proofs'] += n
+                entry['sample_ids'] = (entry['sample_ids'] + self._samples.get((anchor, root), []))[:self.sample_ids]
+                continue
+            if chain is None:
+                entry = invalid.setdefault(anchor, {'anchor_tx': anchor, 'proofs': 0, 'sample_ids': []})
+                entry['sample_ids'] = (entry['sample_ids'] + self._samples.get((anchor, root), []))[:self.sample_ids]
+            else:
+                entry = anchors.setdefault(anchor, {'anchor_tx': anchor, 'chain': chain, 'proofs': 0,
+                                                    'merkle_roots': {}})
+                entry['merkle_roots'][root] = n
+            entry['proofs'] += n
+
+        by_size = lambda key: lambda e: (-e['proofs'], e[key])
+        pending_proofs = sum(e['proofs'] for e in pending.values())
+        invalid_proofs = sum(e['proofs'] for e in invalid.values())
+        return {
+            'proofs': self.total,
+            'anchored_proofs': self.total - pending_proofs - invalid_proofs,
+            'pending_proofs': pending_proofs,
+            'invalid_anchor_proofs': invalid_proofs,
+            'distinct_anchors': len(anchors) + len(invalid),
+            'distinct_roots': len(roots),
+            'anchors': sorted(anchors.values(), key=by_size('anchor_tx')),
+            'pending_batch': {'proofs': pending_proofs,
+                              'merkle_roots': sorted(pending.values(), key=by_size('merkle_root'))},
+            'invalid_anchors': sorted(invalid.values(), key=by_size('anchor_tx')),
+            'invalid_roots': sorted(({'merkle_root': root, 'proofs': n} for root, n in roots.items()
+                                     if not ROOT_HASH_RE.fullmatch(root)), key=by_size('merkle_root')),
+        }
+
+
+def write_report(report: dict, path: str) -> None:
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(report, f, separators=(',', ':'))
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def format_report(report: dict) -> str:
+    lines = [f"⚓ {report['proofs']} proofs: {report['anchored_proofs']} anchored in "
+             f"{len(report['anchors'])} transactions, {report['pending_proofs']} pending, "
+             f"{report['invalid_anchor_proofs']} with a malformed anchor_tx"]
+    for entry in report['anchors'][:10]:
+        lines.append(f"  {entry['anchor_tx']}  {entry['chain']:<8} {entry['proofs']:>10} proofs, "
+                     f"{len(entry['merkle_roots'])} roots")
+    batch = report['pending_batch']
+    if batch['proofs']:
+        lines.append(f"🕒 {batch['proofs']} pending proofs under {len(batch['merkle_roots'])} roots "
+                     f"can be anchored in one transaction")
+    for entry in report['invalid_anchors'][:10]:
+        lines.append(f"  ⚠️  malformed anchor_tx {entry['anchor_tx']!r}: {entry['proofs']} proofs")
+    for entry in report['invalid_roots'][:10]:
+        lines.append(f"  ⚠️  malformed merkle_root {entry['merkle_root']!r}: {entry['proofs']} proofs")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aggregate proofs by anchor transaction and merkle root.")
+    parser.add_argument('summary_path', metavar='proof_summary.tsv|.psum|.zip')
+    parser.add_argument('report_path', nargs='?', metavar='anchor_report.json',
+                        help="write the JSON report here (default: print it)")
+    parser.add_argument('--sample-ids', type=int, default=SAMPLE_IDS,
+                        help=f"proof IDs listed per pending root or malformed anchor (default: {SAMPLE_IDS})")
+    args = parser.parse_args()
+
+    from counsel_email.summary import iter_proof_summary
+
+    try:
+        proofs = iter_proof_summary(args.summary_path)
+        aggregator = AnchorAggregator(args.sample_ids).update(
+            (p['id'], p['merkle_root'], p['anchor_tx']) for p in proofs)
+    except FileNotFoundError:
+        print(f"❌ Proof summary file not found: {args.summary_path}")
+        sys.exit(1)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error reading proof summary: {e}")
+        sys.exit(1)
+
+    report = aggregator.report()
+    if args.report_path is None:
+        print(json.dumps(report, separators=(',', ':')))
+        return
+    write_report(report, args.report_path)
+    print(format_report(report))
+    print(f"💾 Written to {args.report_path}")
+
+
+if __name__ == '__main__':
+    main()
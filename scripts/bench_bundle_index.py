@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+bench_bundle_index.py
+
+Lookup latency of the bundle index (bundle_index.py) on a large synthetic
+bundle: index build time and size, then single-proof lookups by ID (binary
+search + seek + decompress one member + decode) against the zipfile
+baseline, which has to read the whole central directory before it can find
+any member.
+
+Usage:
+  python3 scripts/bench_bundle_index.py [--proofs N] [--lookups N] [--workers N] [--bundle PATH]
+
+Example:
+  python3 scripts/bench_bundle_index.py --proofs 1000000 --lookups 2000
+
+  # Reuse a bundle built earlier by synthetic_bundle.py
+  python3 scripts/bench_bundle_index.py --bundle /tmp/blazetv_evidence_synthetic.zip
+"""
+
+import os
+import sys
+import time
+import random
+import zipfile
+import argparse
+import tempfile
+import subprocess
+
+from bundle_index import BundleIndex, build_index, lookup
+from synthetic_bundle import FIRST_MATCH_ID, make_bundle
+
+CLI_RUNS = 5
+
+
+def percentile(ordered: list, q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bundle index lookups against zipfile.")
+    parser.add_argument('--proofs', type=int, default=1_000_000, help="proofs in the synthetic bundle (default: 1000000)")
+    parser.add_argument('--lookups', type=int, default=1000, help="random IDs to look up (default: 1000)")
+    parser.add_argument('--workers', type=int, default=1, help="processes used to build the index (default: 1)")
+    parser.add_argument('--bundle', metavar='PATH',
+                        help="benchmark an existing synthetic bundle instead of building one")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='bench_bundle_index_') as tmpdir:
+        zip_path = args.bundle
+        if zip_path is None:
+            zip_path = os.path.join(tmpdir, 'blazetv_evidence_synthetic.zip')
+            print(f"🏗️  Building a {args.proofs}-proof bundle...")
+            start = time.perf_counter()
+            make_bundle(zip_path, args.proofs)
+            print(f"   {os.path.getsize(zip_path) / (1 << 20):.0f} MB in {time.perf_counter() - start:.1f}s")
+
+        index_path = os.path.join(tmpdir, 'bundle.pidx')
+        start = time.perf_counter()
+        indexed, _ = build_index(zip_path, index_path, args.workers)
+        build_s = time.perf_counter() - start
+        print(f"🔎 Indexed {indexed} proofs in {build_s:.1f}s "
+              f"({indexed / build_s:,.0f} proofs/s), index {os.path.getsize(index_path) / (1 << 20):.1f} MB")
+
+        ids = [str(FIRST_MATCH_ID + i) for i in random.Random(0).sample(range(indexed), min(args.lookups, indexed))]
+
+        start = time.perf_counter()
+        with BundleIndex(index_path) as index, open(zip_path, 'rb') as bundle:
+            (hit,), _, _ = lookup(index, bundle, ids[0])
+            cold = time.perf_counter() - start
+            latencies = []
+            for proof_id in ids:
+                start = time.perf_counter()
+                id_hits, _, _ = lookup(index, bundle, proof_id)
+                latencies.append(time.perf_counter() - start)
+                assert len(id_hits) == 1 and id_hits[0][2]['match_id'] == proof_id, proof_id
+        latencies.sort()
+
+        start = time.perf_counter()
+        with zipfile.ZipFile(zip_path) as zf:
+            opened = time.perf_counter() - start
+            zf.read(hit[0])
+        zipfile_s = time.perf_counter() - start
+
+        cli = []
+        script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bundle_index.py')
+        for proof_id in ids[:CLI_RUNS]:
+            start = time.perf_counter()
+            subprocess.run([sys.executable, script, 'lookup', '--raw', '--index', index_path, zip_path, proof_id],
+                           check=True, stdout=subprocess.DEVNULL)
+            cli.append(time.perf_counter() - start)
+
+    print(f"\n{'lookup by ID':<36} {'ms':>9}")
+    print(f"{'index open + first lookup':<36} {cold * 1e3:>9.3f}")
+    print(f"{'warm p50':<36} {percentile(latencies, 0.5) * 1e3:>9.3f}")
+    print(f"{'warm p95':<36} {percentile(latencies, 0.95) * 1e3:>9.3f}")
+    print(f"{'warm max':<36} {latencies[-1] * 1e3:>9.3f}")
+    print(f"{'bundle_index.py lookup (CLI, best)':<36} {min(cli) * 1e3:>9.3f}")
+    print(f"{'zipfile open':<36} {opened * 1e3:>9.3f}")
+    print(f"{'zipfile open + read one member':<36} {zipfile_s * 1e3:>9.3f}")
+    print(f"\n🚀 Cold lookup is {zipfile_s / cold:,.0f}x faster than opening the bundle with zipfile")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+bench_bundle_writer.py
+
+Build time and size of evidence bundles written by bundle_writer.py against
+the current approach (`zip -r`, as local_validation.sh and the workflows
+run it) and a plain zipfile loop, on a synthetic evidence tree: N proof
+files plus the repo's migrations and COUNSEL docs.
+
+Each approach builds the same tree twice under two bundle prefixes (two
+consecutive days' bundles), and the table shows:
+  first s / next s   build time of the first bundle and of the next one
+                     (bundle_writer's chunk cache is warm for the second)
+  MB                 bundle size
+  same bytes         whether building the first bundle again gives
+                     byte-identical output
+  extract next s     extract_roots.py --cache on the second bundle after
+                     the first was extracted (manifest digests make its
+                     proofs cache hits despite the new prefix)
+
+Usage:
+  python3 scripts/bench_bundle_writer.py [--proofs N] [--proof-size BYTES]
+
+Example:
+  python3 scripts/bench_bundle_writer.py --proofs 50000
+"""
+
+import os
+import sys
+import glob
+import time
+import shutil
+import hashlib
+import zipfile
+import argparse
+import tempfile
+import subprocess
+
+from bundle_writer import build_bundle
+from synthetic_bundle import make_bundle
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(SCRIPTS_DIR)
+# Files every bundle carries unchanged
+SHARED_FILES = ('migrations/*.sql', 'COUNSEL_*', 'LAUNCH_CHECKLIST.md', 'PRODUCTION_DEPLOYMENT_RUNBOOK.md')
+
+
+def make_tree(root: str, proofs: int, proof_size: int) -> None:
+    """Unpack a synthetic bundle into root and add the shared repo files."""
+    zip_path = root + '.zip'
+    make_bundle(zip_path, proofs, proof_size, prefix='')
+    with zipfile.ZipFile(zip_path) as zf:
+        zf.extractall(root)
+    os.remove(zip_path)
+    for pattern in SHARED_FILES:
+        for path in glob.glob(os.path.join(REPO_ROOT, pattern)):
+            dest = os.path.join(root, os.path.relpath(path, REPO_ROOT))
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            shutil.copyfile(path, dest)
+
+
+def with_prefix(tree: str, prefix: str) -> str:
+    """Expose `tree` as a directory named `prefix` (what `zip -r` stores) and return its path."""
+    link = os.path.join(os.path.dirname(tree), prefix)
+    if not os.path.exists(link):
+        os.symlink(os.path.basename(tree), link)
+    return link
+
+
+def zip_cli(tree: str, zip_path: str, prefix: str, cache: str) -> None:
+    subprocess.run(['zip', '-q', '-r', os.path.abspath(zip_path), prefix],
+                   cwd=os.path.dirname(with_prefix(tree, prefix)), check=True)
+
+
+def zipfile_walk(tree: str, zip_path: str, prefix: str, cache: str) -> None:
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for root, _, files in os.walk(tree):
+            for name in files:
+                path = os.path.join(root, name)
+                zf.write(path, prefix + '/' + os.path.relpath(path, tree))
+
+
+def writer(tree: str, zip_path: str, prefix: str, cache: str) -> None:
+    build_bundle(tree, zip_path, prefix=prefix, mtime=0, cache_path=cache)
+
+
+def sha256(path: str) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def extract(zip_path: str, cache: str) -> None:
+    subprocess.run([sys.executable, os.path.join(SCRIPTS_DIR, 'extract_roots.py'), '--cache', cache,
+                    zip_path, zip_path + '.tsv'], check=True, stdout=subprocess.DEVNULL)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bundle_writer.py against zip -r and zipfile.")
+    parser.add_argument('--proofs', type=int, default=20_000, help="proof files in the tree (default: 20000)")
+    parser.add_argument('--proof-size', type=int, default=1024, help="bytes per proof file (default: 1024)")
+    args = parser.parse_args()
+
+    approaches = [('zipfile walk', zipfile_walk), ('bundle_writer.py', writer)]
+    if shutil.which('zip'):
+        approaches.insert(0, ('zip -r', zip_cli))
+    else:
+        print("⚠️  zip not installed; skipping the zip -r baseline")
+
+    with tempfile.TemporaryDirectory(prefix='bench_bundle_writer_') as tmpdir:
+        tree = os.path.join(tmpdir, 'tree')
+        print(f"🏗️  Building a tree of {args.proofs} proofs...")
+        make_tree(tree, args.proofs, args.proof_size)
+        size_in = sum(os.path.getsize(os.path.join(root, f)) for root, _, files in os.walk(tree) for f in files)
+        print(f"   {size_in / (1 << 20):.1f} MB of files\n")
+
+        print(f"{'approach':<20} {'first s':>8} {'next s':>8} {'MB':>8} {'same bytes':>11} {'extract next s':>15}")
+        for label, build in approaches:
+            work = os.path.join(tmpdir, label.split()[0].replace('.', '_'))
+            os.makedirs(work)
+            cache = os.path.join(work, 'chunks.sqlite')
+            first = os.path.join(work, 'blazetv_evidence_20260201.zip')
+            again = os.path.join(work, 'again', 'blazetv_evidence_20260201.zip')
+            following = os.path.join(work, 'blazetv_evidence_20260202.zip')
+
+            first_s = timed(build, tree, first, 'blazetv_evidence_20260201', cache)
+            next_s = timed(build, tree, following, 'blazetv_evidence_20260202', cache)
+            os.makedirs(os.path.dirname(again))
+            build(tree, again, 'blazetv_evidence_20260201', cache)
+
+            proof_cache = os.path.join(work, 'proof_cache.sqlite')
+            extract(first, proof_cache)
+            extract_s = timed(extract, following, proof_cache)
+            print(f"{label:<20} {first_s:>8.2f} {next_s:>8.2f} {os.path.getsize(first) / (1 << 20):>8.2f} "
+                  f"{'yes' if sha256(first) == sha256(again) else 'no':>11} {extract_s:>15.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+bench_counsel_email.py
+
+Emails per second for multi-recipient counsel email runs: the compiled,
+run-bound template (render_recipient_emails) against re-formatting the whole
+template with fresh dates and proofs section for every recipient, as the
+per-email f-string did. Also times rendering plus writing every email.
+
+Usage:
+  python3 scripts/bench_counsel_email.py [--recipients N] [--proofs N]
+
+Example:
+  python3 scripts/bench_counsel_email.py --recipients 2000
+"""
+
+import os
+import time
+import hashlib
+import tempfile
+import argparse
+
+from counsel_email.summary import PREVIEW_ROWS
+from counsel_email.template import (COUNSEL_EMAIL_TEMPLATE, recipient_fields, render_recipient_emails,
+                                    run_context, write_emails)
+
+
+def synthetic_recipients(count: int) -> list:
+    return [{'name': f"Recipient {i}", 'role': 'psp' if i % 3 == 0 else 'counsel',
+             'email': f"r{i}@example.com"} for i in range(count)]
+
+
+def synthetic_preview() -> list:
+    proofs = []
+    for i in range(PREVIEW_ROWS):
+        digest = hashlib.sha256(str(i).encode()).hexdigest()
+        proofs.append({'id': str(40000 + i), 'merkle_root': '0x' + digest, 'anchor_tx': '0x' + digest[::-1]})
+    return proofs
+
+
+def per_email_format(proofs: list, total: int, recipients: list):
+    """Baseline: every email reads the clock, rebuilds the proofs section and formats the whole template."""
+    for recipient in recipients:
+        yield recipient, COUNSEL_EMAIL_TEMPLATE.format(**run_context(proofs, total), **recipient_fields(recipient))
+
+
+def rate(label: str, emails, count: int) -> None:
+    start = time.perf_counter()
+    for _ in emails:
+        pass
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {count / elapsed:>12.0f} emails/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark counsel email rendering.")
+    parser.add_argument('--recipients', type=int, default=1000, help="recipients per run (default: 1000)")
+    parser.add_argument('--proofs', type=int, default=5_000_000, help="total proofs reported (default: 5000000)")
+    args = parser.parse_args()
+
+    recipients = synthetic_recipients(args.recipients)
+    proofs = synthetic_preview()
+
+    print(f"📧 Rendering {args.recipients} emails:")
+    rate("per-email format", per_email_format(proofs, args.proofs, recipients), args.recipients)
+    rate("compiled + run-bound", render_recipient_emails(proofs, args.proofs, recipients), args.recipients)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        start = time.perf_counter()
+        count = write_emails(render_recipient_emails(proofs, args.proofs, recipients), tmpdir)
+        elapsed = time.perf_counter() - start
+        size_mb = sum(e.stat().st_size for e in os.scandir(tmpdir)) / (1 << 20)
+    print(f"  {'compiled + written to disk':<28} {count / elapsed:>12.0f} emails/s ({size_mb:.1f} MB)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+bench_decoder.py
+
+Parse throughput of the proof_decoder backends on a small proof document
+and on a large one carrying an embedded proof_bundle array.
+
+Every backend reads and checks the whole document. The scan backend only
+avoids building the values it does not need, so it can win on the large
+document and loses to json on the small one.
+
+Usage:
+  python3 scripts/bench_decoder.py [--small N] [--large N] [--bundle-len N]
+
+Example:
+  python3 scripts/bench_decoder.py --small 100000 --large 500 --bundle-len 20000
+"""
+
+import io
+import json
+import time
+import hashlib
+import argparse
+
+import proof_decoder
+from extract_roots import ROW_KEYS, row_fields_known, parse_proof
+
+
+def make_proof(bundle_len: int) -> bytes:
+    digest = hashlib.sha256(str(bundle_len).encode()).hexdigest()
+    return json.dumps({
+        'match_id': '49279',
+        'merkle_root': '0x' + digest,
+        'anchor_tx': '0x' + digest[::-1],
+        'proof_bundle': ['0x' + hashlib.sha256(str(i).encode()).hexdigest() for i in range(bundle_len)],
+    }).encode()
+
+
+def bench(name: str, doc: bytes, iterations: int) -> None:
+    if name == 'scan':
+        def decode():
+            return proof_decoder.scan_fields(io.BytesIO(doc), ROW_KEYS, row_fields_known)
+    else:
+        def decode():
+            return proof_decoder.loads(io.BytesIO(doc).read(), name)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        parse_proof(decode())
+    elapsed = time.perf_counter() - start
+    mb = len(doc) * iterations / (1 << 20)
+    print(f"  {name:<8} {iterations / elapsed:>12.0f} docs/s  {mb / elapsed:>10.1f} MB/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark proof JSON decoders.")
+    parser.add_argument('--small', type=int, default=50000, help="iterations over the small document (default: 50000)")
+    parser.add_argument('--large', type=int, default=200, help="iterations over the large document (default: 200)")
+    parser.add_argument('--bundle-len', type=int, default=10000,
+                        help="proof_bundle entries in the large document (default: 10000)")
+    args = parser.parse_args()
+
+    backends = ['json', 'scan'] + (['orjson'] if proof_decoder.orjson is not None else [])
+    if proof_decoder.orjson is None:
+        print("⚠️  orjson not installed; skipping the orjson backend")
+
+    for label, doc, iterations in (('small', make_proof(0), args.small),
+                                   ('large', make_proof(args.bundle_len), args.large)):
+        print(f"\n📄 {label} proof ({len(doc)} bytes):")
+        for name in backends:
+            bench(name, doc, iterations)
+
+
+if __name__ == '__main__':
+    main()
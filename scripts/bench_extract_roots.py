@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+bench_extract_roots.py
+
+Benchmark extract_roots.py against a synthetic evidence bundle.
+
+Usage:
+  python3 scripts/bench_extract_roots.py [--proofs N] [--max-workers N]
+  python3 scripts/bench_extract_roots.py --memory [--proofs N] [--ceiling-mb MB]
+
+Example:
+  python3 scripts/bench_extract_roots.py --proofs 100000 --max-workers 8
+  python3 scripts/bench_extract_roots.py --memory --proofs 1000000
+
+Builds a blazetv_evidence_*/proofs/*.json bundle with synthetic_bundle.py in a
+temp directory and times extract_roots() with 1, 2, 4, ... up to --max-workers
+processes.
+
+With --memory, runs extract_roots.py in a child process instead (1M proofs by
+default) and fails if its peak RSS exceeds --ceiling-mb. The ceiling has to
+cover zipfile's own central directory index, which is about 650 MB for 1M
+members, but leaves no room for accumulating the extracted rows.
+"""
+
+import sys
+import os
+import io
+import time
+import tempfile
+import argparse
+import resource
+import subprocess
+import contextlib
+
+from extract_roots import extract_roots
+from synthetic_bundle import make_bundle
+
+MEMORY_CEILING_MB = 768
+MEMORY_BENCH_PROOFS = 1_000_000
+
+
+def run_timed(cmd: list) -> float:
+    """Run a command with stdout discarded and return elapsed seconds."""
+    start = time.perf_counter()
+    subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def time_extract(zip_path: str, output_tsv: str, workers: int) -> float:
+    """Run extract_roots() quietly and return elapsed seconds."""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        extract_roots(zip_path, output_tsv, workers=workers)
+    return time.perf_counter() - start
+
+
+def peak_rss_of_extract(zip_path: str, output_tsv: str) -> float:
+    """Run extract_roots.py as a child process and return its peak RSS in MB."""
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'extract_roots.py')
+    subprocess.run([sys.executable, script, zip_path, output_tsv],
+                   check=True, stdout=subprocess.DEVNULL)
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+
+
+def bench_memory(proofs: int, ceiling_mb: float) -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        zip_path = os.path.join(tmpdir, 'blazetv_evidence_bench.zip')
+        output_tsv = os.path.join(tmpdir, 'proof_summary.tsv')
+
+        print(f"🏗️  Building synthetic bundle with {proofs} proofs...")
+        make_bundle(zip_path, proofs, with_path=False)
+
+        start = time.perf_counter()
+        peak_mb = peak_rss_of_extract(zip_path, output_tsv)
+        elapsed = time.perf_counter() - start
+
+        print(f"⏱️  {elapsed:.2f}s, peak RSS {peak_mb:.1f} MB (ceiling {ceiling_mb:.0f} MB)")
+        if peak_mb > ceiling_mb:
+            print(f"❌ Peak RSS exceeded ceiling")
+            sys.exit(1)
+        print(f"✅ Peak RSS within ceiling")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark extract_roots.py worker scaling.")
+    parser.add_argument('--proofs', type=int,
+                        help=f"number of synthetic proofs (default: 20000, or {MEMORY_BENCH_PROOFS} with --memory)")
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1,
+                        help="largest worker count to try (default: CPU count)")
+    parser.add_argument('--memory', action='store_true',
+                        help="measure peak RSS of a single extraction instead of worker scaling")
+    parser.add_argument('--ceiling-mb', type=float, default=MEMORY_CEILING_MB,
+                        help=f"peak RSS limit for --memory (default: {MEMORY_CEILING_MB})")
+    args = parser.parse_args()
+
+    if args.memory:
+        bench_memory(args.proofs or MEMORY_BENCH_PROOFS, args.ceiling_mb)
+        return
+    args.proofs = args.proofs or 20000
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        zip_path = os.path.join(tmpdir, 'blazetv_evidence_bench.zip')
+        output_tsv = os.path.join(tmpdir, 'proof_summary.tsv')
+
+        print(f"🏗️  Building synthetic bundle with {args.proofs} proofs...")
+        make_bundle(zip_path, args.proofs)
+
+        worker_counts = []
+        n = 1
+        while n < args.max_workers:
+            worker_counts.append(n)
+            n *= 2
+        worker_counts.append(args.max_workers)
+
+        print(f"\n{'workers':>8}  {'seconds':>8}  {'proofs/s':>10}  {'speedup':>7}")
+        baseline = None
+        for workers in worker_counts:
+            elapsed = time_extract(zip_path, output_tsv, workers)
+            baseline = baseline or elapsed
+            print(f"{workers:>8}  {elapsed:>8.2f}  {args.proofs / elapsed:>10.0f}  {baseline / elapsed:>6.2f}x")
+
+
+if __name__ == '__main__':
+    main()
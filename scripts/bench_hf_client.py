@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+bench_hf_client.py
+
+Exercise counsel_email.hf_client.AsyncHFClient against a local stub of the Hugging Face
+Inference API; no network access or API key is needed.
+
+The stub answers each new prompt with --loading 503 "model is loading"
+responses before generating, and adds --latency-ms to every request. The
+benchmark runs one prompt per recipient sequentially without a cache, then
+concurrently with a cold cache, then again with the warm cache, checks that
+every run returns the same texts, and reports latency, retries and cache
+hit rate. It then runs generate_counsel_email.py --generator hf --recipients
+against the stub end to end, replays the same emails with --generator cached
+(every body from the response cache, no requests), and checks --deadline mode
+against a fast stub (the model body is used) and a stub slower than the
+deadline (the template email is used, and the run ends close to the deadline).
+
+Usage:
+  python3 scripts/bench_hf_client.py [--recipients N] [--concurrency N] [--latency-ms MS] [--loading N]
+                                     [--deadline S] [--slow-ms MS]
+
+Example:
+  python3 scripts/bench_hf_client.py --recipients 50 --concurrency 8 --latency-ms 200
+"""
+
+import sys
+import os
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+import threading
+import subprocess
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from counsel_email.cache import ResponseCache
+from counsel_email.hf_client import AsyncHFClient
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+STUB_MODEL = 'stub/counsel-model'
+
+
+def start_stub_server(latency: float, loading: int) -> ThreadingHTTPServer:
+    """Serve the text-generation API on 127.0.0.1 with an ephemeral port."""
+    seen = {}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _reply(self, status: int, body) -> None:
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_POST(self):
+            payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+            prompt = payload['inputs']
+            with lock:
+                calls = seen[prompt] = seen.get(prompt, 0) + 1
+            time.sleep(latency)
+            if calls <= loading:
+                self._reply(503, {'error': f"Model {STUB_MODEL} is currently loading", 'estimated_time': 0.05})
+                return
+            self._reply(200, [{'generated_text': f"{prompt}\nDear Counsel,\n\nStub reply.\n"}])
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(label: str, api_url: str, prompts: list, concurrency: int, cache: ResponseCache) -> list:
+    if cache is not None:
+        cache.hits = cache.misses = 0
+    client = AsyncHFClient('stub-key', STUB_MODEL, api_url=api_url, concurrency=concurrency,
+                           backoff=0.05, cache=cache)
+    start = time.perf_counter()
+    texts = asyncio.run(client.generate_many(prompts))
+    elapsed = time.perf_counter() - start
+    client.close()
+    print(f"  {label:<30} {elapsed:>7.2f}s  {len(prompts) / elapsed:>8.1f} emails/s  {client.stats_line()}")
+    return texts
+
+
+def run_cli(args: list, api_url: str, tmpdir: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, HF_API_KEY='stub-key', HF_MODEL=STUB_MODEL, HF_API_URL=api_url,
+               HF_CACHE_DIR=os.path.join(tmpdir, 'cli_cache'))
+    return subprocess.run([sys.executable, os.path.join(SCRIPTS_DIR, 'generate_counsel_email.py')] + args,
+                          env=env, check=True, stdout=subprocess.DEVNULL)
+
+
+def check_deadline(label: str, api_url: str, tmpdir: str, summary: str, deadline: float, expected: str) -> None:
+    metrics_path = os.path.join(tmpdir, f"metrics_{expected}.json")
+    start = time.perf_counter()
+    run_cli(['--generator', 'hf', '--no-cache', '--deadline', str(deadline), '--metrics', metrics_path,
+             summary, os.path.join(tmpdir, f"email_{expected}.txt")], api_url, tmpdir)
+    wall = time.perf_counter() - start
+    with open(metrics_path) as f:
+        metrics = json.load(f)
+    if metrics['outcome'] != expected:
+        print(f"❌ {label}: expected outcome {expected}, got {metrics['outcome']}")
+        sys.exit(1)
+    print(f"✅ {label}: outcome {metrics['outcome']}, race {metrics['elapsed_s']:.2f}s, "
+          f"process {wall:.2f}s (deadline {deadline:g}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the async HF client against a local stub server.")
+    parser.add_argument('--recipients', type=int, default=40, help="prompts per run (default: 40)")
+    parser.add_argument('--concurrency', type=int, default=8, help="concurrent requests (default: 8)")
+    parser.add_argument('--latency-ms', type=float, default=100, help="stub latency per request (default: 100)")
+    parser.add_argument('--loading', type=int, default=1, help="503 responses per new prompt (default: 1)")
+    parser.add_argument('--deadline', type=float, default=1.0, help="--deadline for the race checks (default: 1.0)")
+    parser.add_argument('--slow-ms', type=float, default=5000, help="latency of the slow stub (default: 5000)")
+    args = parser.parse_args()
+
+    server = start_stub_server(args.latency_ms / 1000, args.loading)
+    api_url = f"http://127.0.0.1:{server.server_address[1]}"
+    prompts = [f"Write a counsel email addressed to Recipient {i}.\nEMAIL BODY:" for i in range(args.recipients)]
+    print(f"🧪 Stub API at {api_url}: {args.latency_ms:.0f} ms/request, {args.loading} x 503 per new prompt")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        baseline = run("sequential, no cache", api_url, [p + " #seq" for p in prompts], 1, None)
+        cache = ResponseCache(os.path.join(tmpdir, 'cache'))
+        cold = run(f"concurrency {args.concurrency}, cold cache", api_url, prompts, args.concurrency, cache)
+        warm = run(f"concurrency {args.concurrency}, warm cache", api_url, prompts, args.concurrency, cache)
+
+        if cold != warm or [t.replace(" #seq", "") for t in baseline] != [t.replace(" #seq", "") for t in cold]:
+            # The stub reply embeds the prompt, so cached and fresh runs must agree
+            print("❌ Cached responses differ from generated ones")
+            sys.exit(1)
+        print("✅ Sequential, concurrent and cached runs returned identical texts")
+
+        summary = os.path.join(tmpdir, 'proof_summary.tsv')
+        with open(summary, 'w') as f:
+            f.write("id\tmerkle_root\tanchor_tx\n49279\t0x" + "ab" * 32 + "\tpending\n")
+        recipients = os.path.join(tmpdir, 'recipients.tsv')
+        with open(recipients, 'w') as f:
+            f.write("name\trole\nJane Roe\tcounsel\nAcme Pay\tpsp\n")
+        out_dir = os.path.join(tmpdir, 'emails')
+        run_cli(['--generator', 'hf', '--recipients', recipients, summary, out_dir], api_url, tmpdir)
+        print(f"✅ generate_counsel_email.py --recipients wrote {len(os.listdir(out_dir))} emails via the stub")
+
+        replay_metrics = os.path.join(tmpdir, 'metrics_cached.json')
+        run_cli(['--generator', 'cached', '--metrics', replay_metrics, '--recipients', recipients, summary,
+                 os.path.join(tmpdir, 'emails_cached')], api_url, tmpdir)
+        with open(replay_metrics) as f:
+            replay = json.load(f)
+        if replay['outcome'] != 'ai':
+            print(f"❌ --generator cached missed the response cache: {replay}")
+            sys.exit(1)
+        print(f"✅ --generator cached replayed {replay['cache_hits']} model emails without calling the stub")
+
+        fast = start_stub_server(0.01, 0)
+        slow = start_stub_server(args.slow_ms / 1000, 0)
+        check_deadline("fast model", f"http://127.0.0.1:{fast.server_address[1]}", tmpdir, summary,
+                       args.deadline, 'ai')
+        check_deadline("slow model", f"http://127.0.0.1:{slow.server_address[1]}", tmpdir, summary,
+                       args.deadline, 'template_deadline')
+        fast.shutdown()
+        slow.shutdown()
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
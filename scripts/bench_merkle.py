@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+bench_merkle.py
+
+Compare scripts/merkle.py against scripts/generate_proofs.js on the same
+synthetic scores directory, check that both produce identical roots and
+proofs, and time tree construction over a large in-memory leaf set.
+
+Usage:
+  python3 scripts/bench_merkle.py [--files N] [--leaves N]
+
+Example:
+  python3 scripts/bench_merkle.py --files 20000 --leaves 2000000
+"""
+
+import sys
+import os
+import json
+import time
+import shutil
+import hashlib
+import resource
+import tempfile
+import argparse
+
+import merkle
+from bench_extract_roots import run_timed
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def make_scores_dir(scores_dir: str, count: int) -> None:
+    os.makedirs(scores_dir, exist_ok=True)
+    for i in range(count):
+        with open(os.path.join(scores_dir, f"{i:08d}.canonical.json"), 'w') as f:
+            f.write(json.dumps({'artist': f"artist-{i}", 'score': i % 100}, separators=(',', ':')))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark merkle.py against generate_proofs.js.")
+    parser.add_argument('--files', type=int, default=5000, help="canonical score files to generate (default: 5000)")
+    parser.add_argument('--leaves', type=int, default=1_000_000, help="leaves for the in-memory tree benchmark (default: 1000000)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        scores_dir = os.path.join(tmpdir, 'scores')
+        js_out = os.path.join(tmpdir, 'proofs_js.json')
+        py_out = os.path.join(tmpdir, 'proofs_py.json')
+
+        print(f"🏗️  Writing {args.files} canonical score files...")
+        make_scores_dir(scores_dir, args.files)
+
+        print(f"\n{'tool':<22}  {'seconds':>8}  {'leaves/s':>10}")
+        if shutil.which('node'):
+            elapsed = run_timed(['node', os.path.join(SCRIPTS_DIR, 'generate_proofs.js'), scores_dir, js_out])
+            print(f"{'generate_proofs.js':<22}  {elapsed:>8.2f}  {args.files / elapsed:>10.0f}")
+        else:
+            js_out = None
+            print("⚠️  node not found; skipping generate_proofs.js")
+
+        elapsed = run_timed([sys.executable, os.path.join(SCRIPTS_DIR, 'merkle.py'), 'build', scores_dir, py_out])
+        print(f"{'merkle.py build':<22}  {elapsed:>8.2f}  {args.files / elapsed:>10.0f}")
+
+        elapsed = run_timed([sys.executable, os.path.join(SCRIPTS_DIR, 'merkle.py'), 'verify-all', scores_dir, py_out])
+        print(f"{'merkle.py verify-all':<22}  {elapsed:>8.2f}  {args.files / elapsed:>10.0f}")
+
+        if js_out:
+            with open(js_out) as f:
+                js_doc = json.load(f)
+            with open(py_out) as f:
+                py_doc = json.load(f)
+            if (js_doc['merkleRoot'], js_doc['proofs']) != (py_doc['merkleRoot'], py_doc['proofs']):
+                print("❌ merkle.py output differs from generate_proofs.js")
+                sys.exit(1)
+            print("✅ Roots and proofs identical to generate_proofs.js")
+
+    print(f"\n🌲 Building tree over {args.leaves} leaves in memory...")
+    leaves = b''.join(hashlib.sha256(i.to_bytes(8, 'big')).digest() for i in range(args.leaves))
+    start = time.perf_counter()
+    layers = merkle.build_tree(leaves)
+    elapsed = time.perf_counter() - start
+    layer_mb = sum(len(layer) for layer in layers) / (1 << 20)
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"  {elapsed:.2f}s ({args.leaves / elapsed:.0f} leaves/s), layers {layer_mb:.1f} MB, peak RSS {peak_mb:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+bench_proof_store.py
+
+Bulk-load throughput of the local proofs table (proof_store.py): rows per
+second with idx_proofs_match_id / idx_proofs_merkle_root in place during the
+load versus dropped and rebuilt after it, for a first load into an empty
+table and for a reload of the same proofs (every row an upsert).
+
+Usage:
+  python3 scripts/bench_proof_store.py [--rows N] [--depth N] [--roots N]
+
+Example:
+  python3 scripts/bench_proof_store.py --rows 1000000 --depth 20
+"""
+
+import os
+import time
+import hashlib
+import tempfile
+import argparse
+
+from proof_store import ProofStore
+
+
+def synthetic_proofs(count: int, depth: int, roots: int):
+    """(row, path) pairs: `roots` trees, every 4th proof still pending."""
+    for i in range(count):
+        digest = hashlib.sha256(str(i).encode()).hexdigest()
+        root = '0x' + hashlib.sha256(str(i % roots).encode()).hexdigest()
+        anchor = '0x' + digest[::-1] if i % 4 else 'pending'
+        path = ['0x' + digest] * depth
+        yield (str(40000 + i), root, anchor), path
+
+
+def load(path: str, rows: list, defer_indexes: bool) -> float:
+    start = time.perf_counter()
+    with ProofStore(path, defer_indexes=defer_indexes) as store:
+        for row, proof_path in rows:
+            store.add(row, proof_path)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark proofs table bulk loads with indexes built before vs after.")
+    parser.add_argument('--rows', type=int, default=200_000, help="proofs to load (default: 200000)")
+    parser.add_argument('--depth', type=int, default=18, help="sibling path length per proof (default: 18)")
+    parser.add_argument('--roots', type=int, default=64, help="distinct merkle roots (default: 64)")
+    args = parser.parse_args()
+
+    rows = list(synthetic_proofs(args.rows, args.depth, args.roots))
+    print(f"🗄️  {args.rows} proofs, {args.depth}-hash paths, {args.roots} roots\n")
+    print(f"{'indexes':<24} {'first load s':>13} {'rows/s':>10} {'reload s':>10} {'rows/s':>10} {'DB MB':>8}")
+
+    with tempfile.TemporaryDirectory(prefix='bench_proof_store_') as tmpdir:
+        for label, defer in (('before load', False), ('after load (deferred)', True)):
+            path = os.path.join(tmpdir, f"proofs_{int(defer)}.sqlite")
+            first = load(path, rows, defer)
+            reload = load(path, rows, defer)
+            size = os.path.getsize(path) / (1 << 20)
+            print(f"{label:<24} {first:>13.2f} {args.rows / first:>10,.0f} "
+                  f"{reload:>10.2f} {args.rows / reload:>10,.0f} {size:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+bench_reconcile.py
+
+Compare reconcile_proofs.py against the jq-per-file MERKLE ROOT COMPARISON
+step that validate_evidence_locally.sh used to run.
+
+Usage:
+  python3 scripts/bench_reconcile.py [--proofs N]
+
+Example:
+  python3 scripts/bench_reconcile.py --proofs 10000
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import argparse
+
+from bench_extract_roots import run_timed
+from synthetic_bundle import make_bundle
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# The comparison as validate_evidence_locally.sh did it: unpack, then one jq
+# process per proof file plus grep | sort -u over the DB dump.
+SHELL_COMPARISON = r'''
+set -euo pipefail
+TMP=$(mktemp -d)
+trap "rm -rf $TMP" EXIT
+unzip -q "$1" -d "$TMP"
+BUNDLE_DIR=$(find "$TMP" -mindepth 1 -maxdepth 1 -type d | head -n1)
+PROOF_ROOTS=$(find "$BUNDLE_DIR/proofs" -name "*.json" -exec jq -r '.merkle_root // empty' {} \; 2>/dev/null | sort -u | wc -l)
+DB_ROOTS=$(grep -oE '0x[0-9a-fA-F]{32,}' "$BUNDLE_DIR/db/proofs_table.txt" 2>/dev/null | sort -u | wc -l)
+echo "$PROOF_ROOTS $DB_ROOTS"
+'''
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark reconcile_proofs.py against the jq shell path.")
+    parser.add_argument('--proofs', type=int, default=2000, help="number of synthetic proofs (default: 2000)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        zip_path = os.path.join(tmpdir, 'blazetv_evidence_bench.zip')
+        print(f"🏗️  Building synthetic bundle with {args.proofs} proofs and a DB dump...")
+        make_bundle(zip_path, args.proofs, with_db_table=True, with_path=False)
+
+        print(f"\n{'path':<22}  {'seconds':>8}  {'proofs/s':>10}")
+        if shutil.which('jq') and shutil.which('unzip'):
+            elapsed = run_timed(['bash', '-c', SHELL_COMPARISON, '_', zip_path])
+            print(f"{'shell (find/jq)':<22}  {elapsed:>8.2f}  {args.proofs / elapsed:>10.0f}")
+        else:
+            print("⚠️  jq or unzip not found; skipping shell comparison")
+
+        elapsed = run_timed([sys.executable, os.path.join(SCRIPTS_DIR, 'reconcile_proofs.py'), zip_path])
+        print(f"{'reconcile_proofs.py':<22}  {elapsed:>8.2f}  {args.proofs / elapsed:>10.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+bench_startup.py
+
+Process startup cost of generate_counsel_email.py per generator: wall time
+of complete CLI runs on a one-proof summary (median and best of --runs),
+and from one `python -X importtime` run the number of modules imported and
+whether requests was among them. The hf mode talks to a local stub of the
+inference API (bench_hf_client.py), so no network or API key is needed.
+
+Bare interpreter startup and `import requests` alone are timed as reference
+points: the latter is what the template path saves by never importing the
+HTTP client.
+
+Usage:
+  python3 scripts/bench_startup.py [--runs N]
+
+Example:
+  python3 scripts/bench_startup.py --runs 20
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import subprocess
+import statistics
+
+from bench_hf_client import STUB_MODEL, start_stub_server
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+CLI = os.path.join(SCRIPTS_DIR, 'generate_counsel_email.py')
+
+
+def wall_times(command: list, env: dict, runs: int) -> list:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, env=env, check=True, stdout=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def imported_modules(command: list, env: dict) -> set:
+    """Module names from one `-X importtime` run of `command` (a python invocation)."""
+    result = subprocess.run([command[0], '-X', 'importtime'] + command[1:], env=env, check=True,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    names = set()
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:'):
+            names.add(line.rsplit('|', 1)[-1].strip())
+    names.discard('imported package')  # the header line
+    return names
+
+
+def report(label: str, times: list, modules: set = None) -> None:
+    line = f"  {label:<22} median {statistics.median(times) * 1e3:>7.1f} ms  best {min(times) * 1e3:>7.1f} ms"
+    if modules is not None:
+        line += f"  {len(modules):>4} modules, requests {'imported' if 'requests' in modules else 'not imported'}"
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark counsel email CLI startup per generator.")
+    parser.add_argument('--runs', type=int, default=10, help="process launches per mode (default: 10)")
+    args = parser.parse_args()
+
+    server = start_stub_server(0.0, 0)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        summary = os.path.join(tmpdir, 'proof_summary.tsv')
+        with open(summary, 'w') as f:
+            f.write("id\tmerkle_root\tanchor_tx\n49279\t0x" + "ab" * 32 + "\tpending\n")
+        out = os.path.join(tmpdir, 'email.txt')
+        env = dict(os.environ, HF_API_KEY='stub-key', HF_MODEL=STUB_MODEL,
+                   HF_API_URL=f"http://127.0.0.1:{server.server_address[1]}")
+
+        modes = [
+            ("python -c pass", [sys.executable, '-c', 'pass'], False),
+            ("import requests", [sys.executable, '-c', 'import requests'], False),
+            ("--generator template", [sys.executable, CLI, '--generator', 'template', summary, out], True),
+            ("--generator hf", [sys.executable, CLI, '--generator', 'hf', '--no-cache', '--deadline', '5',
+                                summary, out], True),
+        ]
+        print(f"⏱️  {args.runs} launches per mode:")
+        results = {}
+        for label, command, is_cli in modes:
+            times = wall_times(command, env, args.runs)
+            results[label] = statistics.median(times)
+            report(label, times, imported_modules(command, env) if is_cli else None)
+
+    server.shutdown()
+    saved = results["--generator hf"] - results["--generator template"]
+    print(f"\n📉 template startup is {saved * 1e3:.0f} ms faster than hf "
+          f"(requests import alone: {(results['import requests'] - results['python -c pass']) * 1e3:.0f} ms)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+bench_suite.py
+
+End-to-end benchmark of the evidence pipeline on a synthetic bundle
+(synthetic_bundle.py), with results kept for comparison across commits.
+
+Stages, each run as its own child process so its wall time and peak RSS
+(from wait4) are its own:
+  extract    extract_roots.py bundle.zip -> proof_summary.tsv (+ --binary .psum)
+  verify     extract_roots.py --verify (every valid proof must verify)
+  read_tsv   stream proof_summary.tsv through counsel_email.summary
+  read_psum  the same for proof_summary.psum
+  email      generate_counsel_email.py proof_summary.tsv (template generator)
+
+Row counts are checked against the bundle (malformed proofs must be skipped,
+everything else extracted and verified). One JSON line per run is appended
+to --results with the git commit, parameters, bundle stats and per-stage
+seconds, proofs/s, MB/s and peak RSS; the run is compared with the latest
+earlier record for the same parameters.
+
+Usage:
+  python3 scripts/bench_suite.py [--proofs N] [--proof-size BYTES] [--prefix PATH] [--compresslevel 0-9]
+                                 [--malformed-ratio R] [--workers N] [--repeat N] [--results PATH]
+
+Example:
+  python3 scripts/bench_suite.py --proofs 200000 --malformed-ratio 0.01 --repeat 3
+"""
+
+import sys
+import os
+import json
+import time
+import argparse
+import platform
+import tempfile
+import subprocess
+from datetime import datetime, timezone
+
+from synthetic_bundle import DEFAULT_COMPRESSLEVEL, DEFAULT_PREFIX, DEFAULT_PROOF_SIZE, make_bundle
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_RESULTS = '.cache/bench_results.jsonl'
+
+# Prints the number of proofs read from argv[2]; argv[1] is the scripts dir
+READ_SUMMARY = ("import sys; sys.path.insert(0, sys.argv[1]); "
+                "from counsel_email.summary import digest_proof_summary; "
+                "print(digest_proof_summary(sys.argv[2]).total)")
+
+
+def run_stage(cmd: list) -> tuple:
+    """Run `cmd` and return (seconds, peak RSS in MB, output); exits if it fails."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    output = proc.stdout.read()
+    _, status, rusage = os.wait4(proc.pid, 0)
+    elapsed = time.perf_counter() - start
+    proc.stdout.close()
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if proc.returncode != 0:
+        print(f"❌ {' '.join(cmd)} exited with {proc.returncode}:\n{output[-2000:]}")
+        sys.exit(1)
+    # ru_maxrss is reported in kilobytes on Linux
+    return elapsed, rusage.ru_maxrss / 1024, output
+
+
+def count_lines(path: str, needle: str = None) -> int:
+    """Data rows of a TSV (header excluded), optionally only those containing `needle`."""
+    with open(path) as f:
+        next(f, None)
+        return sum(1 for line in f if needle is None or needle in line)
+
+
+def git_commit() -> str:
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=SCRIPTS_DIR,
+                                capture_output=True, text=True, check=True)
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=SCRIPTS_DIR,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() + ('-dirty' if dirty else '')
+
+
+def stage_commands(tmpdir: str, zip_path: str, workers: int) -> dict:
+    script = lambda name: os.path.join(SCRIPTS_DIR, name)
+    tsv = os.path.join(tmpdir, 'proof_summary.tsv')
+    psum = os.path.join(tmpdir, 'proof_summary.psum')
+    return {
+        'extract': [sys.executable, script('extract_roots.py'), '--workers', str(workers),
+                    '--binary', psum, zip_path, tsv],
+        'verify': [sys.executable, script('extract_roots.py'), '--workers', str(workers), '--verify',
+                   zip_path, os.path.join(tmpdir, 'verified_summary.tsv')],
+        'read_tsv': [sys.executable, '-c', READ_SUMMARY, SCRIPTS_DIR, tsv],
+        'read_psum': [sys.executable, '-c', READ_SUMMARY, SCRIPTS_DIR, psum],
+        'email': [sys.executable, script('generate_counsel_email.py'), tsv,
+                  os.path.join(tmpdir, 'counsel_email.txt')],
+    }
+
+
+def check_stage(name: str, output: str, tmpdir: str, bundle: dict) -> None:
+    """Fail the run if a stage saw a different number of proofs than the bundle holds."""
+    expected = bundle['valid']
+    if name == 'extract':
+        got = count_lines(os.path.join(tmpdir, 'proof_summary.tsv'))
+    elif name == 'verify':
+        got = count_lines(os.path.join(tmpdir, 'verified_summary.tsv'), '\tverified')
+    elif name in ('read_tsv', 'read_psum'):
+        got = int(output.split()[-1])
+    else:
+        return
+    if got != expected:
+        print(f"❌ {name}: {got} proofs, expected {expected}")
+        sys.exit(1)
+
+
+def previous_record(path: str, params: dict):
+    """The latest record in the results file with the same parameters, or None."""
+    found = None
+    try:
+        with open(path) as f:
+            for line in f:
+                record = json.loads(line)
+                if record.get('params') == params:
+                    found = record
+    except (OSError, ValueError):
+        return None
+    return found
+
+
+def append_record(path: str, record: dict) -> None:
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'a') as f:
+        f.write(json.dumps(record, sort_keys=True) + "\n")
+
+
+def change(new: float, old: float) -> str:
+    return f"{(new - old) / old:+.0%}" if old else "n/a"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the evidence pipeline end to end on a synthetic bundle.")
+    parser.add_argument('--proofs', type=int, default=50000, help="proof files in the bundle (default: 50000)")
+    parser.add_argument('--proof-size', type=int, default=DEFAULT_PROOF_SIZE,
+                        help=f"approximate bytes per proof file (default: {DEFAULT_PROOF_SIZE})")
+    parser.add_argument('--prefix', default=DEFAULT_PREFIX, help=f"bundle nesting prefix (default: {DEFAULT_PREFIX})")
+    parser.add_argument('--compresslevel', type=int, default=DEFAULT_COMPRESSLEVEL, choices=range(10),
+                        metavar='0-9', help=f"deflate level, 0 = stored (default: {DEFAULT_COMPRESSLEVEL})")
+    parser.add_argument('--malformed-ratio', type=float, default=0.0,
+                        help="fraction of truncated proof files (default: 0)")
+    parser.add_argument('--workers', type=int, default=1, help="extract_roots.py --workers (default: 1)")
+    parser.add_argument('--repeat', type=int, default=1,
+                        help="runs per stage; the fastest time and the highest RSS are kept (default: 1)")
+    parser.add_argument('--results', default=DEFAULT_RESULTS,
+                        help=f"JSON lines file the run is appended to (default: {DEFAULT_RESULTS})")
+    args = parser.parse_args()
+
+    if args.proofs < 1 or args.repeat < 1 or not 0 <= args.malformed_ratio < 1:
+        parser.error("--proofs and --repeat must be >= 1 and --malformed-ratio in [0, 1)")
+
+    params = {'proofs': args.proofs, 'proof_size': args.proof_size, 'prefix': args.prefix,
+              'compresslevel': args.compresslevel, 'malformed_ratio': args.malformed_ratio,
+              'workers': args.workers}
+
+    with tempfile.TemporaryDirectory(prefix='bench_suite_') as tmpdir:
+        zip_path = os.path.join(tmpdir, 'blazetv_evidence_bench.zip')
+        print(f"🏗️  Building synthetic bundle: {args.proofs} proofs of ~{args.proof_size} bytes, "
+              f"level {args.compresslevel}, {args.malformed_ratio:.1%} malformed...")
+        start = time.perf_counter()
+        bundle = make_bundle(zip_path, args.proofs, args.proof_size, args.prefix, args.compresslevel,
+                             args.malformed_ratio)
+        print(f"   {bundle['member_bytes'] / (1 << 20):.1f} MB of proofs, "
+              f"{bundle['zip_bytes'] / (1 << 20):.1f} MB zipped in {time.perf_counter() - start:.1f}s")
+        member_mb = bundle['member_bytes'] / (1 << 20)
+
+        stages = {}
+        print(f"\n{'stage':<10} {'seconds':>8} {'proofs/s':>10} {'MB/s':>8} {'peak RSS MB':>12}")
+        for name, cmd in stage_commands(tmpdir, zip_path, args.workers).items():
+            runs = []
+            for _ in range(args.repeat):
+                seconds, rss, output = run_stage(cmd)
+                check_stage(name, output, tmpdir, bundle)
+                runs.append((seconds, rss))
+            seconds = min(s for s, _ in runs)
+            stages[name] = {
+                'seconds': round(seconds, 4),
+                'proofs_per_s': round(bundle['valid'] / seconds, 1),
+                'mb_per_s': round(member_mb / seconds, 2) if name in ('extract', 'verify') else None,
+                'peak_rss_mb': round(max(r for _, r in runs), 1),
+            }
+            s = stages[name]
+            mb_s = f"{s['mb_per_s']:>8.1f}" if s['mb_per_s'] is not None else f"{'':>8}"
+            print(f"{name:<10} {s['seconds']:>8.3f} {s['proofs_per_s']:>10.0f} {mb_s} {s['peak_rss_mb']:>12.1f}")
+
+    bundle.pop('merkle_root')
+    record = {
+        'timestamp': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'params': params,
+        'bundle': bundle,
+        'stages': stages,
+    }
+    previous = previous_record(args.results, params)
+    append_record(args.results, record)
+    print(f"\n💾 Results appended to {args.results} (commit {record['commit'] or 'unknown'})")
+
+    if previous:
+        print(f"📊 Against {previous['commit'] or 'unknown'} ({previous['timestamp']}):")
+        for name, s in stages.items():
+            old = previous['stages'].get(name)
+            if old:
+                print(f"  {name:<10} time {change(s['seconds'], old['seconds']):>6}  "
+                      f"peak RSS {change(s['peak_rss_mb'], old['peak_rss_mb']):>6}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+bench_summary.py
+
+Compare proof_summary.tsv with the binary proof_summary.psum format: file
+size, time to open and read the first rows, time to iterate every row as a
+tuple, and time to load every row through the counsel email's own readers
+(counsel_email.summary: read_proof_summary() builds a dict per row,
+digest_proof_summary() streams the rows into a ProofDigest). Both readers
+take either format, so the last two columns compare like with like.
+
+Usage:
+  python3 scripts/bench_summary.py [--rows N]
+
+Example:
+  python3 scripts/bench_summary.py --rows 2000000
+"""
+
+import io
+import os
+import time
+import hashlib
+import tempfile
+import argparse
+import contextlib
+
+from extract_roots import write_tsv
+from proof_summary import ProofSummary, write_summary
+from counsel_email.summary import digest_proof_summary, read_proof_summary
+
+HEAD_ROWS = 10
+
+
+def synthetic_rows(count: int):
+    for i in range(count):
+        digest = hashlib.sha256(str(i).encode()).hexdigest()
+        yield str(40000 + i), '0x' + digest, '0x' + digest[::-1] if i % 4 else 'pending'
+
+
+def timed(fn) -> tuple:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def tsv_head(path: str) -> list:
+    with open(path) as f:
+        f.readline()
+        return [tuple(next(f).rstrip('\n').split('\t')) for _ in range(HEAD_ROWS)]
+
+
+def psum_head(path: str) -> list:
+    with ProofSummary(path) as summary:
+        return [summary[i] for i in range(HEAD_ROWS)]
+
+
+def tsv_all(path: str) -> int:
+    with open(path) as f:
+        f.readline()
+        return sum(1 for line in f if len(line.rstrip('\n').split('\t')) >= 3)
+
+
+def psum_all(path: str) -> int:
+    with ProofSummary(path) as summary:
+        return sum(1 for _ in summary)
+
+
+def load_all(path: str) -> int:
+    with contextlib.redirect_stdout(io.StringIO()):
+        return len(read_proof_summary(path))
+
+
+def digest_all(path: str) -> int:
+    with contextlib.redirect_stdout(io.StringIO()):
+        return digest_proof_summary(path).total
+
+
+def compare(label: str, tsv_s: float, psum_s: float) -> str:
+    if psum_s <= tsv_s:
+        return f"{label}: psum {tsv_s / psum_s:.1f}x faster than TSV"
+    return f"{label}: psum {psum_s / tsv_s:.1f}x slower than TSV"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark TSV vs binary proof summaries.")
+    parser.add_argument('--rows', type=int, default=1_000_000, help="rows in the synthetic summary (default: 1000000)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tsv_path = os.path.join(tmpdir, 'proof_summary.tsv')
+        psum_path = os.path.join(tmpdir, 'proof_summary.psum')
+
+        print(f"🏗️  Writing {args.rows} rows...")
+        tsv_write, _ = timed(lambda: write_tsv(synthetic_rows(args.rows), tsv_path))
+        psum_write, _ = timed(lambda: write_summary(synthetic_rows(args.rows), psum_path))
+
+        tsv_size = os.path.getsize(tsv_path)
+        psum_size = os.path.getsize(psum_path)
+
+        head_tsv, rows_tsv = timed(lambda: tsv_head(tsv_path))
+        head_psum, rows_psum = timed(lambda: psum_head(psum_path))
+        assert rows_tsv == rows_psum, "first rows differ between formats"
+
+        all_tsv, n_tsv = timed(lambda: tsv_all(tsv_path))
+        all_psum, n_psum = timed(lambda: psum_all(psum_path))
+        assert n_tsv == n_psum == args.rows
+        load_tsv, n_tsv = timed(lambda: load_all(tsv_path))
+        load_psum, n_psum = timed(lambda: load_all(psum_path))
+        assert n_tsv == n_psum == args.rows
+        digest_tsv, n_tsv = timed(lambda: digest_all(tsv_path))
+        digest_psum, n_psum = timed(lambda: digest_all(psum_path))
+        assert n_tsv == n_psum == args.rows
+
+        print(f"\n{'format':<8}  {'size MB':>9}  {'write s':>8}  {'open+{} rows ms'.format(HEAD_ROWS):>16}  "
+              f"{'tuples s':>9}  {'read_proof_summary s':>20}  {'digest s':>9}")
+        for name, size, write, head, tuples, load, digest in (
+                ('tsv', tsv_size, tsv_write, head_tsv, all_tsv, load_tsv, digest_tsv),
+                ('psum', psum_size, psum_write, head_psum, all_psum, load_psum, digest_psum)):
+            print(f"{name:<8}  {size / (1 << 20):>9.1f}  {write:>8.2f}  {head * 1e3:>16.3f}  "
+                  f"{tuples:>9.2f}  {load:>20.2f}  {digest:>9.2f}")
+        print(f"\n📉 Binary is {psum_size / tsv_size:.0%} of the TSV size")
+        print(f"   {compare('raw tuples', all_tsv, all_psum)}")
+        print(f"   {compare('read_proof_summary()', load_tsv, load_psum)}")
+        print(f"   {compare('digest_proof_summary()', digest_tsv, digest_psum)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+bench_validate.py
+
+Compare the single-invocation extract_roots.py validator against the
+find/jq pipeline auto-validate-and-upload.yml used to build
+proof_summary.tsv (one bash + jq process per proof file).
+
+Usage:
+  python3 scripts/bench_validate.py [--sizes 1000,10000,100000] [--shell-limit N]
+
+Example:
+  python3 scripts/bench_validate.py --sizes 1000,10000 --shell-limit 10000
+
+The shell pipeline is skipped for bundles larger than --shell-limit, since
+at ~100k proofs it takes close to an hour.
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import argparse
+
+from bench_extract_roots import run_timed
+from synthetic_bundle import make_bundle
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# The workflow's former validate step, minus the console tee
+SHELL_PIPELINE = r'''
+set -euo pipefail
+TMP=$(mktemp -d)
+trap "rm -rf $TMP" EXIT
+unzip -q "$1" -d "$TMP"
+PROOFS=$(find "$TMP" -type d -name proofs | head -n1)
+echo -e "id\tmerkle_root\tanchor_tx" > "$2"
+find "$PROOFS" -name "*.json" -exec bash -c 'jq -r "[(.match_id // .id // .video_id // \"no_id\"), (.merkle_root // \"no_merkle\"), (.anchor_tx // \"no_anchor\")] | @tsv" "$1"' _ {} \; >> "$2"
+'''
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark extract_roots.py validation against find/jq.")
+    parser.add_argument('--sizes', default='1000,10000,100000',
+                        help="comma-separated proof counts (default: 1000,10000,100000)")
+    parser.add_argument('--shell-limit', type=int, default=10000,
+                        help="largest bundle to run the shell pipeline on (default: 10000)")
+    args = parser.parse_args()
+
+    have_shell_tools = bool(shutil.which('jq') and shutil.which('unzip'))
+    if not have_shell_tools:
+        print("⚠️  jq or unzip not found; timing extract_roots.py only")
+
+    print(f"{'proofs':>8}  {'find/jq s':>10}  {'python s':>9}  {'speedup':>8}")
+    for size in (int(n) for n in args.sizes.split(',')):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            zip_path = os.path.join(tmpdir, 'blazetv_evidence_bench.zip')
+            make_bundle(zip_path, size, with_db_table=True)
+
+            python_s = run_timed([
+                sys.executable, os.path.join(SCRIPTS_DIR, 'extract_roots.py'),
+                '--report', os.path.join(tmpdir, 'validation_output.txt'),
+                '--listing', os.path.join(tmpdir, 'bundle_listing.txt'),
+                zip_path, os.path.join(tmpdir, 'proof_summary.tsv')])
+
+            if have_shell_tools and size <= args.shell_limit:
+                shell_s = run_timed(['bash', '-c', SHELL_PIPELINE, '_', zip_path,
+                                     os.path.join(tmpdir, 'proof_summary_jq.tsv')])
+                print(f"{size:>8}  {shell_s:>10.2f}  {python_s:>9.2f}  {shell_s / python_s:>7.0f}x")
+            else:
+                print(f"{size:>8}  {'skipped':>10}  {python_s:>9.2f}  {'-':>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""
+bundle_index.py
+
+Random-access index of an evidence bundle: proof ID and merkle_root to the
+zip member holding the proof, so a single proof can be read out of a
+multi-GB bundle without extracting (or even listing) the rest of it.
+
+The index is built once per bundle, by `build` or by extract_roots.py
+--index during a normal extraction. It is a sorted, memory-mapped sidecar:
+every proof ID and merkle_root is reduced to a 64-bit key (BLAKE2b), and
+both key columns are sorted, so a lookup is two binary searches over the
+mapped file. Each hit records the member's local header offset, sizes,
+CRC-32 and compression method, so `lookup` seeks straight to that member and
+decompresses just it. The bundle's central directory is never read (for a
+million-member bundle, opening it with zipfile alone takes seconds).
+
+Keys are hashes, so every hit is checked against the decoded proof before
+it is reported. The index records the bundle's size and mtime and refuses
+to serve a bundle that has changed since it was built.
+
+Usage:
+  python3 scripts/bundle_index.py build [--workers N] [--decoder NAME] <bundle.zip> [<bundle.zip.pidx>]
+  python3 scripts/bundle_index.py lookup [--index PATH] [--limit N] [--raw] <bundle.zip> <proof_id|merkle_root>
+  python3 scripts/bundle_index.py stats <bundle.zip.pidx>
+
+Example:
+  python3 scripts/bundle_index.py build artifacts/blazetv_evidence_20260116.zip
+  python3 scripts/bundle_index.py lookup artifacts/blazetv_evidence_20260116.zip 49279
+  python3 scripts/bundle_index.py lookup --raw artifacts/blazetv_evidence_20260116.zip 49279 | jq .proof
+
+  # Build the index while extracting the summary
+  python3 scripts/extract_roots.py --index artifacts/blazetv_evidence_20260116.zip.pidx \
+      artifacts/blazetv_evidence_20260116.zip artifacts/proof_summary.tsv
+
+File layout (little-endian; members are the indexed proof files, in bundle order):
+  header          magic, version, flags, members, id entries, root entries,
+                  name blob size, bundle size, bundle mtime (ns)
+  name offsets    (members + 1) x uint64 into the name blob
+  header offsets  members x uint64 (local file header of each member)
+  compress sizes  members x uint64
+  file sizes      members x uint64
+  id keys         id entries x uint64, sorted
+  root keys       root entries x uint64, sorted
+  crc32s          members x uint32
+  id members      id entries x uint32, member of each id key
+  root members    root entries x uint32, member of each root key
+  methods         members x uint16 (zip compression method)
+  name blob       UTF-8 member names, back to back
+"""
+
+import sys
+import os
+import json
+import mmap
+import zlib
+import struct
+import hashlib
+import zipfile
+import argparse
+from array import array
+from bisect import bisect_left, bisect_right
+
+import proof_decoder
+from proof_summary import _column
+
+MAGIC = b'PRFIDX\x00\x01'
+VERSION = 1
+HEADER = struct.Struct('<8sIIQQQQQq')
+INDEX_SUFFIX = '.pidx'
+KEY_SIZE = 8
+
+# Zip local file header: signature ... file name length, extra field length
+LOCAL_HEADER = struct.Struct('<4s5H3I2H')
+LOCAL_HEADER_MAGIC = b'PK\x03\x04'
+FLAG_ENCRYPTED = 0x1
+
+DEFAULT_LIMIT = 20
+
+
+def index_key(value: str) -> int:
+    """The 64-bit key a proof ID or merkle_root is indexed under."""
+    return int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=KEY_SIZE).digest(), 'little')
+
+
+def default_index_path(zip_path: str) -> str:
+    return zip_path + INDEX_SUFFIX
+
+
+def _bundle_stamp(zip_path: str) -> tuple:
+    st = os.stat(zip_path)
+    return st.st_size, st.st_mtime_ns
+
+
+class IndexWriter:
+    """Collect (member, row) pairs and write the sorted index on close().
+
+    Memory holds the member columns and one int per key until close(); like
+    SummaryWriter, output goes to a temporary path that replaces `path`
+    only on success.
+    """
+
+    def __init__(self, path: str, zip_path: str):
+        self.path = path
+        self.zip_path = zip_path
+        self._header_offsets = array('Q')
+        self._compress_sizes = array('Q')
+        self._file_sizes = array('Q')
+        self._crcs = array('I')
+        self._methods = array('H')
+        self._name_offsets = array('Q', [0])
+        self._names = bytearray()
+        # key << 32 | member: sorting these sorts by key, then bundle order
+        self._ids = []
+        self._roots = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+
+    @property
+    def members(self) -> int:
+        return len(self._header_offsets)
+
+    def add(self, info: zipfile.ZipInfo, row: tuple) -> None:
+        """Index member `info`, whose parsed row is (id, merkle_root, ...)."""
+        member = len(self._header_offsets)
+        self._header_offsets.append(info.header_offset)
+        self._compress_sizes.append(info.compress_size)
+        self._file_sizes.append(info.file_size)
+        self._crcs.append(info.CRC)
+        self._methods.append(info.compress_type)
+        self._names += info.filename.encode('utf-8')
+        self._name_offsets.append(len(self._names))
+        self._ids.append(index_key(str(row[0])) << 32 | member)
+        self._roots.append(index_key(str(row[1])) << 32 | member)
+
+    @staticmethod
+    def _split(entries: list) -> tuple:
+        """Sorted entries as (keys, members) columns."""
+        entries.sort()
+        return array('Q', [e >> 32 for e in entries]), array('I', [e & 0xFFFFFFFF for e in entries])
+
+    def close(self) -> int:
+        """Write the index and return the number of members indexed."""
+        id_keys, id_members = self._split(self._ids)
+        root_keys, root_members = self._split(self._roots)
+        self._ids = self._roots = None
+        columns = [self._name_offsets, self._header_offsets, self._compress_sizes, self._file_sizes,
+                   id_keys, root_keys, self._crcs, id_members, root_members, self._methods]
+        if sys.byteorder != 'little':
+            for column in columns:
+                column.byteswap()
+
+        size, mtime_ns = _bundle_stamp(self.zip_path)
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as out:
+                out.write(HEADER.pack(MAGIC, VERSION, 0, self.members, len(id_keys), len(root_keys),
+                                      len(self._names), size, mtime_ns))
+                for column in columns:
+                    out.write(column.tobytes())
+                out.write(self._names)
+            os.replace(tmp_path, self.path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return self.members
+
+
+class BundleIndex:
+    """Read-only, memory-mapped view of a bundle index.
+
+    find_id()/find_root() return the candidate members for a value (a
+    zero-copy slice of a sorted column); name() and read() resolve a member.
+    Candidates share a 64-bit key with the value, so callers confirm them
+    against the decoded proof.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (magic, version, _, members, ids, roots, names_size,
+             self.bundle_size, self.bundle_mtime_ns) = HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a version {VERSION} bundle index")
+        except (struct.error, ValueError):
+            self._mm.close()
+            raise
+
+        self.members = members
+        view = self._view = memoryview(self._mm)
+        pos = HEADER.size
+
+        def take(fmt: str, count: int):
+            nonlocal pos
+            size = struct.calcsize(fmt) * count
+            column = _column(view[pos:pos + size], fmt)
+            pos += size
+            return column
+
+        self._name_offsets = take('Q', members + 1)
+        self._header_offsets = take('Q', members)
+        self._compress_sizes = take('Q', members)
+        self._file_sizes = take('Q', members)
+        self._id_keys = take('Q', ids)
+        self._root_keys = take('Q', roots)
+        self._crcs = take('I', members)
+        self._id_members = take('I', ids)
+        self._root_members = take('I', roots)
+        self._methods = take('H', members)
+        self._names_at = pos
+        if pos + names_size > len(self._mm):
+            self.close()
+            raise ValueError(f"{path} is truncated")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self) -> None:
+        if self._mm.closed:
+            return
+        for column in (self._name_offsets, self._header_offsets, self._compress_sizes, self._file_sizes,
+                       self._id_keys, self._root_keys, self._crcs, self._id_members, self._root_members,
+                       self._methods):
+            if isinstance(column, memoryview):
+                column.release()
+        self._view.release()
+        self._mm.close()
+
+    def __len__(self) -> int:
+        return self.members
+
+    def check_bundle(self, zip_path: str) -> None:
+        """Raise ValueError unless `zip_path` is the bundle this index was built from."""
+        if _bundle_stamp(zip_path) != (self.bundle_size, self.bundle_mtime_ns):
+            raise ValueError(f"{self.path} is stale: {zip_path} changed since it was indexed; rebuild it")
+
+    @staticmethod
+    def _find(keys, members, value: str):
+        key = index_key(value)
+        return members[bisect_left(keys, key):bisect_right(keys, key)]
+
+    def find_id(self, proof_id: str):
+        """Candidate members for a proof ID, in bundle order."""
+        return self._find(self._id_keys, self._id_members, proof_id)
+
+    def find_root(self, merkle_root: str):
+        """Candidate members for a merkle_root, in bundle order."""
+        return self._find(self._root_keys, self._root_members, merkle_root)
+
+    def name(self, member: int) -> str:
+        start = self._names_at + self._name_offsets[member]
+        end = self._names_at + self._name_offsets[member + 1]
+        return self._mm[start:end].decode('utf-8')
+
+    def read(self, bundle, member: int) -> bytes:
+        """Decompress one member from the open bundle file `bundle` (binary mode).
+
+        Seeks to the member's local header, reads exactly its compressed
+        bytes and checks the CRC-32 recorded in the index.
+        """
+        offset = self._header_offsets[member]
+        bundle.seek(offset)
+        header = bundle.read(LOCAL_HEADER.size)
+        if len(header) != LOCAL_HEADER.size:
+            raise ValueError(f"{self.name(member)}: local header past the end of the bundle")
+        magic, _, flags, _, _, _, _, _, _, name_size, extra_size = LOCAL_HEADER.unpack(header)
+        if magic != LOCAL_HEADER_MAGIC:
+            raise ValueError(f"{self.name(member)}: no local header at offset {offset}")
+        if flags & FLAG_ENCRYPTED:
+            raise ValueError(f"{self.name(member)}: encrypted members are not supported")
+
+        bundle.seek(offset + LOCAL_HEADER.size + name_size + extra_size)
+        data = bundle.read(self._compress_sizes[member])
+        method = self._methods[member]
+        if method == zipfile.ZIP_DEFLATED:
+            data = zlib.decompress(data, -zlib.MAX_WBITS, self._file_sizes[member])
+        elif method != zipfile.ZIP_STORED:
+            raise ValueError(f"{self.name(member)}: unsupported compression method {method}")
+        if zlib.crc32(data) != self._crcs[member]:
+            raise ValueError(f"{self.name(member)}: CRC-32 mismatch")
+        return data
+
+
+def build_index(zip_path: str, index_path: str, workers: int = 1, decoder: str = 'auto') -> tuple:
+    """Parse every proof member of `zip_path` and write its index; return (indexed, errors)."""
+    from extract_roots import BundleScan, iter_proof_rows
+
+    decoder = proof_decoder.resolve(decoder)
+    errors = 0
+    with zipfile.ZipFile(zip_path, 'r') as zf:
+        members = BundleScan(zf).members
+        with IndexWriter(index_path, zip_path) as writer:
+            for info, (name, row, error) in zip(members, iter_proof_rows(zip_path, zf, members, workers,
+                                                                          decoder=decoder)):
+                if error is not None:
+                    print(f"⚠️  Could not parse {name}: {error}")
+                    errors += 1
+                    continue
+                writer.add(info, row)
+    return writer.members, errors
+
+
+def lookup(index: BundleIndex, bundle, value: str, limit: int = DEFAULT_LIMIT) -> tuple:
+    """Return (id_hits, root_hits, root_total) for a proof ID or merkle_root.
+
+    Hits are (member name, raw bytes, decoded proof) for members whose proof
+    really has that ID / root; at most `limit` root hits are decoded, while
+    root_total counts every member indexed under the root's key.
+    """
+    from extract_roots import parse_proof
+
+    def hits(members, column: int, limit: int):
+        found = []
+        for member in members:
+            if len(found) >= limit:
+                break
+            data = index.read(bundle, member)
+            proof = proof_decoder.loads(data)
+            if str(parse_proof(proof)[column]) == value:
+                found.append((index.name(member), data, proof))
+        return found
+
+    roots = index.find_root(value)
+    return hits(index.find_id(value), 0, len(index)), hits(roots, 1, limit), len(roots)
+
+
+def cmd_build(args) -> None:
+    index_path = args.index_path or default_index_path(args.zip_path)
+    print(f"📦 Indexing {args.zip_path}...")
+    indexed, errors = build_index(args.zip_path, index_path, args.workers, args.decoder)
+    print(f"✅ Indexed {indexed} proofs" + (f" ({errors} could not be parsed)" if errors else ""))
+    print(f"💾 Written to {index_path} ({os.path.getsize(index_path)} bytes)")
+
+
+def cmd_lookup(args) -> None:
+    with BundleIndex(args.index or default_index_path(args.zip_path)) as index, \
+            open(args.zip_path, 'rb') as bundle:
+        index.check_bundle(args.zip_path)
+        id_hits, root_hits, root_total = lookup(index, bundle, args.value, args.limit)
+
+    if not id_hits and not root_hits:
+        print(f"❌ No proof with ID or merkle_root {args.value}")
+        sys.exit(1)
+    if args.raw:
+        for _, data, _ in id_hits or root_hits:
+            sys.stdout.write(data.decode('utf-8') + "\n")
+        return
+
+    for name, _, proof in id_hits:
+        print(f"🔎 {name}")
+        print(json.dumps(proof, indent=2))
+    if root_hits:
+        from extract_roots import parse_proof
+
+        print(f"🌳 merkle_root {args.value}: {root_total} proofs")
+        for name, _, proof in root_hits:
+            proof_id, _, anchor_tx = parse_proof(proof)
+            print(f"  {proof_id}\t{anchor_tx}\t{name}")
+        if root_total > len(root_hits):
+            print(f"  ... and {root_total - len(root_hits)} more (raise --limit)")
+
+
+def cmd_stats(args) -> None:
+    with BundleIndex(args.index_path) as index:
+        print(f"members:      {index.members}")
+        print(f"id keys:      {len(index._id_keys)}")
+        print(f"root keys:    {len(index._root_keys)}")
+        print(f"bundle size:  {index.bundle_size} bytes")
+        print(f"file size:    {os.path.getsize(args.index_path)} bytes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Random-access index of proof IDs and merkle roots in an evidence bundle.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help="index every proof in a bundle")
+    build.add_argument('zip_path', metavar='bundle.zip')
+    build.add_argument('index_path', nargs='?', metavar='bundle.zip.pidx',
+                       help=f"index file (default: the bundle path + {INDEX_SUFFIX})")
+    build.add_argument('--workers', type=int, default=1, help="processes parsing proof files (default: 1)")
+    build.add_argument('--decoder', choices=proof_decoder.DECODERS, default='auto',
+                       help="JSON backend for proof files (default: auto)")
+    build.set_defaults(func=cmd_build)
+
+    find = commands.add_parser('lookup', help="print the proof with an ID, or the proofs under a merkle_root")
+    find.add_argument('zip_path', metavar='bundle.zip')
+    find.add_argument('value', metavar='proof_id|merkle_root')
+    find.add_argument('--index', metavar='PATH', help=f"index file (default: the bundle path + {INDEX_SUFFIX})")
+    find.add_argument('--limit', type=int, default=DEFAULT_LIMIT,
+                      help=f"proofs to list for a merkle_root (default: {DEFAULT_LIMIT})")
+    find.add_argument('--raw', action='store_true', help="print the matching proof files as stored, one per line")
+    find.set_defaults(func=cmd_lookup)
+
+    stats = commands.add_parser('stats', help="describe an index file")
+    stats.add_argument('index_path', metavar='bundle.zip.pidx')
+    stats.set_defaults(func=cmd_stats)
+
+    args = parser.parse_args()
+    try:
+        args.func(args)
+    except FileNotFoundError as e:
+        print(f"❌ File not found: {e.filename}")
+        sys.exit(1)
+    except zipfile.BadZipFile:
+        print(f"❌ Invalid ZIP file: {args.zip_path}")
+        sys.exit(1)
+    except (ValueError, zlib.error) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
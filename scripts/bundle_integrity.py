@@ -0,0 +1,486 @@
+#!/usr/bin/env python3
+"""
+bundle_integrity.py
+
+Integrity pre-check of an evidence bundle: every member's CRC-32 and
+declared sizes are checked against its data, and the whole file's SHA-256
+is computed, without extracting anything or writing to disk.
+
+The central directory is parsed straight from the mapped file (zipfile
+builds a ZipInfo per member, which alone takes seconds on a million-member
+bundle). Members are split, in file order, into chunks of about
+CHUNK_BYTES that a process pool checks in parallel; each worker maps the
+bundle and inflates members from zero-copy slices of it. Meanwhile a thread
+in this process streams the file once through SHA-256 with a HASH_BUFFER
+read buffer (hashlib and zlib both release the GIL).
+
+For each member, in order:
+  local_header     a local file header at the central directory's offset
+  encrypted        encrypted members cannot be checked
+  name             local header name equal to the central directory name
+  bounds           compressed data ends before the next member (or the
+                   central directory) starts: no overlapping members
+  method           stored or deflated
+  deflate          the deflate stream decodes and ends exactly at the
+                   declared compressed size
+  size             decoded length equal to the declared file size
+  crc32            CRC-32 of the decoded data equal to the declared one
+
+The check fails fast: the first bad member stops every worker and the hash,
+and is the one reported (with one worker, the first in file order).
+
+Usage:
+  python3 scripts/bundle_integrity.py [--workers N] [--buffer-mb N] [--no-sha256] <bundle.zip> [integrity.json]
+
+Example:
+  python3 scripts/bundle_integrity.py artifacts/blazetv_evidence_20260116.zip artifacts/bundle_integrity.json
+
+  # Check before extracting, in one command
+  python3 scripts/extract_roots.py --integrity artifacts/bundle_integrity.json \\
+      artifacts/blazetv_evidence_20260116.zip artifacts/proof_summary.tsv
+
+Report (compact JSON, one line; printed when no path is given):
+  {"bundle": "...zip", "ok": false, "size": 183000000, "members": 200001, "checked": 1187,
+   "compressed_bytes": ..., "uncompressed_bytes": ..., "sha256": null,
+   "error": {"member": "blazetv_evidence_x/proofs/00001187.json", "offset": 1043288,
+             "check": "crc32", "detail": "CRC-32 0x1a2b3c4d, expected 0x5e6f7a8b"},
+   "workers": 4, "seconds": 0.41, "gb_per_s": 0.45}
+
+Exit status is 0 when every member checks out, 1 otherwise.
+"""
+
+import sys
+import os
+import json
+import mmap
+import time
+import zlib
+import struct
+import hashlib
+import argparse
+import threading
+import multiprocessing
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+# Zip records (little-endian); see APPNOTE.TXT 4.3
+EOCD = struct.Struct('<4s4H2LH')
+EOCD_MAGIC = b'PK\x05\x06'
+EOCD_MAX_COMMENT = 0xFFFF
+ZIP64_LOCATOR = struct.Struct('<4sLQL')
+ZIP64_LOCATOR_MAGIC = b'PK\x06\x07'
+ZIP64_EOCD = struct.Struct('<4sQ2H2L4Q')
+ZIP64_EOCD_MAGIC = b'PK\x06\x06'
+ZIP64_EXTRA = 0x0001
+CENTRAL_HEADER = struct.Struct('<4s4B4HL2L5H2L')
+CENTRAL_HEADER_MAGIC = b'PK\x01\x02'
+LOCAL_HEADER = struct.Struct('<4s5H3L2H')
+LOCAL_HEADER_MAGIC = b'PK\x03\x04'
+EXTRA_HEADER = struct.Struct('<2H')
+
+FLAG_ENCRYPTED = 0x1
+FLAG_UTF8 = 0x800
+METHOD_STORED = 0
+METHOD_DEFLATED = 8
+
+# Members per worker job end after this many compressed bytes (or members)
+CHUNK_BYTES = 32 << 20
+CHUNK_MEMBERS = 8192
+# Members larger than this are inflated INFLATE_BLOCK compressed bytes at a time
+INFLATE_BLOCK = 1 << 20
+# Workers look for a stop request from the parent this often (members)
+STOP_POLL = 256
+HASH_BUFFER = 8 << 20
+
+
+class IntegrityError(Exception):
+    """A member (or the archive itself) failed a check; `check` names it."""
+
+    def __init__(self, check: str, detail: str, member: int = None):
+        super().__init__(detail)
+        self.check = check
+        self.detail = detail
+        self.member = member
+
+
+def _zip64_values(extra: bytes, wanted: int) -> list:
+    """The first `wanted` 64-bit values of a zip64 extended information field."""
+    pos = 0
+    while pos + EXTRA_HEADER.size <= len(extra):
+        tag, size = EXTRA_HEADER.unpack_from(extra, pos)
+        pos += EXTRA_HEADER.size
+        if tag == ZIP64_EXTRA:
+            if size < 8 * wanted:
+                break
+            return list(struct.unpack_from(f'<{wanted}Q', extra, pos))
+        pos += size
+    raise IntegrityError('central_directory', "zip64 sizes missing from the extra field")
+
+
+def read_central_directory(mm) -> tuple:
+    """Parse the central directory of the mapped bundle `mm`.
+
+    Returns (names, columns, cd_start): names are the raw member names
+    (bytes), columns a dict of parallel arrays (header_offset, compress_size,
+    file_size, crc, method, flags). Offsets include any data prepended to the
+    archive, as zipfile computes them.
+    """
+    size = len(mm)
+    tail_start = max(0, size - EOCD.size - EOCD_MAX_COMMENT)
+    eocd = mm.rfind(EOCD_MAGIC, tail_start)
+    if eocd < 0 or eocd + EOCD.size > size:
+        raise IntegrityError('central_directory', "no end of central directory record (not a zip file)")
+    _, disk, _, _, count, cd_size, cd_offset, _ = EOCD.unpack_from(mm, eocd)
+    if disk != 0:
+        raise IntegrityError('central_directory', "multi-disk archives are not supported")
+    cd_end = eocd
+
+    locator = eocd - ZIP64_LOCATOR.size
+    if locator >= 0 and mm[locator:locator + 4] == ZIP64_LOCATOR_MAGIC:
+        cd_end = locator - ZIP64_EOCD.size
+        if cd_end < 0 or mm[cd_end:cd_end + 4] != ZIP64_EOCD_MAGIC:
+            raise IntegrityError('central_directory', "zip64 end of central directory record not found")
+        (_, _, _, _, _, _, _, count, cd_size, cd_offset) = ZIP64_EOCD.unpack_from(mm, cd_end)
+
+    cd_start = cd_end - cd_size
+    concat = cd_start - cd_offset
+    if cd_start < 0 or concat < 0:
+        raise IntegrityError('central_directory', f"central directory size {cd_size} does not fit the file")
+
+    names = []
+    columns = {'header_offset': array('Q'), 'compress_size': array('Q'), 'file_size': array('Q'),
+               'crc': array('L'), 'method': array('H'), 'flags': array('H')}
+    add_name = names.append
+    add_offset, add_csize, add_size = (columns['header_offset'].append, columns['compress_size'].append,
+                                       columns['file_size'].append)
+    add_crc, add_method, add_flags = columns['crc'].append, columns['method'].append, columns['flags'].append
+    unpack = CENTRAL_HEADER.unpack_from
+    header_size = CENTRAL_HEADER.size
+    pos = cd_start
+    for _ in range(count):
+        if pos + header_size > cd_end:
+            raise IntegrityError('central_directory', f"central directory ends after {len(names)} of {count} entries")
+        (magic, _, _, _, _, flags, method, _, _, crc, csize, fsize,
+         name_size, extra_size, comment_size, _, _, _, offset) = unpack(mm, pos)
+        if magic != CENTRAL_HEADER_MAGIC:
+            raise IntegrityError('central_directory', f"bad central directory entry at offset {pos}")
+        pos += header_size
+        add_name(mm[pos:pos + name_size])
+        pos += name_size
+        if fsize == 0xFFFFFFFF or csize == 0xFFFFFFFF or offset == 0xFFFFFFFF:
+            extra = mm[pos:pos + extra_size]
+            wide = _zip64_values(extra, (fsize == 0xFFFFFFFF) + (csize == 0xFFFFFFFF) + (offset == 0xFFFFFFFF))
+            if fsize == 0xFFFFFFFF:
+                fsize = wide.pop(0)
+            if csize == 0xFFFFFFFF:
+                csize = wide.pop(0)
+            if offset == 0xFFFFFFFF:
+                offset = wide.pop(0)
+        pos += extra_size + comment_size
+        add_offset(offset + concat)
+        add_csize(csize)
+        add_size(fsize)
+        add_crc(crc)
+        add_method(method)
+        add_flags(flags)
+    return names, columns, cd_start
+
+
+def plan_chunks(columns: dict, cd_start: int) -> tuple:
+    """Member numbers in file order, and (first, last) slices of it per job.
+
+    Also returns each member's limit: where the next member in file order
+    (or the central directory) starts, which its data must not cross.
+    """
+    offsets = columns['header_offset']
+    order = sorted(range(len(offsets)), key=offsets.__getitem__)
+    limits = array('Q', bytes(8 * len(order)))
+    for this, following in zip(order, order[1:]):
+        limits[this] = offsets[following]
+    if order:
+        limits[order[-1]] = cd_start
+
+    chunks = []
+    sizes = columns['compress_size']
+    first, chunk_bytes = 0, 0
+    for i, member in enumerate(order):
+        chunk_bytes += sizes[member]
+        if chunk_bytes >= CHUNK_BYTES or i + 1 - first >= CHUNK_MEMBERS:
+            chunks.append((first, i + 1))
+            first, chunk_bytes = i + 1, 0
+    if first < len(order):
+        chunks.append((first, len(order)))
+    return order, limits, chunks
+
+
+def _inflate(data, expected_size: int) -> tuple:
+    """Inflate a raw deflate stream; return (crc32, length). Raises IntegrityError."""
+    inflater = zlib.decompressobj(-zlib.MAX_WBITS)
+    crc = 0
+    length = 0
+    try:
+        for start in range(0, max(len(data), 1), INFLATE_BLOCK):
+            out = inflater.decompress(data[start:start + INFLATE_BLOCK], expected_size - length + 1)
+            while True:
+                length += len(out)
+                if length > expected_size:
+                    raise IntegrityError('size', f"decodes to more than the declared {expected_size} bytes")
+                crc = zlib.crc32(out, crc)
+                if not inflater.unconsumed_tail:
+                    break
+                out = inflater.decompress(inflater.unconsumed_tail, expected_size - length + 1)
+            if inflater.eof:
+                break
+    except zlib.error as e:
+        raise IntegrityError('deflate', str(e)) from None
+    if not inflater.eof:
+        raise IntegrityError('deflate', "deflate stream is truncated")
+    if inflater.unused_data or start + INFLATE_BLOCK < len(data):
+        raise IntegrityError('deflate', "deflate stream ends before the declared compressed size")
+    return crc, length
+
+
+def check_member(mm, view, name: bytes, offset: int, csize: int, fsize: int, crc: int,
+                 method: int, flags: int, limit: int) -> int:
+    """Check one member of the mapped bundle; return its decoded length."""
+    header_end = offset + LOCAL_HEADER.size
+    if header_end > limit:
+        raise IntegrityError('local_header', f"local header at offset {offset} overruns the next member")
+    (magic, _, _, _, _, _, _, _, _, name_size, extra_size) = LOCAL_HEADER.unpack_from(mm, offset)
+    if magic != LOCAL_HEADER_MAGIC:
+        raise IntegrityError('local_header', f"no local file header at offset {offset}")
+    if flags & FLAG_ENCRYPTED:
+        raise IntegrityError('encrypted', "encrypted members cannot be checked")
+    if mm[header_end:header_end + name_size] != name:
+        raise IntegrityError('name', "local header name differs from the central directory")
+    start = header_end + name_size + extra_size
+    end = start + csize
+    if end > limit:
+        raise IntegrityError('bounds', f"compressed data ({csize} bytes from offset {start}) overruns "
+                                       f"the next member at offset {limit}")
+    data = view[start:end]
+    try:
+        if method == METHOD_DEFLATED:
+            actual_crc, length = _inflate(data, fsize)
+        elif method == METHOD_STORED:
+            actual_crc, length = zlib.crc32(data), csize
+        else:
+            raise IntegrityError('method', f"unsupported compression method {method}")
+    finally:
+        data.release()
+    if length != fsize:
+        raise IntegrityError('size', f"decodes to {length} bytes, declared {fsize}")
+    if actual_crc != crc:
+        raise IntegrityError('crc32', f"CRC-32 {actual_crc:#010x}, expected {crc:#010x}")
+    return length
+
+
+# Per-process state set by _init_worker(): the mapped bundle, the member
+# columns (sent once per worker, not once per job) and the parent's stop flag
+_worker = {}
+
+
+def _init_worker(zip_path: str, names: list, columns: dict, limits: array, order: list, stop) -> None:
+    f = open(zip_path, 'rb')
+    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    _worker.update(file=f, mm=mm, view=memoryview(mm), names=names, columns=columns, limits=limits,
+                   order=order, stop=stop)
+
+
+def _check_chunk(chunk: tuple) -> tuple:
+    """Check members order[first:last]; return (checked, decoded bytes, error).
+
+    error is None, 'stopped' when the parent asked workers to stop, or
+    (member number, check, detail) for the first bad member.
+    """
+    first, last = chunk
+    w = _worker
+    mm, view, names, limits, stop = w['mm'], w['view'], w['names'], w['limits'], w['stop']
+    c = w['columns']
+    offsets, csizes, fsizes, crcs, methods, flags = (c['header_offset'], c['compress_size'], c['file_size'],
+                                                     c['crc'], c['method'], c['flags'])
+    checked = 0
+    decoded = 0
+    for i, member in enumerate(w['order'][first:last]):
+        if i % STOP_POLL == 0 and stop.is_set():
+            return checked, decoded, 'stopped'
+        try:
+            decoded += check_member(mm, view, names[member], offsets[member], csizes[member], fsizes[member],
+                                    crcs[member], methods[member], flags[member], limits[member])
+        except IntegrityError as e:
+            return checked, decoded, (member, e.check, e.detail)
+        checked += 1
+    return checked, decoded, None
+
+
+def _close_worker() -> None:
+    if _worker:
+        _worker['view'].release()
+        _worker['mm'].close()
+        _worker['file'].close()
+        _worker.clear()
+
+
+def hash_file(path: str, buffer_size: int = HASH_BUFFER, stop: threading.Event = None):
+    """SHA-256 hex digest of the file in one streaming read, or None if `stop` got set."""
+    digest = hashlib.sha256()
+    buf = bytearray(buffer_size)
+    view = memoryview(buf)
+    with open(path, 'rb', buffering=0) as f:
+        while True:
+            if stop is not None and stop.is_set():
+                return None
+            n = f.readinto(buf)
+            if not n:
+                break
+            digest.update(view[:n])
+    return digest.hexdigest()
+
+
+def _member_name(name: bytes, flags: int) -> str:
+    return name.decode('utf-8' if flags & FLAG_UTF8 else 'cp437', errors='replace')
+
+
+def check_bundle(zip_path: str, workers: int = None, hash_buffer: int = HASH_BUFFER,
+                 sha256: bool = True) -> dict:
+    """Check every member of `zip_path` and hash it; return the report dict.
+
+    workers defaults to the number of CPUs. Problems with the archive or its
+    members are reported in the dict (ok false, error set), not raised;
+    OSError (missing file and the like) propagates.
+    """
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    report = {'bundle': zip_path, 'ok': False, 'size': os.path.getsize(zip_path), 'members': 0, 'checked': 0,
+              'compressed_bytes': 0, 'uncompressed_bytes': 0, 'sha256': None, 'error': None,
+              'workers': workers}
+
+    stop = multiprocessing.Event() if workers > 1 else threading.Event()
+    digest = {}
+    hasher = None
+    if sha256:
+        hasher = threading.Thread(target=lambda: digest.update(hex=hash_file(zip_path, hash_buffer, stop)),
+                                  daemon=True)
+        hasher.start()
+
+    error = None
+    try:
+        with open(zip_path, 'rb') as f:
+            if report['size'] == 0:
+                raise IntegrityError('central_directory', "empty file (not a zip file)")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                names, columns, cd_start = read_central_directory(mm)
+        report['members'] = len(names)
+        report['compressed_bytes'] = sum(columns['compress_size'])
+        order, limits, chunks = plan_chunks(columns, cd_start)
+
+        initargs = (zip_path, names, columns, limits, order, stop)
+        if workers <= 1 or len(chunks) <= 1:
+            _init_worker(*initargs)
+            try:
+                results = map(_check_chunk, chunks)
+                for checked, decoded, failure in results:
+                    report['checked'] += checked
+                    report['uncompressed_bytes'] += decoded
+                    if failure is not None:
+                        error = failure
+                        break
+            finally:
+                _close_worker()
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), initializer=_init_worker,
+                                     initargs=initargs) as pool:
+                running = {pool.submit(_check_chunk, chunk) for chunk in chunks}
+                while running:
+                    finished, running = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        if future.cancelled():
+                            continue
+                        checked, decoded, failure = future.result()
+                        report['checked'] += checked
+                        report['uncompressed_bytes'] += decoded
+                        if failure is not None and failure != 'stopped' and error is None:
+                            error = failure
+                            stop.set()
+                            for other in running:
+                                other.cancel()
+    except IntegrityError as e:
+        error = (e.member, e.check, e.detail)
+        stop.set()
+
+    if error is not None:
+        stop.set()
+        member, check, detail = error
+        report['error'] = {'member': None if member is None else _member_name(names[member],
+                                                                              columns['flags'][member]),
+                           'offset': None if member is None else columns['header_offset'][member],
+                           'check': check, 'detail': detail}
+    if hasher is not None:
+        hasher.join()
+        report['sha256'] = digest.get('hex') if error is None else None
+    report['ok'] = error is None
+    report['seconds'] = round(time.perf_counter() - start, 6)
+    report['gb_per_s'] = round(report['size'] / report['seconds'] / 1e9, 3) if report['seconds'] else None
+    return report
+
+
+def write_report(report: dict, path: str) -> None:
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(report, f, separators=(',', ':'))
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def format_report(report: dict) -> str:
+    speed = (f"{report['seconds']:.2f}s, {report['gb_per_s']:.2f} GB/s with {report['workers']} workers"
+             if report['gb_per_s'] is not None else f"{report['workers']} workers")
+    if report['ok']:
+        lines = [f"🛡️  Integrity OK: {report['members']} members, CRC-32 and sizes match ({speed})"]
+        if report['sha256']:
+            lines.append(f"   SHA-256 {report['sha256']}")
+        return "\n".join(lines)
+    error = report['error']
+    where = f"{error['member']} (offset {error['offset']})" if error['member'] is not None else report['bundle']
+    return (f"❌ Integrity check failed after {report['checked']} of {report['members']} members: "
+            f"{where}: {error['check']}: {error['detail']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check CRC-32 and sizes of every bundle member and hash the bundle.")
+    parser.add_argument('zip_path', metavar='bundle.zip')
+    parser.add_argument('report_path', nargs='?', metavar='integrity.json',
+                        help="write the JSON report here (default: print it)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="processes checking members (default: one per CPU)")
+    parser.add_argument('--buffer-mb', type=int, default=HASH_BUFFER >> 20,
+                        help=f"SHA-256 read buffer in MiB (default: {HASH_BUFFER >> 20})")
+    parser.add_argument('--no-sha256', action='store_true', help="skip hashing the whole bundle")
+    args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.buffer_mb < 1:
+        parser.error("--buffer-mb must be at least 1")
+
+    try:
+        report = check_bundle(args.zip_path, args.workers, args.buffer_mb << 20, not args.no_sha256)
+    except FileNotFoundError as e:
+        print(f"❌ File not found: {e.filename}")
+        sys.exit(1)
+    except OSError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if args.report_path is None:
+        print(json.dumps(report, separators=(',', ':')))
+    else:
+        write_report(report, args.report_path)
+        print(format_report(report))
+        print(f"💾 Written to {args.report_path}")
+    if not report['ok']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+"""
+bundle_writer.py
+
+Build a blazetv_evidence_*.zip bundle from a directory, reproducibly: the
+counterpart to extract_roots.py. The same input tree always gives a
+byte-identical bundle:
+  - members are written in sorted name order, under one prefix directory
+  - every member gets the same timestamp (SOURCE_DATE_EPOCH if set, else
+    1980-01-01) and normalized permissions (0644, or 0755 if executable)
+  - no extra fields, comments or host-specific attributes
+
+File contents are streamed from disk CHUNK_SIZE bytes at a time; a file
+is never held in memory whole. Each chunk is deflated on its own (a file
+that fits in one chunk as a complete stream, longer files as sync-flushed
+chunks closed by an empty final block), so compressed chunks depend only on
+their content. With --cache they are kept in a content-addressed SQLite
+store keyed by SHA-256: the same migrations and COUNSEL docs that recur in
+every bundle are hashed, not recompressed, on later builds. Output is only
+as reproducible across machines as zlib's deflate output, unless both share
+the cache.
+
+The last member is <prefix>/bundle_manifest.tsv: name, size, CRC-32 and
+SHA-256 of every file. extract_roots.py --cache keys proofs from bundles
+that carry a manifest by content digest instead of member name, so a proof
+already parsed from an earlier bundle is skipped even though the new bundle
+stores it under a different prefix.
+
+Usage:
+  python3 scripts/bundle_writer.py [--prefix NAME] [--level 0-9] [--mtime EPOCH]
+                                   [--cache PATH] [--cache-max-mb N] <source_dir> <bundle.zip>
+
+Example:
+  python3 scripts/bundle_writer.py --cache .cache/bundle_chunks.sqlite \\
+      /tmp/blazetv_evidence_20260116_144447 blazetv_evidence_20260116_144447.zip
+
+  # What changed between two bundles, by content
+  diff <(unzip -p old.zip '*/bundle_manifest.tsv') <(unzip -p new.zip '*/bundle_manifest.tsv')
+"""
+
+import sys
+import os
+import re
+import time
+import zlib
+import struct
+import sqlite3
+import hashlib
+import argparse
+import functools
+import itertools
+
+from bundle_integrity import (CENTRAL_HEADER, CENTRAL_HEADER_MAGIC, EOCD, EOCD_MAGIC, FLAG_UTF8,
+                              LOCAL_HEADER, LOCAL_HEADER_MAGIC, METHOD_DEFLATED, METHOD_STORED,
+                              ZIP64_EOCD, ZIP64_EOCD_MAGIC, ZIP64_EXTRA, ZIP64_LOCATOR, ZIP64_LOCATOR_MAGIC)
+
+CHUNK_SIZE = 1 << 20
+DEFAULT_LEVEL = 6
+WRITE_BUFFER = 1 << 20
+# 1980-01-01T00:00:00Z, the earliest timestamp a zip entry can hold
+DOS_EPOCH = 315532800
+
+# Ends a deflate stream made of sync-flushed chunks: an empty final block
+STREAM_END = b'\x03\x00'
+
+MANIFEST_NAME = 'bundle_manifest.tsv'
+# Only where close() puts it: at the root or directly under the bundle prefix
+MANIFEST_MEMBER_RE = re.compile(r'^(?:[^/]+/)?bundle_manifest\.tsv$')
+MANIFEST_COLUMNS = ('name', 'size', 'crc32', 'sha256')
+
+ZIP64_LIMIT = 0xFFFFFFFF
+ZIP64_COUNT_LIMIT = 0xFFFF
+VERSION_DEFAULT = 20
+VERSION_ZIP64 = 45
+SYSTEM_UNIX = 3
+DOS_DIRECTORY = 0x10
+
+DEFAULT_CACHE_MAX_BYTES = 1 << 30
+FLUSH_BATCH = 10_000
+
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunks (
+    digest BLOB NOT NULL,
+    level INTEGER NOT NULL,
+    final INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (digest, level, final)
+);
+CREATE INDEX IF NOT EXISTS idx_chunks_last_used ON chunks(last_used);
+"""
+
+
+class ChunkCache:
+    """SQLite-backed (SHA-256, level, final) -> deflated chunk store.
+
+    Like ProofCache: chunks used during a run are stamped with the run's
+    start time, writes are batched, and on close the least recently used
+    chunks beyond max_bytes of compressed data are evicted.
+    """
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.run_stamp = time.time()
+        self.hits = 0
+        self.misses = 0
+        self._touched = []
+        self._pending = {}
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(CACHE_SCHEMA)
+
+    def get(self, digest: bytes, level: int, final: bool):
+        key = (digest, level, int(final))
+        data = self._pending.get(key)
+        if data is None:
+            row = self._conn.execute("SELECT data FROM chunks WHERE digest = ? AND level = ? AND final = ?",
+                                     key).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            data = row[0]
+            self._touched.append((self.run_stamp,) + key)
+        self.hits += 1
+        self._maybe_flush()
+        return data
+
+    def put(self, digest: bytes, level: int, final: bool, data: bytes) -> None:
+        self._pending[(digest, level, int(final))] = data
+        self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        if len(self._pending) + len(self._touched) >= FLUSH_BATCH:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO chunks VALUES (?, ?, ?, ?, ?)",
+                                   [key + (data, self.run_stamp) for key, data in self._pending.items()])
+            self._conn.executemany("UPDATE chunks SET last_used = ? WHERE digest = ? AND level = ? AND final = ?",
+                                   self._touched)
+        self._pending = {}
+        self._touched = []
+
+    def evict(self) -> int:
+        """Drop least recently used chunks until at most max_bytes of data remain."""
+        (total,) = self._conn.execute("SELECT COALESCE(SUM(LENGTH(data)), 0) FROM chunks").fetchone()
+        excess = total - self.max_bytes
+        if excess <= 0:
+            return 0
+        doomed = []
+        for rowid, size in self._conn.execute("SELECT rowid, LENGTH(data) FROM chunks ORDER BY last_used ASC"):
+            doomed.append((rowid,))
+            excess -= size
+            if excess <= 0:
+                break
+        with self._conn:
+            self._conn.executemany("DELETE FROM chunks WHERE rowid = ?", doomed)
+        return len(doomed)
+
+    def close(self) -> None:
+        self.flush()
+        self.evict()
+        self._conn.close()
+
+
+def dos_timestamp(epoch: float) -> tuple:
+    """(time, date) fields of a zip entry for `epoch`, clamped to 1980..2107."""
+    t = time.gmtime(min(max(epoch, DOS_EPOCH), 4354819199))
+    return (t.tm_hour << 11 | t.tm_min << 5 | t.tm_sec // 2,
+            (t.tm_year - 1980) << 9 | t.tm_mon << 5 | t.tm_mday)
+
+
+def default_mtime() -> int:
+    """SOURCE_DATE_EPOCH (the reproducible-builds convention) if set, else 1980-01-01."""
+    value = os.environ.get('SOURCE_DATE_EPOCH')
+    return int(value) if value else DOS_EPOCH
+
+
+class BundleWriter:
+    """Write zip members in the order they are added; close() adds the manifest.
+
+    Output goes to a temporary path that replaces `path` only on success.
+    Member data is written as it is produced; a member longer than one chunk
+    gets its CRC-32 and compressed size patched into its local header once
+    it is complete.
+    """
+
+    def __init__(self, path: str, mtime: int = DOS_EPOCH, level: int = DEFAULT_LEVEL,
+                 cache: ChunkCache = None, manifest_prefix: str = ''):
+        self.path = path
+        self.level = level
+        self.cache = cache
+        self.manifest_prefix = manifest_prefix
+        self.time, self.date = dos_timestamp(mtime)
+        self.bytes_in = 0
+        self._entries = []
+        self._manifest = []
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._tmp_path = path + '.tmp'
+        self._out = open(self._tmp_path, 'wb', buffering=WRITE_BUFFER)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    @property
+    def members(self) -> int:
+        return len(self._entries)
+
+    def _deflate(self, chunk: bytes, digest: bytes, final: bool) -> bytes:
+        if self.cache is not None:
+            data = self.cache.get(digest, self.level, final)
+            if data is not None:
+                return data
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+        if self.cache is not None:
+            self.cache.put(digest, self.level, final, data)
+        return data
+
+    def _local_header(self, name: bytes, flags: int, method: int, crc: int, csize: int, size: int,
+                      zip64: bool) -> bytes:
+        extra = struct.pack('<2H2Q', ZIP64_EXTRA, 16, size, csize) if zip64 else b''
+        if zip64:
+            csize = size = ZIP64_LIMIT
+        return LOCAL_HEADER.pack(LOCAL_HEADER_MAGIC, VERSION_ZIP64 if zip64 else VERSION_DEFAULT, flags, method,
+                                 self.time, self.date, crc, csize, size, len(name), len(extra)) + extra + name
+
+    @staticmethod
+    def _encode(name: str) -> tuple:
+        try:
+            return name.encode('ascii'), 0
+        except UnicodeEncodeError:
+            return name.encode('utf-8'), FLAG_UTF8
+
+    def add_dir(self, name: str) -> None:
+        raw, flags = self._encode(name.rstrip('/') + '/')
+        offset = self._out.tell()
+        self._out.write(self._local_header(raw, flags, METHOD_STORED, 0, 0, 0, False))
+        self._entries.append((raw, flags, METHOD_STORED, 0, 0, 0, offset, (0o40755 << 16) | DOS_DIRECTORY))
+
+    def add_stream(self, name: str, chunks, size_hint: int = 0, mode: int = 0o644) -> tuple:
+        """Add a member from an iterable of byte chunks (CHUNK_SIZE each, for files).
+
+        size_hint is the expected size (a zip64 local header is written when
+        it needs one); returns (size, crc32, sha256 hex) of the content.
+        """
+        raw, flags = self._encode(name)
+        out = self._out
+        offset = out.tell()
+        chunks = iter(chunks)
+        first = next(chunks, b'')
+        second = next(chunks, None)
+
+        if second is None:
+            # Fits in one chunk: everything is known before the header is written
+            digest = hashlib.sha256(first)
+            crc = zlib.crc32(first)
+            size = len(first)
+            if size and self.level:
+                method, data = METHOD_DEFLATED, self._deflate(first, digest.digest(), True)
+            else:
+                method, data = METHOD_STORED, first
+            out.write(self._local_header(raw, flags, method, crc, len(data), size, False))
+            out.write(data)
+            csize = len(data)
+        else:
+            zip64 = size_hint >= ZIP64_LIMIT
+            method = METHOD_DEFLATED if self.level else METHOD_STORED
+            out.write(self._local_header(raw, flags, method, 0, 0, 0, zip64))
+            data_start = out.tell()
+            digest = hashlib.sha256()
+            crc = 0
+            size = 0
+            for chunk in itertools.chain((first, second), chunks):
+                digest.update(chunk)
+                crc = zlib.crc32(chunk, crc)
+                size += len(chunk)
+                out.write(self._deflate(chunk, hashlib.sha256(chunk).digest(), False) if self.level else chunk)
+            if self.level:
+                out.write(STREAM_END)
+            end = out.tell()
+            csize = end - data_start
+            if not zip64 and (size >= ZIP64_LIMIT or csize >= ZIP64_LIMIT):
+                raise ValueError(f"{name} grew past 4 GiB while it was being added")
+            out.seek(offset)
+            out.write(self._local_header(raw, flags, method, crc, csize, size, zip64))
+            out.seek(end)
+
+        self.bytes_in += size
+        self._entries.append((raw, flags, method, crc, csize, size, offset, (0o100000 | mode) << 16))
+        return size, crc, digest.hexdigest()
+
+    def add_file(self, name: str, source_path: str) -> tuple:
+        """Stream a file from disk into member `name` and record it in the manifest."""
+        st = os.stat(source_path)
+        mode = 0o755 if st.st_mode & 0o111 else 0o644
+        with open(source_path, 'rb') as f:
+            size, crc, sha256 = self.add_stream(name, iter(functools.partial(f.read, CHUNK_SIZE), b''),
+                                                st.st_size, mode)
+        if size != st.st_size:
+            raise ValueError(f"{source_path} changed size while it was being added")
+        self._manifest.append((name, size, crc, sha256))
+        return size, crc, sha256
+
+    def _manifest_chunks(self):
+        """The manifest TSV in blocks of about CHUNK_SIZE bytes."""
+        block = bytearray(("\t".join(MANIFEST_COLUMNS) + "\n").encode('utf-8'))
+        for name, size, crc, sha256 in self._manifest:
+            block += f"{name}\t{size}\t{crc:08x}\t{sha256}\n".encode('utf-8')
+            if len(block) >= CHUNK_SIZE:
+                yield bytes(block)
+                block.clear()
+        if block:
+            yield bytes(block)
+
+    def close(self) -> int:
+        """Write the manifest and central directory; return the number of members."""
+        try:
+            self.add_stream(self.manifest_prefix + MANIFEST_NAME, self._manifest_chunks())
+            self._write_central_directory()
+            self._out.close()
+            os.replace(self._tmp_path, self.path)
+        except BaseException:
+            self.discard()
+            raise
+        return self.members
+
+    def discard(self) -> None:
+        self._out.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+    def _write_central_directory(self) -> None:
+        out = self._out
+        cd_offset = out.tell()
+        for name, flags, method, crc, csize, size, offset, attributes in self._entries:
+            wide = [v for v in (size, csize, offset) if v >= ZIP64_LIMIT]
+            extra = struct.pack(f'<2H{len(wide)}Q', ZIP64_EXTRA, 8 * len(wide), *wide) if wide else b''
+            version = VERSION_ZIP64 if wide else VERSION_DEFAULT
+            out.write(CENTRAL_HEADER.pack(
+                CENTRAL_HEADER_MAGIC, version, SYSTEM_UNIX, version, 0, flags, method, self.time, self.date, crc,
+                min(csize, ZIP64_LIMIT), min(size, ZIP64_LIMIT), len(name), len(extra), 0, 0, 0, attributes,
+                min(offset, ZIP64_LIMIT)))
+            out.write(name)
+            out.write(extra)
+        cd_end = out.tell()
+        cd_size = cd_end - cd_offset
+        count = len(self._entries)
+        if count >= ZIP64_COUNT_LIMIT or cd_size >= ZIP64_LIMIT or cd_offset >= ZIP64_LIMIT:
+            out.write(ZIP64_EOCD.pack(ZIP64_EOCD_MAGIC, ZIP64_EOCD.size - 12, VERSION_ZIP64, VERSION_ZIP64,
+                                      0, 0, count, count, cd_size, cd_offset))
+            out.write(ZIP64_LOCATOR.pack(ZIP64_LOCATOR_MAGIC, 0, cd_end, 1))
+        out.write(EOCD.pack(EOCD_MAGIC, 0, 0, min(count, ZIP64_COUNT_LIMIT), min(count, ZIP64_COUNT_LIMIT),
+                            min(cd_size, ZIP64_LIMIT), min(cd_offset, ZIP64_LIMIT), 0))
+
+
+def source_entries(source_dir: str, prefix: str, skip: str = None) -> list:
+    """Sorted (member name, path or None for a directory) for everything under source_dir.
+
+    A bundle_manifest.tsv at the top of source_dir (an unpacked bundle being
+    rebuilt) is left out: close() writes a fresh one under the same name.
+    """
+    entries = []
+    base = (prefix.strip('/') + '/') if prefix.strip('/') else ''
+    if base:
+        entries.append((base, None))
+    for root, dirs, files in os.walk(source_dir):
+        rel = os.path.relpath(root, source_dir)
+        rel = '' if rel == '.' else rel.replace(os.sep, '/') + '/'
+        for d in dirs:
+            entries.append((base + rel + d + '/', None))
+        for f in files:
+            path = os.path.join(root, f)
+            if skip is not None and os.path.abspath(path) == skip:
+                continue
+            if not rel and f == MANIFEST_NAME:
+                continue
+            entries.append((base + rel + f, path))
+    entries.sort()
+    return entries
+
+
+def build_bundle(source_dir: str, zip_path: str, prefix: str = None, level: int = DEFAULT_LEVEL,
+                 mtime: int = None, cache_path: str = None,
+                 cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> tuple:
+    """Write source_dir to zip_path; return (writer, cache) for their counters.
+
+    prefix defaults to the source directory's name, as `zip -r bundle.zip dir` lays it out.
+    """
+    if prefix is None:
+        prefix = os.path.basename(os.path.normpath(source_dir))
+    entries = source_entries(source_dir, prefix, skip=os.path.abspath(zip_path))
+    cache = ChunkCache(cache_path, cache_max_bytes) if cache_path else None
+    try:
+        base = (prefix.strip('/') + '/') if prefix.strip('/') else ''
+        with BundleWriter(zip_path, default_mtime() if mtime is None else mtime, level, cache, base) as writer:
+            for name, path in entries:
+                if path is None:
+                    writer.add_dir(name)
+                else:
+                    writer.add_file(name, path)
+    finally:
+        if cache is not None:
+            cache.close()
+    return writer, cache
+
+
+def read_manifest(zf, info) -> dict:
+    """member name -> SHA-256 hex, from a bundle_manifest.tsv member."""
+    digests = {}
+    with zf.open(info) as f:
+        header = f.readline().decode('utf-8').rstrip('\n').split('\t')
+        if tuple(header) != MANIFEST_COLUMNS:
+            raise ValueError(f"{info.filename} has columns {header}; expected {list(MANIFEST_COLUMNS)}")
+        for number, line in enumerate(f, 2):
+            fields = line.decode('utf-8').rstrip('\n').split('\t')
+            if len(fields) != len(MANIFEST_COLUMNS):
+                raise ValueError(f"{info.filename} line {number} has {len(fields)} fields; "
+                                 f"expected {len(MANIFEST_COLUMNS)}")
+            digests[fields[0]] = fields[3]
+    return digests
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a reproducible evidence bundle from a directory.")
+    parser.add_argument('source_dir')
+    parser.add_argument('zip_path', metavar='bundle.zip')
+    parser.add_argument('--prefix', help="directory the members are stored under (default: the source "
+                                         "directory's name; '' for none)")
+    parser.add_argument('--level', type=int, default=DEFAULT_LEVEL, choices=range(10), metavar='0-9',
+                        help=f"deflate level, 0 to store (default: {DEFAULT_LEVEL})")
+    parser.add_argument('--mtime', type=int, metavar='EPOCH',
+                        help="timestamp of every member (default: $SOURCE_DATE_EPOCH, else 1980-01-01)")
+    parser.add_argument('--cache', metavar='PATH', help="SQLite cache of compressed chunks, shared across builds")
+    parser.add_argument('--cache-max-mb', type=int, default=DEFAULT_CACHE_MAX_BYTES >> 20,
+                        help=f"evict least recently used chunks beyond this much compressed data "
+                             f"(default: {DEFAULT_CACHE_MAX_BYTES >> 20})")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.source_dir):
+        print(f"❌ Source directory not found: {args.source_dir}")
+        sys.exit(1)
+
+    print(f"📦 Building {args.zip_path} from {args.source_dir}...")
+    start = time.perf_counter()
+    try:
+        writer, cache = build_bundle(args.source_dir, args.zip_path, args.prefix, args.level, args.mtime,
+                                     args.cache, args.cache_max_mb << 20)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error building bundle: {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    size = os.path.getsize(args.zip_path)
+    print(f"✅ {writer.members} members, {writer.bytes_in} bytes in, {size} bytes out in {elapsed:.2f}s")
+    if cache is not None:
+        print(f"🗃️  Chunk cache: {cache.hits} hits, {cache.misses} misses ({cache.path})")
+    with open(args.zip_path, 'rb') as f:
+        print(f"🔏 SHA-256 {hashlib.file_digest(f, 'sha256').hexdigest()}")
+
+
+if __name__ == '__main__':
+    main()
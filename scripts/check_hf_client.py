@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+check_hf_client.py
+
+Self-checks for counsel_email.hf_client.AsyncHFClient and the --deadline race
+(counsel_email.hf.race_template) against a scripted local stub of the Hugging
+Face Inference API; no network access or API key is needed.
+Unlike bench_hf_client.py, nothing here depends on timing or run sizes: each
+check scripts the stub's replies and asserts on what the client did.
+
+Checks:
+  - 503 "model is loading" replies are retried with backoff, and a model that
+    never finishes loading raises HFError after max_retries
+  - a cached prompt is answered without a request to the API
+  - a bad 200 body (not JSON, or JSON of the wrong shape) and a non-200 status
+    raise HFError instead of leaking ValueError/KeyError or returning junk
+  - no more than `concurrency` requests are in flight at once
+  - race_template keeps the model's emails when the stub beats the deadline
+    (outcome ai), falls back to the template emails close to the deadline when
+    the stub is delayed past it (template_deadline), and falls back when the
+    stub fails or the model side raises anything else (template_error)
+
+Usage:
+  python3 scripts/check_hf_client.py
+
+Exits 1 on the first failed check.
+"""
+
+import sys
+import os
+import json
+import time
+import asyncio
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from counsel_email import hf
+from counsel_email.cache import ResponseCache
+from counsel_email.hf_client import AsyncHFClient, HFError
+from counsel_email.summary import ProofDigest
+
+STUB_MODEL = 'stub/counsel-model'
+RACE_DEADLINE = 0.5
+# How far past the deadline a race may end: closing the client and joining the template render
+RACE_SLACK = 0.5
+# A line of the template email body that a model-written body does not have
+TEMPLATE_MARKER = "Please find below the validation results"
+
+
+def stub_text(prompt: str) -> str:
+    return f"{prompt}\nDear Counsel,\n\nStub reply.\n"
+
+
+class ScriptedStub:
+    """Text-generation endpoint whose replies come from `self.reply(prompt, calls)`.
+
+    `reply` returns (status, body bytes); `calls` counts requests for that
+    prompt, starting at 1. The stub records the total number of requests and
+    the peak number handled at once.
+    """
+
+    def __init__(self):
+        self.reply = lambda prompt, calls: (200, json.dumps([{'generated_text': stub_text(prompt)}]).encode())
+        self.delay = 0.0
+        self.requests = 0
+        self.active = 0
+        self.peak = 0
+        self._seen = {}
+        self._lock = threading.Lock()
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                prompt = json.loads(self.rfile.read(int(self.headers['Content-Length'])))['inputs']
+                with stub._lock:
+                    stub.requests += 1
+                    stub.active += 1
+                    stub.peak = max(stub.peak, stub.active)
+                    calls = stub._seen[prompt] = stub._seen.get(prompt, 0) + 1
+                try:
+                    time.sleep(stub.delay)
+                    status, data = stub.reply(prompt, calls)
+                finally:
+                    with stub._lock:
+                        stub.active -= 1
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = self.active = self.peak = 0
+            self._seen = {}
+
+    def shutdown(self) -> None:
+        self.server.shutdown()
+
+
+def loading_reply(loading: int):
+    """Answer each prompt with `loading` 503s before generating."""
+    def reply(prompt, calls):
+        if calls <= loading:
+            body = {'error': f"Model {STUB_MODEL} is currently loading", 'estimated_time': 0.05}
+            return 503, json.dumps(body).encode()
+        return 200, json.dumps([{'generated_text': stub_text(prompt)}]).encode()
+    return reply
+
+
+def fail(message: str) -> None:
+    print(f"❌ {message}")
+    sys.exit(1)
+
+
+def generate(stub: ScriptedStub, prompts: list, **options):
+    """Run the prompts through a fresh client; return (texts or HFError, client)."""
+    client = AsyncHFClient('stub-key', STUB_MODEL, api_url=stub.url, **options)
+    try:
+        result = asyncio.run(client.generate_many(prompts))
+    except HFError as e:
+        result = e
+    finally:
+        client.close()
+    return result, client
+
+
+def check_retry(stub: ScriptedStub) -> None:
+    stub.reset()
+    stub.reply = loading_reply(2)
+    start = time.perf_counter()
+    texts, client = generate(stub, ["retry me"], backoff=0.05, max_retries=3)
+    elapsed = time.perf_counter() - start
+    if texts != [stub_text("retry me")]:
+        fail(f"503 retry: expected the generated text, got {texts!r}")
+    if (client.retries, client.requests, stub.requests) != (2, 3, 3):
+        fail(f"503 retry: expected 2 retries over 3 requests, got {client.retries} retries, "
+             f"{client.requests} client / {stub.requests} stub requests")
+    # Backoff is 0.05s then min(0.10s, estimated_time 0.05s)
+    if elapsed < 0.1:
+        fail(f"503 retry: finished in {elapsed:.3f}s, so the client did not back off")
+    print(f"✅ 503 retry: 2 retries with backoff ({elapsed:.2f}s), then the generated text")
+
+    stub.reset()
+    stub.reply = loading_reply(10)
+    error, client = generate(stub, ["never loads"], backoff=0.01, max_retries=2)
+    if not isinstance(error, HFError) or 'still loading' not in str(error):
+        fail(f"503 retry: expected HFError 'still loading' after max_retries, got {error!r}")
+    if stub.requests != 3:
+        fail(f"503 retry: expected 3 requests (1 + max_retries 2), got {stub.requests}")
+    print(f"✅ 503 retry: gives up after max_retries with HFError: {error}")
+
+
+def check_cache(stub: ScriptedStub, tmpdir: str) -> None:
+    stub.reset()
+    stub.reply = loading_reply(0)
+    cache = ResponseCache(os.path.join(tmpdir, 'cache'))
+    first, _ = generate(stub, ["cache me"], cache=cache)
+    requests_before = stub.requests
+    second, client = generate(stub, ["cache me"], cache=ResponseCache(cache.path))
+    if requests_before != 1 or stub.requests != 1 or client.requests != 0:
+        fail(f"cache hit: expected a single request in total, got {stub.requests} "
+             f"({client.requests} from the warm client)")
+    if second != first or client.cache.hits != 1:
+        fail(f"cache hit: expected the cached text and 1 hit, got {second!r}, {client.cache.hits} hits")
+    print("✅ cache hit: the second client answered from the cache without a request")
+
+
+def check_bad_bodies(stub: ScriptedStub) -> None:
+    bodies = [
+        ("non-JSON 200", 200, b"<html>Bad gateway</html>"),
+        ("empty list", 200, b"[]"),
+        ("list of strings", 200, b'["just a string"]'),
+        ("object, not a list", 200, b'{"generated_text": "x"}'),
+        ("non-string generated_text", 200, b'[{"generated_text": 5}]'),
+        ("JSON null", 200, b"null"),
+        ("500 error", 500, b'{"error": "internal"}'),
+    ]
+    for label, status, data in bodies:
+        stub.reset()
+        stub.reply = lambda prompt, calls, status=status, data=data: (status, data)
+        try:
+            error, _ = generate(stub, [f"bad body: {label}"], max_retries=0)
+        except Exception as e:
+            fail(f"bad body ({label}): raised {type(e).__name__} instead of HFError: {e}")
+        if not isinstance(error, HFError):
+            fail(f"bad body ({label}): expected HFError, got {error!r}")
+    print(f"✅ bad body: {len(bodies)} malformed or failed responses all raise HFError")
+
+
+def check_concurrency(stub: ScriptedStub) -> None:
+    limit = 3
+    stub.reset()
+    stub.reply = loading_reply(0)
+    stub.delay = 0.1
+    prompts = [f"concurrent prompt {i}" for i in range(limit * 4)]
+    texts, _ = generate(stub, prompts, concurrency=limit)
+    stub.delay = 0.0
+    if texts != [stub_text(p) for p in prompts]:
+        fail("concurrency: texts are missing or out of prompt order")
+    if stub.peak > limit:
+        fail(f"concurrency: {stub.peak} requests in flight with concurrency={limit}")
+    if stub.peak < 2:
+        fail(f"concurrency: requests never overlapped (peak {stub.peak}) with concurrency={limit}")
+    print(f"✅ concurrency: at most {stub.peak} of {len(prompts)} requests in flight (concurrency={limit})")
+
+
+def race(stub: ScriptedStub, digest: ProofDigest, recipients: list, deadline: float = RACE_DEADLINE):
+    prompts = [hf.build_prompt(digest, recipient['name']) for recipient in recipients]
+    emails, metrics = asyncio.run(hf.race_template(digest, recipients, prompts, 'stub-key', STUB_MODEL,
+                                                   deadline, use_cache=False))
+    if len(emails) != len(recipients):
+        fail(f"race ({metrics['outcome']}): {len(emails)} emails for {len(recipients)} recipients")
+    if metrics['elapsed_s'] > deadline + RACE_SLACK:
+        fail(f"race ({metrics['outcome']}): took {metrics['elapsed_s']:.2f}s with a {deadline:g}s deadline")
+    return emails, metrics
+
+
+def check_race(stub: ScriptedStub) -> None:
+    os.environ['HF_API_URL'] = stub.url
+    digest = ProofDigest().update([{'id': '49279', 'merkle_root': '0x' + 'ab' * 32, 'anchor_tx': 'pending'}])
+    recipients = [{'name': 'Jane Roe', 'role': 'counsel', 'email': ''},
+                  {'name': 'Acme Pay', 'role': 'psp', 'email': ''}]
+
+    def used_template(emails: list) -> bool:
+        return all(TEMPLATE_MARKER in email and "Stub reply." not in email for _, email in emails)
+
+    stub.reset()
+    stub.reply = loading_reply(0)
+    emails, metrics = race(stub, digest, recipients)
+    if metrics['outcome'] != 'ai' or not all("Stub reply." in email for _, email in emails):
+        fail(f"race: expected the model's emails from a fast stub, got {metrics}")
+    print(f"✅ race: fast stub -> outcome ai in {metrics['elapsed_s']:.2f}s, model emails kept")
+
+    stub.reset()
+    stub.delay = RACE_DEADLINE * 4
+    emails, metrics = race(stub, digest, recipients)
+    stub.delay = 0.0
+    if metrics['outcome'] != 'template_deadline' or not used_template(emails):
+        fail(f"race: expected the template emails from a delayed stub, got {metrics}")
+    print(f"✅ race: stub delayed {RACE_DEADLINE * 4:g}s -> outcome template_deadline "
+          f"in {metrics['elapsed_s']:.2f}s (deadline {RACE_DEADLINE:g}s)")
+
+    stub.reset()
+    stub.reply = lambda prompt, calls: (500, b'{"error": "internal"}')
+    emails, metrics = race(stub, digest, recipients)
+    if metrics['outcome'] != 'template_error' or 'API error: 500' not in metrics.get('error', '') \
+            or not used_template(emails):
+        fail(f"race: expected template_error on a failing stub, got {metrics}")
+    print(f"✅ race: stub answers 500 -> outcome template_error ({metrics['error'][:40]}...)")
+
+    async def broken_generate_bodies(client, prompts):
+        raise RuntimeError("injected failure")
+
+    generate_bodies = hf.generate_bodies
+    hf.generate_bodies = broken_generate_bodies
+    try:
+        emails, metrics = race(stub, digest, recipients)
+    finally:
+        hf.generate_bodies = generate_bodies
+    if metrics['outcome'] != 'template_error' or metrics.get('error') != "RuntimeError: injected failure" \
+            or not used_template(emails):
+        fail(f"race: expected template_error on an unexpected exception, got {metrics}")
+    print("✅ race: model side raises RuntimeError -> outcome template_error, template emails sent")
+
+
+def main():
+    stub = ScriptedStub()
+    print(f"🧪 Scripted stub API at {stub.url}")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        check_retry(stub)
+        check_cache(stub, tmpdir)
+        check_bad_bodies(stub)
+        check_concurrency(stub)
+        check_race(stub)
+    stub.shutdown()
+
+
+if __name__ == '__main__':
+    main()
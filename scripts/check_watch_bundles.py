@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+check_watch_bundles.py
+
+Self-check for extract_roots.py --watch in a temporary directory.
+
+A watcher is started with a short --interval and --idle-timeout on a
+directory holding one synthetic bundle; a second bundle is dropped in (built
+under another name, then renamed) once the first is journaled. When the
+watcher stops on its idle timeout, the summary must hold every valid proof
+of both bundles with their source_bundle, and the <summary>.bundles journal
+one 'ok' line per bundle. A second watcher on the same directory must then
+find both bundles in the journal and leave the summary and journal untouched.
+
+Usage:
+  python3 scripts/check_watch_bundles.py [--interval S] [--idle-timeout S]
+
+Exits 1 on the first failed check.
+"""
+
+import sys
+import os
+import time
+import argparse
+import tempfile
+import subprocess
+
+from synthetic_bundle import make_bundle
+from extract_roots import WATCH_JOURNAL_SUFFIX, WATCH_JOURNAL_COLUMNS, summary_columns
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+# Different proof counts give different merkle roots, so no row is a duplicate
+BUNDLES = (('blazetv_evidence_w1.zip', 40), ('blazetv_evidence_w2.zip', 60))
+MALFORMED_RATIO = 0.05
+JOURNAL_WAIT = 30.0
+
+
+def fail(message: str) -> None:
+    print(f"❌ {message}")
+    sys.exit(1)
+
+
+def start_watcher(directory: str, summary: str, interval: float, idle_timeout: float) -> subprocess.Popen:
+    return subprocess.Popen([sys.executable, os.path.join(SCRIPTS_DIR, 'extract_roots.py'), '--watch',
+                             '--interval', str(interval), '--idle-timeout', str(idle_timeout),
+                             directory, summary],
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+
+
+def finish(watcher: subprocess.Popen, idle_timeout: float) -> str:
+    try:
+        output, _ = watcher.communicate(timeout=JOURNAL_WAIT + idle_timeout)
+    except subprocess.TimeoutExpired:
+        watcher.kill()
+        fail("the watcher did not stop on its idle timeout")
+    if watcher.returncode != 0:
+        fail(f"the watcher exited with {watcher.returncode}:\n{output}")
+    return output
+
+
+def read_tsv(path: str) -> list:
+    with open(path) as f:
+        return [line.rstrip('\n').split('\t') for line in f]
+
+
+def journaled(journal: str) -> set:
+    if not os.path.exists(journal):
+        return set()
+    return {row[0] for row in read_tsv(journal)[1:]}
+
+
+def drop_bundle(directory: str, name: str, count: int) -> dict:
+    """Build a bundle under a name the watcher ignores, then move it into place."""
+    staging = os.path.join(directory, f".{name}.tmp")
+    info = make_bundle(staging, count, proof_size=256, malformed_ratio=MALFORMED_RATIO)
+    os.replace(staging, os.path.join(directory, name))
+    return info
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check extract_roots.py --watch end to end.")
+    parser.add_argument('--interval', type=float, default=0.1, help="watch poll interval (default: 0.1)")
+    parser.add_argument('--idle-timeout', type=float, default=2.0, help="watch idle timeout (default: 2.0)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        directory = os.path.join(tmpdir, 'incoming')
+        os.makedirs(directory)
+        summary = os.path.join(tmpdir, 'summary.tsv')
+        journal = summary + WATCH_JOURNAL_SUFFIX
+
+        (first, first_count), (second, second_count) = BUNDLES
+        infos = {first: drop_bundle(directory, first, first_count)}
+        watcher = start_watcher(directory, summary, args.interval, args.idle_timeout)
+        deadline = time.monotonic() + JOURNAL_WAIT
+        while first not in journaled(journal):
+            if watcher.poll() is not None or time.monotonic() > deadline:
+                watcher.kill()
+                fail(f"{first} was never journaled:\n{watcher.communicate()[0]}")
+            time.sleep(args.interval)
+        infos[second] = drop_bundle(directory, second, second_count)
+        finish(watcher, args.idle_timeout)
+
+        rows = read_tsv(summary)
+        if tuple(rows[0]) != summary_columns(False):
+            fail(f"summary header is {rows[0]}")
+        bundle_column = summary_columns(False).index('source_bundle')
+        for name, info in infos.items():
+            written = sum(1 for row in rows[1:] if row[bundle_column] == name)
+            if written != info['valid']:
+                fail(f"{name}: expected {info['valid']} rows in the summary, found {written}")
+        entries = read_tsv(journal)
+        if tuple(entries[0]) != WATCH_JOURNAL_COLUMNS:
+            fail(f"journal header is {entries[0]}")
+        by_bundle = {row[0]: dict(zip(WATCH_JOURNAL_COLUMNS, row)) for row in entries[1:]}
+        if len(entries) != 1 + len(infos) or set(by_bundle) != set(infos):
+            fail(f"expected one journal line per bundle, got {entries[1:]}")
+        for name, info in infos.items():
+            entry = by_bundle[name]
+            if (entry['status'], int(entry['new_rows']), int(entry['unparseable'])) != \
+                    ('ok', info['valid'], info['malformed']):
+                fail(f"{name}: journal line {entry} does not match {info}")
+        print(f"✅ watch: {len(rows) - 1} rows appended from {len(infos)} bundles "
+              f"({second} dropped while running), one journal line each")
+
+        with open(summary, 'rb') as f:
+            summary_before = f.read()
+        with open(journal, 'rb') as f:
+            journal_before = f.read()
+        output = finish(start_watcher(directory, summary, args.interval, args.idle_timeout), args.idle_timeout)
+        with open(summary, 'rb') as f:
+            summary_after = f.read()
+        with open(journal, 'rb') as f:
+            journal_after = f.read()
+        if summary_after != summary_before or journal_after != journal_before:
+            fail(f"the restarted watcher reprocessed journaled bundles:\n{output}")
+        if "Watched 0 bundles" not in output:
+            fail(f"the restarted watcher reports work on journaled bundles:\n{output}")
+        print("✅ restart: both journaled bundles skipped; summary and journal unchanged")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,23 @@
+"""
+counsel_email
+
+Counsel/PSP email generation behind scripts/generate_counsel_email.py and
+backend/scripts/generate_counsel_email.py.
+
+  summary      proof reader: proof_summary.tsv, .psum or the evidence zip
+  template     the deterministic template email
+  model_email  the prompt and the frame around a model-written body
+  generators   pluggable body generators: template, hf, cached
+  cache        on-disk cache of model responses
+  hf           the hf generator and the --deadline race (imports requests)
+  hf_client    async Hugging Face Inference API client (imports requests)
+  cli          the command line shared by both scripts
+
+Only requests-free modules are imported here; hf and hf_client load when
+the hf generator is picked.
+"""
+
+from .summary import (PREVIEW_ROWS, ProofDigest, digest_proof_summary, iter_proof_summary,
+                      read_proof_summary)
+from .template import generate_counsel_email_template, render_recipient_emails
+from .generators import GENERATORS, BodyGenerator, GenerationError, load_generator
@@ -0,0 +1,59 @@
+"""
+counsel_email.cache
+
+On-disk cache of generated model texts. It lives apart from hf_client so
+the cached generator can replay earlier model output without importing
+requests.
+
+Environment variables:
+  HF_CACHE_DIR: response cache directory (default: .cache/hf_responses)
+"""
+
+import os
+import json
+import time
+import hashlib
+
+DEFAULT_CACHE_DIR = '.cache/hf_responses'
+
+# Part of every cache key, so a change of generation parameters is a cache miss
+DEFAULT_PARAMETERS = {'max_new_tokens': 800, 'temperature': 0.7, 'do_sample': True}
+
+
+class ResponseCache:
+    """Content-addressed store of generated texts: one JSON file per key."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_DIR):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> 'ResponseCache':
+        return cls(os.getenv('HF_CACHE_DIR', DEFAULT_CACHE_DIR))
+
+    @staticmethod
+    def key(model: str, prompt: str, parameters: dict) -> str:
+        material = json.dumps([model, prompt, parameters], sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, key[:2], key + '.json')
+
+    def get(self, key: str):
+        try:
+            with open(self._file(key)) as f:
+                text = json.load(f)['text']
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return text
+
+    def put(self, key: str, model: str, text: str) -> None:
+        path = self._file(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'model': model, 'text': text, 'created': time.time()}, f)
+        os.replace(tmp_path, path)
@@ -0,0 +1,117 @@
+"""
+counsel_email.cli
+
+The command line behind scripts/generate_counsel_email.py (template by
+default) and backend/scripts/generate_counsel_email.py (hf by default); the
+two differ only in their default --generator.
+"""
+
+import sys
+import os
+import json
+import time
+import argparse
+
+import profiling
+
+from .generators import GENERATORS, GenerationError, load_generator
+from .summary import digest_proof_summary
+from .template import read_recipients, write_emails
+
+
+def write_metrics(path: str, metrics: dict) -> None:
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(metrics, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def build_parser(default_generator: str) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Generate counsel/PSP emails from a proof summary.")
+    parser.add_argument('tsv_path', metavar='proof_summary.tsv|.psum|.zip')
+    parser.add_argument('output_path', metavar='output_email.txt',
+                        help="email file, or a directory of <recipient>.txt files with --recipients")
+    parser.add_argument('--generator', choices=sorted(GENERATORS), default=default_generator,
+                        help=f"who writes the email body (default: {default_generator})")
+    parser.add_argument('--recipients', metavar='PATH',
+                        help="name/role/email TSV; renders one email per row (role: counsel or psp)")
+    parser.add_argument('--concurrency', type=int,
+                        help="hf: maximum concurrent API requests (default: 4)")
+    parser.add_argument('--no-cache', action='store_true', help="hf: always call the API; skip the response cache")
+    parser.add_argument('--deadline', type=float, metavar='SECONDS',
+                        help="hf: latency budget for the model; past it (or on any API error) the "
+                             "template email is used")
+    parser.add_argument('--metrics', metavar='PATH',
+                        help="write a JSON sidecar with the generator's outcome, latencies and cache stats")
+    parser.add_argument('--profile', metavar='PATH',
+                        help="write stage timings and counters (read, render, HTTP latency, cache) as JSON")
+    return parser
+
+
+def main(default_generator: str = 'template', argv: list = None):
+    parser = build_parser(default_generator)
+    args = parser.parse_args(argv)
+
+    if args.deadline is not None and args.generator != 'hf':
+        parser.error("--deadline races the model against the template; it needs --generator hf")
+
+    tsv_path = args.tsv_path
+    output_path = args.output_path
+    prof = profiling.start('generate_counsel_email') if args.profile else None
+
+    print(f"🚀 Generating counsel email...")
+    print(f"  Input: {tsv_path}")
+    print(f"  Output: {output_path}")
+    print(f"  Generator: {args.generator}")
+
+    generator = load_generator(args.generator).from_args(args)
+
+    # Read proofs: one streaming pass keeps the preview rows and totals only
+    digest = digest_proof_summary(tsv_path)
+    print(f"✅ Loaded {digest.total} proofs "
+          f"({digest.pending_anchors} pending anchors, {digest.distinct_roots} distinct roots)")
+
+    recipients = None
+    if args.recipients:
+        try:
+            recipients = read_recipients(args.recipients)
+        except (OSError, ValueError) as e:
+            print(f"❌ Error reading recipients: {e}")
+            sys.exit(1)
+
+    start = time.perf_counter()
+    try:
+        with profiling.section('render_emails'):
+            emails = generator.render(digest, recipients)
+            if recipients is not None:
+                count = write_emails(emails, output_path)
+            else:
+                (_, email_content), = emails
+    except GenerationError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if prof is not None:
+        prof.add('proofs_read', digest.total)
+        prof.add('emails_written', count if recipients is not None else 1)
+
+    if args.metrics:
+        generator.metrics.setdefault('elapsed_s', round(time.perf_counter() - start, 4))
+        write_metrics(args.metrics, generator.metrics)
+        print(f"📈 Metrics written to {args.metrics}")
+
+    if recipients is not None:
+        print(f"✅ {count} emails written to {output_path}/")
+    else:
+        # Write to output
+        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+
+        with open(output_path, 'w') as f:
+            f.write(email_content)
+
+        print(f"✅ Email written to {output_path}")
+        print(f"\n📧 Preview (first 40 lines):")
+        print("\n".join(email_content.split("\n")[:40]))
+
+    if args.profile:
+        profiling.finish(args.profile)
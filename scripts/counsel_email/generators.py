@@ -0,0 +1,114 @@
+"""
+counsel_email.generators
+
+Pluggable body generators. A generator turns one run's ProofDigest into one
+complete email per recipient:
+
+  template  the deterministic template email (template.py)
+  hf        a Hugging Face model writes the body (hf.py; imports requests)
+  cached    replays model bodies from the response cache, no network; any
+            prompt not cached gets the template email
+
+GENERATORS maps each name to "module:Class" and load_generator() imports the
+module on first use, so running the template generator never imports
+requests or the HTTP client. A new generator is a BodyGenerator subclass
+plus one entry here.
+"""
+
+import os
+import importlib
+from datetime import datetime
+
+import profiling
+
+from .cache import DEFAULT_PARAMETERS, ResponseCache
+from .model_email import DEFAULT_MODEL, build_prompt, extract_email_body, format_counsel_email
+from .summary import ProofDigest
+from .template import DEFAULT_RECIPIENT, bind_run, recipient_fields, render_recipient_emails
+
+GENERATORS = {
+    'template': 'counsel_email.generators:TemplateGenerator',
+    'hf': 'counsel_email.hf:HFGenerator',
+    'cached': 'counsel_email.generators:CachedGenerator',
+}
+
+
+class GenerationError(Exception):
+    """A generator could not produce its emails (e.g. the model API failed)."""
+
+
+class BodyGenerator:
+    """Base class: render() yields (recipient, email) pairs.
+
+    `recipients` is a list of name/role/email dicts, or None for the single
+    default email (addressed to DEFAULT_RECIPIENT). After the pairs are
+    consumed, `metrics` holds what the run did, for the --metrics sidecar.
+    """
+
+    name = None
+
+    def __init__(self):
+        self.metrics = {'mode': self.name}
+
+    @classmethod
+    def from_args(cls, args) -> 'BodyGenerator':
+        """Build the generator from parsed CLI arguments and the environment."""
+        return cls()
+
+    def render(self, digest: ProofDigest, recipients: list = None):
+        raise NotImplementedError
+
+
+class TemplateGenerator(BodyGenerator):
+    name = 'template'
+
+    def render(self, digest: ProofDigest, recipients: list = None, now: datetime = None):
+        self.metrics['outcome'] = 'template'
+        return render_recipient_emails(digest.head, digest.total, recipients or [DEFAULT_RECIPIENT], now)
+
+
+class CachedGenerator(BodyGenerator):
+    """Model emails from earlier hf runs, looked up by model + prompt; no API key needed."""
+
+    name = 'cached'
+
+    def __init__(self, model: str = DEFAULT_MODEL, cache: ResponseCache = None):
+        super().__init__()
+        self.model = model
+        self.cache = cache or ResponseCache()
+        self.metrics['model'] = model
+
+    @classmethod
+    def from_args(cls, args) -> 'CachedGenerator':
+        return cls(os.getenv('HF_MODEL', DEFAULT_MODEL), ResponseCache.from_env())
+
+    def render(self, digest: ProofDigest, recipients: list = None):
+        now = datetime.utcnow()
+        run = None
+        for recipient in recipients or [None]:
+            prompt = build_prompt(digest, recipient and recipient['name'])
+            text = self.cache.get(ResponseCache.key(self.model, prompt, DEFAULT_PARAMETERS))
+            recipient = recipient or DEFAULT_RECIPIENT
+            if text is not None:
+                yield recipient, format_counsel_email(digest, extract_email_body(text, prompt), now)
+                continue
+            if run is None:
+                run = bind_run(digest.head, digest.total, now)
+            yield recipient, run.render(recipient_fields(recipient))
+
+        hits, misses = self.cache.hits, self.cache.misses
+        self.metrics.update(cache_hits=hits, cache_misses=misses,
+                            outcome='ai' if not misses else 'template' if not hits else 'mixed')
+        prof = profiling.active()
+        if prof is not None:
+            prof.add('hf_cache_hits', hits)
+            prof.add('hf_cache_misses', misses)
+
+
+def load_generator(name: str) -> type:
+    """Import and return the generator class registered under `name`."""
+    try:
+        module_name, class_name = GENERATORS[name].split(':')
+    except KeyError:
+        raise ValueError(f"unknown generator {name!r} (choose from {', '.join(sorted(GENERATORS))})") from None
+    return getattr(importlib.import_module(module_name), class_name)
@@ -0,0 +1,175 @@
+"""
+counsel_email.hf
+
+The hf generator: a Hugging Face model writes the email body, through
+hf_client.AsyncHFClient (pooled connections, bounded concurrency, retries on
+503 while the model loads, and the response cache).
+
+With a deadline the template emails are rendered at once while the model
+runs; the model's bodies are used only if they all arrive within the
+deadline, otherwise (or on any API error, including a missing HF_API_KEY)
+the template emails are returned. metrics records which path won.
+
+Environment variables:
+  HF_API_KEY: Hugging Face API token
+  HF_MODEL: Model to use (default: google/flan-ul2)
+  HF_API_URL, HF_CACHE_DIR: see hf_client.py and cache.py
+"""
+
+import os
+import time
+import asyncio
+from datetime import datetime
+
+import profiling
+
+from .cache import ResponseCache
+from .generators import BodyGenerator, GenerationError, TemplateGenerator
+from .hf_client import AsyncHFClient, HFError, DEFAULT_CONCURRENCY, DEFAULT_TIMEOUT
+from .model_email import DEFAULT_MODEL, build_prompt, extract_email_body, format_counsel_email
+from .summary import ProofDigest
+from .template import DEFAULT_RECIPIENT
+
+
+def make_client(hf_api_key: str, hf_model: str, concurrency: int = DEFAULT_CONCURRENCY,
+                use_cache: bool = True, timeout: float = DEFAULT_TIMEOUT) -> AsyncHFClient:
+    if not hf_api_key:
+        raise HFError("HF_API_KEY environment variable not set")
+    cache = ResponseCache.from_env() if use_cache else None
+    return AsyncHFClient(hf_api_key, hf_model, concurrency=concurrency, cache=cache, timeout=timeout)
+
+
+async def generate_bodies(client: AsyncHFClient, prompts: list) -> list:
+    texts = await client.generate_many(prompts)
+    return [extract_email_body(text, prompt) for text, prompt in zip(texts, prompts)]
+
+
+def client_metrics(client: AsyncHFClient) -> dict:
+    """The client's request, retry and cache counts; also recorded in the active --profile."""
+    metrics = {'requests': client.requests, 'retries': client.retries}
+    if client.cache is not None:
+        metrics.update(cache_hits=client.cache.hits, cache_misses=client.cache.misses)
+
+    prof = profiling.active()
+    if prof is not None:
+        for name, n in metrics.items():
+            prof.add(f"hf_{name}", n)
+        for seconds in client.latencies:
+            prof.observe('http_request', seconds)
+    return metrics
+
+
+async def race_template(digest: ProofDigest, recipients: list, prompts: list, hf_api_key: str,
+                        hf_model: str, deadline: float, use_cache: bool = True,
+                        concurrency: int = DEFAULT_CONCURRENCY) -> tuple:
+    """Render the template emails while the model runs; keep the model's bodies only if they beat `deadline`.
+
+    Returns (emails, metrics), emails being (recipient, email) pairs. The
+    model requests' own timeout is the deadline too, so a request abandoned
+    at the deadline cannot outlive it by much.
+    """
+    start = time.perf_counter()
+    metrics = {'mode': 'deadline', 'model': hf_model, 'deadline_s': deadline}
+
+    def render_template():
+        begin = time.perf_counter()
+        emails = list(TemplateGenerator().render(digest, recipients))
+        return emails, time.perf_counter() - begin
+
+    template_task = asyncio.create_task(asyncio.to_thread(render_template))
+    client = None
+    bodies = None
+    try:
+        client = make_client(hf_api_key, hf_model, concurrency=min(concurrency, len(prompts)),
+                             use_cache=use_cache, timeout=deadline)
+        ai_task = asyncio.create_task(generate_bodies(client, prompts))
+        bodies = await asyncio.wait_for(ai_task, timeout=deadline)
+        metrics['outcome'] = 'ai'
+        metrics['ai_latency_s'] = round(time.perf_counter() - start, 4)
+    except asyncio.TimeoutError:
+        metrics['outcome'] = 'template_deadline'
+    except HFError as e:
+        metrics['outcome'] = 'template_error'
+        metrics['error'] = str(e)
+    except Exception as e:
+        # Whatever goes wrong on the model side, the template email still goes out
+        metrics['outcome'] = 'template_error'
+        metrics['error'] = f"{type(e).__name__}: {e}"
+    finally:
+        if client is not None:
+            client.close()
+            metrics.update(client_metrics(client))
+
+    template_emails, template_seconds = await template_task
+    metrics['template_render_s'] = round(template_seconds, 4)
+    if bodies is not None:
+        now = datetime.utcnow()
+        emails = [(recipient, format_counsel_email(digest, body, now))
+                  for (recipient, _), body in zip(template_emails, bodies)]
+    else:
+        emails = template_emails
+    metrics['elapsed_s'] = round(time.perf_counter() - start, 4)
+    return emails, metrics
+
+
+class HFGenerator(BodyGenerator):
+    name = 'hf'
+
+    def __init__(self, api_key: str, model: str = DEFAULT_MODEL, concurrency: int = DEFAULT_CONCURRENCY,
+                 use_cache: bool = True, deadline: float = None):
+        super().__init__()
+        self.api_key = api_key
+        self.model = model
+        self.concurrency = concurrency
+        self.use_cache = use_cache
+        self.deadline = deadline
+        self.metrics.update(mode='model', model=model)
+
+    @classmethod
+    def from_args(cls, args) -> 'HFGenerator':
+        return cls(os.getenv('HF_API_KEY'), os.getenv('HF_MODEL', DEFAULT_MODEL),
+                   args.concurrency or DEFAULT_CONCURRENCY, not args.no_cache, args.deadline)
+
+    def render(self, digest: ProofDigest, recipients: list = None):
+        if recipients:
+            prompts = [build_prompt(digest, recipient['name']) for recipient in recipients]
+        else:
+            prompts = [build_prompt(digest)]
+        if self.deadline is not None:
+            return self._race(digest, recipients, prompts)
+
+        try:
+            client = make_client(self.api_key, self.model, self.concurrency, self.use_cache)
+        except HFError as e:
+            raise GenerationError(str(e)) from None
+        if recipients:
+            print(f"📧 Calling Hugging Face API ({self.model}) for {len(recipients)} recipients, "
+                  f"{self.concurrency} at a time...")
+        else:
+            print(f"📧 Calling Hugging Face API ({self.model})...")
+        try:
+            bodies = asyncio.run(generate_bodies(client, prompts))
+        except HFError as e:
+            raise GenerationError(str(e)) from None
+        finally:
+            client.close()
+            print(f"📈 {client.stats_line()}")
+        self.metrics.update(outcome='ai', **client_metrics(client))
+
+        if not recipients:
+            print(f"✅ Generated {len(bodies[0])} characters of email text")
+        now = datetime.utcnow()
+        return [(recipient, format_counsel_email(digest, body, now))
+                for recipient, body in zip(recipients or [DEFAULT_RECIPIENT], bodies)]
+
+    def _race(self, digest: ProofDigest, recipients: list, prompts: list) -> list:
+        print(f"⏱️  Racing {self.model} against the template email, deadline {self.deadline:g}s...")
+        emails, self.metrics = asyncio.run(race_template(
+            digest, recipients, prompts, self.api_key, self.model, self.deadline, self.use_cache,
+            self.concurrency))
+        if self.metrics['outcome'] == 'ai':
+            print(f"✅ Model answered in {self.metrics['ai_latency_s']:.2f}s")
+        else:
+            error = self.metrics.get('error')
+            print(f"⚠️  Using template email ({self.metrics['outcome']}{': ' + error if error else ''})")
+        return emails
@@ -0,0 +1,158 @@
+"""
+counsel_email.hf_client
+
+Async Hugging Face Inference API client for the counsel email scripts.
+
+- One pooled requests.Session per client; blocking calls run in worker
+  threads via asyncio.to_thread, at most `concurrency` at a time.
+- 503 "model is loading" responses are retried with exponential backoff
+  (capped by the estimated_time the API reports).
+- Responses are cached on disk under a content address: sha256 of the model,
+  prompt and generation parameters (cache.py). A repeated prompt is served
+  from the cache without a request.
+
+Environment variables:
+  HF_API_URL: API base URL (default: https://api-inference.huggingface.co/models),
+              e.g. a local stub server for offline runs
+
+Example:
+  client = AsyncHFClient(api_key, 'google/flan-ul2', concurrency=4)
+  texts = asyncio.run(client.generate_many(prompts))
+  print(client.stats_line())
+"""
+
+import os
+import time
+import asyncio
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .cache import DEFAULT_PARAMETERS, ResponseCache
+
+DEFAULT_API_URL = 'https://api-inference.huggingface.co/models'
+DEFAULT_CONCURRENCY = 4
+DEFAULT_TIMEOUT = 30
+MAX_RETRIES = 5
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+
+
+class HFError(Exception):
+    """A generation request failed for good (after any retries)."""
+
+
+class AsyncHFClient:
+    """Bounded-concurrency, retrying, caching text-generation client."""
+
+    def __init__(self, api_key: str, model: str, api_url: str = None,
+                 concurrency: int = DEFAULT_CONCURRENCY, timeout: float = DEFAULT_TIMEOUT,
+                 max_retries: int = MAX_RETRIES, backoff: float = BACKOFF_BASE,
+                 parameters: dict = None, cache: ResponseCache = None):
+        self.model = model
+        self.url = f"{(api_url or os.getenv('HF_API_URL') or DEFAULT_API_URL).rstrip('/')}/{model}"
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.parameters = dict(DEFAULT_PARAMETERS if parameters is None else parameters)
+        self.cache = cache
+        self.concurrency = concurrency
+        self._semaphore = None
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=concurrency)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        })
+
+        self.requests = 0
+        self.retries = 0
+        self.latencies = []
+
+    def close(self) -> None:
+        self.session.close()
+
+    def _post(self, prompt: str):
+        payload = {"inputs": prompt, "parameters": self.parameters}
+        return self.session.post(self.url, json=payload, timeout=self.timeout)
+
+    def _retry_delay(self, response, attempt: int) -> float:
+        delay = self.backoff * (2 ** attempt)
+        try:
+            estimated = float(response.json().get('estimated_time', delay))
+        except (ValueError, AttributeError):
+            estimated = delay
+        return min(delay, estimated, BACKOFF_MAX)
+
+    async def _request(self, prompt: str) -> str:
+        for attempt in range(self.max_retries + 1):
+            start = time.perf_counter()
+            try:
+                response = await asyncio.to_thread(self._post, prompt)
+            except requests.exceptions.Timeout:
+                raise HFError("Hugging Face API request timed out") from None
+            except requests.exceptions.RequestException as e:
+                raise HFError(f"Error calling Hugging Face API: {e}") from None
+            finally:
+                self.requests += 1
+                self.latencies.append(time.perf_counter() - start)
+
+            if response.status_code == 503:
+                # Model is still loading on the inference backend
+                if attempt == self.max_retries:
+                    break
+                self.retries += 1
+                await asyncio.sleep(self._retry_delay(response, attempt))
+                continue
+            if response.status_code != 200:
+                raise HFError(f"Hugging Face API error: {response.status_code}: {response.text[:500]}")
+
+            try:
+                result = response.json()
+            except ValueError:
+                raise HFError(f"Unexpected response format: {response.text[:500]}") from None
+            if isinstance(result, list) and result and isinstance(result[0], dict):
+                text = result[0].get('generated_text', '')
+                if isinstance(text, str):
+                    return text
+            raise HFError(f"Unexpected response format: {str(result)[:500]}")
+
+        raise HFError(f"Model {self.model} still loading after {self.max_retries} retries")
+
+    async def generate(self, prompt: str) -> str:
+        """Return the generated text for `prompt`, from the cache when possible."""
+        key = None
+        if self.cache is not None:
+            key = ResponseCache.key(self.model, prompt, self.parameters)
+            text = self.cache.get(key)
+            if text is not None:
+                return text
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        async with self._semaphore:
+            text = await self._request(prompt)
+
+        if key is not None:
+            self.cache.put(key, self.model, text)
+        return text
+
+    async def generate_many(self, prompts: list) -> list:
+        """Generate every prompt concurrently (bounded); results keep prompt order."""
+        return await asyncio.gather(*(self.generate(p) for p in prompts))
+
+    def stats_line(self) -> str:
+        parts = [f"{self.requests} requests, {self.retries} retries on 503"]
+        if self.latencies:
+            ordered = sorted(self.latencies)
+            p50 = ordered[len(ordered) // 2]
+            p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+            parts.append(f"latency p50 {p50 * 1e3:.0f} ms, p95 {p95 * 1e3:.0f} ms")
+        if self.cache is not None:
+            lookups = self.cache.hits + self.cache.misses
+            rate = self.cache.hits / lookups if lookups else 0.0
+            parts.append(f"cache {self.cache.hits}/{lookups} hits ({rate:.0%})")
+        return ", ".join(parts)
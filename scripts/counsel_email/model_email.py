@@ -0,0 +1,177 @@
+"""
+counsel_email.model_email
+
+The model-written counsel email: the prompt sent to the model and the fixed
+header, proof details and footer wrapped around the body it returns. Shared
+by the hf and cached generators; nothing here touches the network.
+"""
+
+from datetime import datetime
+
+from anchor_report import anchor_chain
+
+from .summary import PREVIEW_ROWS, ProofDigest
+
+DEFAULT_MODEL = 'google/flan-ul2'
+
+# Proofs quoted in the prompt; the formatted email lists PREVIEW_ROWS
+PROMPT_ROWS = 5
+
+
+def build_prompt(digest: ProofDigest, recipient: str = None) -> str:
+    """Build the generation prompt for a run's proofs (and optionally a named recipient)."""
+    
+    # Build proof summary for prompt
+    proofs_text = "\n".join([
+        f"  • Match ID {p['id']}: merkle_root={p['merkle_root'][:16]}..., anchor_tx={p['anchor_tx'][:16]}..."
+        for p in digest.head[:PROMPT_ROWS]
+    ])
+    if digest.total > PROMPT_ROWS:
+        proofs_text += f"\n  • ... and {digest.total - PROMPT_ROWS} more proofs"
+    
+    addressee = f" addressed to {recipient}" if recipient else ""
+    
+    # Craft the prompt
+    return f"""You are a professional legal counsel email generator. Generate a formal email{addressee} to legal counsel and PSP contacts summarizing an evidence bundle validation for blockchain-based compliance verification.
+
+EVIDENCE SUMMARY:
+Total proofs validated: {digest.total}
+Merkle root proofs extracted:
+{proofs_text}
+
+INSTRUCTIONS:
+1. Write a professional email suitable for sending to legal counsel/compliance officers.
+2. Summarize the evidence bundle contents: merkle roots, anchor transactions, and proof chain.
+3. Include the proof summary above.
+4. Request a 24-48 hour legal review.
+5. Suggest blockchain explorer links for anchor_tx verification (e.g., Etherscan if Ethereum).
+6. Do NOT invent or hallucinate transaction IDs or links.
+7. Do NOT generate commands or code snippets.
+8. Focus on compliance, audit readiness, and immutability verification.
+9. Sign off professionally.
+
+EMAIL BODY:"""
+
+
+def extract_email_body(generated_text: str, prompt: str) -> str:
+    """Extract just the email body (after the prompt)."""
+    if 'EMAIL BODY:' in generated_text:
+        return generated_text.split('EMAIL BODY:')[-1].strip()
+    return generated_text.replace(prompt, '').strip()
+
+
+def anchor_coverage(digest: ProofDigest) -> str:
+    """The executive summary's anchor line, from the digest's anchor aggregation."""
+    report = digest.anchors.report()
+    if not report['pending_proofs'] and not report['invalid_anchor_proofs']:
+        return f"Anchored to blockchain ({len(report['anchors'])} transactions)"
+    status = f"{report['anchored_proofs']} proofs anchored in {len(report['anchors'])} transactions"
+    if report['pending_proofs']:
+        status += f", {report['pending_proofs']} pending confirmation"
+    if report['invalid_anchor_proofs']:
+        status += f", {report['invalid_anchor_proofs']} with a malformed anchor_tx"
+    return status
+
+
+def format_counsel_email(digest: ProofDigest, generated_body: str, now: datetime = None) -> str:
+    """Format the final counsel email with header and footer."""
+    
+    # One clock reading for both the DATE header and the footer timestamp
+    now = now or datetime.utcnow()
+    
+    email = f"""Subject: BlazeTV Evidence Bundle Validation & Legal Review Request
+
+───────────────────────────────────────────────────────────────────────────
+
+TO: Legal Counsel & Compliance Officers
+FROM: BlazeTV Development Team
+DATE: {get_date(now)}
+RE: Blockchain Evidence Bundle Validation Report
+
+───────────────────────────────────────────────────────────────────────────
+
+Dear Counsel,
+
+Please find below our automated evidence bundle validation summary for the BlazeTV 
+platform compliance audit. This bundle contains blockchain-anchored proofs of system 
+integrity and data immutability.
+
+**EXECUTIVE SUMMARY**
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+Total Proofs Validated: {digest.total}
+Bundle Status: ✅ VERIFIED
+Merkle Root Chain: Complete
+Anchor Transactions: {anchor_coverage(digest)}
+
+**PROOF DETAILS**
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+    
+    for i, proof in enumerate(digest.head[:PREVIEW_ROWS], 1):
+        email += f"\nProof #{i}:\n"
+        email += f"  Match ID: {proof['id']}\n"
+        email += f"  Merkle Root: {proof['merkle_root']}\n"
+        chain = anchor_chain(proof['anchor_tx'])
+        if chain == 'pending':
+            email += f"  Anchor TX: (pending blockchain confirmation)\n"
+        else:
+            email += f"  Anchor TX: {proof['anchor_tx']}\n"
+            if chain == 'evm':
+                email += f"  Verify: https://etherscan.io/tx/{proof['anchor_tx']} (if Ethereum)\n"
+    
+    if digest.total > PREVIEW_ROWS:
+        email += f"\n... and {digest.total - PREVIEW_ROWS} additional proofs in the bundle\n"
+    
+    email += f"""
+
+**AI-GENERATED COMPLIANCE SUMMARY**
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+{generated_body}
+
+**ACTION REQUIRED**
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+1. Review the proof details and merkle root chain above
+2. Verify anchor transactions on blockchain explorer (links provided)
+3. Confirm compliance with regulatory requirements
+4. Provide written approval for production deployment
+5. Expected timeline: 24-48 hours
+
+**NEXT STEPS**
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+Upon your approval, we will:
+  ✓ Deploy to production environment
+  ✓ Enable real-money transaction processing
+  ✓ Activate live streaming with content verification
+  ✓ Monitor compliance metrics in real-time
+
+Please reply with:
+  • Your written approval
+  • Any compliance concerns or required modifications
+  • Confirmation of review timeline
+
+Thank you for your prompt review.
+
+Best regards,
+BlazeTV Development Team
+
+───────────────────────────────────────────────────────────────────────────
+Generated by: GitHub Actions Auto-Validate Workflow
+Timestamp: {get_timestamp(now)}
+───────────────────────────────────────────────────────────────────────────
+"""
+    
+    return email
+
+
+def get_date(now: datetime = None):
+    """Get current date in readable format."""
+    return (now or datetime.utcnow()).strftime('%B %d, %Y')
+
+
+def get_timestamp(now: datetime = None):
+    """Get current timestamp."""
+    return (now or datetime.utcnow()).strftime('%Y-%m-%d %H:%M:%S UTC')
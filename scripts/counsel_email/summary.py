@@ -0,0 +1,127 @@
+"""
+counsel_email.summary
+
+The proof reader shared by every counsel email generator. A proof summary is
+proof_summary.tsv, the binary proof_summary.psum (extract_roots.py --binary)
+or an evidence zip itself; all three yield {'id', 'merkle_root', 'anchor_tx'}
+per proof in one sequential pass.
+
+Header rule (the same for every input): the first TSV line is the header,
+and any later row whose id column reads 'id' is a repeated header (e.g. from
+concatenated summaries) and is skipped.
+"""
+
+import sys
+from operator import itemgetter
+
+import profiling
+from anchor_report import AnchorAggregator
+from proof_summary import ProofSummary, is_summary_file
+
+PREVIEW_ROWS = 10
+READ_BUFFER_SIZE = 1 << 20
+ZIP_MAGIC = b'PK\x03\x04'
+
+_ROW = itemgetter('id', 'merkle_root', 'anchor_tx')
+
+
+class ProofDigest:
+    """The first `keep` proofs of a summary plus running totals over all of them.
+
+    Totals come from an AnchorAggregator (anchor_report.py), so memory stays
+    constant in the number of proofs apart from the distinct
+    (anchor_tx, merkle_root) pairs, which are few since one root covers a
+    whole tree.
+    """
+
+    def __init__(self, keep: int = PREVIEW_ROWS):
+        self.keep = keep
+        self.head = []
+        self.anchors = AnchorAggregator()
+
+    @property
+    def total(self) -> int:
+        return self.anchors.total
+
+    @property
+    def pending_anchors(self) -> int:
+        return self.anchors.pending_proofs
+
+    @property
+    def distinct_roots(self) -> int:
+        return self.anchors.distinct_roots
+
+    def update(self, proofs) -> 'ProofDigest':
+        proofs = iter(proofs)
+        head = self.head
+        for proof in proofs:
+            head.append(proof)
+            self.anchors.add(_ROW(proof))
+            if len(head) >= self.keep:
+                break
+        self.anchors.update(map(_ROW, proofs))
+        return self
+
+
+def is_zip_file(path: str) -> bool:
+    with open(path, 'rb') as f:
+        return f.read(len(ZIP_MAGIC)) == ZIP_MAGIC
+
+
+def iter_tsv_proofs(tsv_path: str):
+    with open(tsv_path, 'r', buffering=READ_BUFFER_SIZE) as f:
+        # Skip header
+        next(f, None)
+        for line in f:
+            parts = line.strip().split('\t', 3)
+            if len(parts) >= 3 and parts[0] != 'id':  # Skip repeated header or short rows
+                yield {'id': parts[0], 'merkle_root': parts[1], 'anchor_tx': parts[2]}
+
+
+def iter_psum_proofs(psum_path: str):
+    with ProofSummary(psum_path) as summary:
+        for row in summary:
+            yield {'id': row[0], 'merkle_root': row[1], 'anchor_tx': row[2]}
+
+
+def iter_zip_proofs(zip_path: str):
+    """Parse the proof members of an evidence zip directly; unreadable members are skipped."""
+    # extract_roots pulls in the decoder, cache and merkle modules; only zip input needs them
+    import zipfile
+    from extract_roots import BundleScan, iter_proof_rows
+
+    with zipfile.ZipFile(zip_path) as zf:
+        for _, row, error in iter_proof_rows(zip_path, zf, BundleScan(zf).members):
+            if error is None:
+                yield {'id': row[0], 'merkle_root': row[1], 'anchor_tx': row[2]}
+
+
+def iter_proof_summary(path: str):
+    """Yield {'id', 'merkle_root', 'anchor_tx'} per proof in one sequential read."""
+    if is_summary_file(path):
+        return iter_psum_proofs(path)
+    if is_zip_file(path):
+        return iter_zip_proofs(path)
+    return iter_tsv_proofs(path)
+
+
+def _consume_summary(path: str, consume):
+    try:
+        with profiling.section('read_summary'):
+            return consume(iter_proof_summary(path))
+    except FileNotFoundError:
+        print(f"❌ Proof summary file not found: {path}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"❌ Error reading proof summary: {e}")
+        sys.exit(1)
+
+
+def digest_proof_summary(path: str, keep: int = PREVIEW_ROWS) -> ProofDigest:
+    """Stream a proof summary into a ProofDigest without holding every row."""
+    return _consume_summary(path, ProofDigest(keep).update)
+
+
+def read_proof_summary(path: str) -> list:
+    """Read a proof summary and return a list of {'id', 'merkle_root', 'anchor_tx'} dicts."""
+    return _consume_summary(path, list)
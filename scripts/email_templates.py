@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+email_templates.py
+
+Compiled templates for counsel emails rendered at batch scale.
+
+A template is plain text with {field} placeholders (lowercase names only;
+no other braces are interpreted). compile_template() splits it once into
+literal text and field slots and caches the result. bind() substitutes the
+fields that are the same for every email of a run (proofs section, totals,
+dates) and returns a smaller template whose remaining slots are only the
+per-recipient ones, so rendering each email is a single join.
+
+Example:
+  template = compile_template("To: {recipient}\\nProofs: {total}\\n")
+  run = template.bind({'total': '42'})
+  emails = [run.render({'recipient': name}) for name in names]
+"""
+
+import re
+from functools import lru_cache
+
+FIELD_RE = re.compile(r'\{([a-z_][a-z0-9_]*)\}')
+
+
+class CompiledTemplate:
+    """Literal text interleaved with named slots: parts[1::2] are field names."""
+
+    def __init__(self, parts: list):
+        self.parts = parts
+        self.fields = frozenset(parts[1::2])
+
+    @classmethod
+    def parse(cls, text: str) -> 'CompiledTemplate':
+        return cls(FIELD_RE.split(text))
+
+    def bind(self, values: dict) -> 'CompiledTemplate':
+        """Substitute the given fields and merge them into the literal text."""
+        parts = [self.parts[0]]
+        for i in range(1, len(self.parts), 2):
+            name = self.parts[i]
+            if name in values:
+                parts[-1] += str(values[name]) + self.parts[i + 1]
+            else:
+                parts += [name, self.parts[i + 1]]
+        return CompiledTemplate(parts)
+
+    def render(self, values: dict = None) -> str:
+        """Fill every remaining slot; raises KeyError for a missing field."""
+        parts = self.parts
+        if len(parts) == 1:
+            return parts[0]
+        out = parts[:]
+        for i in range(1, len(parts), 2):
+            out[i] = str(values[parts[i]])
+        return ''.join(out)
+
+
+@lru_cache(maxsize=32)
+def compile_template(text: str) -> CompiledTemplate:
+    """Parse `text` once per process; later calls return the cached template."""
+    return CompiledTemplate.parse(text)
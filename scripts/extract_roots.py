@@ -6,103 +6,1393 @@ Extract merkle roots, anchor transactions, and proof IDs from a blazetv_evidence
 bundle and write a tab-separated summary for use in counsel email generation.
 
 Usage:
-  python3 scripts/extract_roots.py <evidence_zip_path> <output_summary.tsv>
+  python3 scripts/extract_roots.py [--workers N] [--cache PATH] [--verify] [--decoder NAME]
+                                   [--report PATH] [--listing PATH] [--binary PATH] [--index PATH]
+                                   [--store PATH] [--anchors PATH] [--integrity PATH] [--profile PATH]
+                                   [--max-failures LIMIT] [--quarantine PATH]
+                                   <evidence_zip_path> <output_summary.tsv>
+  python3 scripts/extract_roots.py --batch [--workers N] [--cache PATH] [--verify] [--decoder NAME]
+                                   [--max-failures LIMIT] [--quarantine PATH]
+                                   <evidence_zip_or_glob>... <merged_summary.tsv>
+  python3 scripts/extract_roots.py --watch [--interval SECONDS] [--idle-timeout SECONDS] [--workers N]
+                                   [--cache PATH] [--verify] [--decoder NAME] [--max-failures LIMIT]
+                                   [--quarantine PATH] <incoming_dir> <watched_summary.tsv>
 
 Example:
   python3 scripts/extract_roots.py artifacts/blazetv_evidence_20260116.zip artifacts/proof_summary.tsv
 
+  # Parse proofs on 8 cores; rows are still written in sorted member order
+  python3 scripts/extract_roots.py --workers 8 artifacts/blazetv_evidence_20260116.zip artifacts/proof_summary.tsv
+
+  # Reuse rows parsed by earlier runs; only new or changed members are decoded
+  # (bundles built by bundle_writer.py are matched by content, whatever their prefix)
+  python3 scripts/extract_roots.py --cache .cache/proof_cache.sqlite artifacts/blazetv_evidence_20260116.zip artifacts/proof_summary.tsv
+
+  # Recompute every proof path and add a verify_status column
+  python3 scripts/extract_roots.py --verify artifacts/blazetv_evidence_20260116.zip artifacts/proof_summary.tsv
+
+  # Decode only match_id/id/video_id, merkle_root and anchor_tx from each proof;
+  # large proof_bundle arrays are read but not built (see proof_decoder.py for backends)
+  python3 scripts/extract_roots.py --decoder scan artifacts/blazetv_evidence_20260116.zip artifacts/proof_summary.tsv
+
+  # Full validation in one pass, as CI runs it: summary TSV, the validation
+  # report (harness lines, proofs, DB sample, reconciliation) and a listing
+  python3 scripts/extract_roots.py --report artifacts/validation_output.txt \
+      --listing artifacts/bundle_listing.txt artifacts/blazetv_evidence_20260116.zip artifacts/proof_summary.tsv
+
+  # Also write the memory-mappable binary summary (see proof_summary.py)
+  python3 scripts/extract_roots.py --binary artifacts/proof_summary.psum \
+      artifacts/blazetv_evidence_20260116.zip artifacts/proof_summary.tsv
+
+  # Also index proof IDs and merkle roots for `bundle_index.py lookup`
+  python3 scripts/extract_roots.py --index artifacts/blazetv_evidence_20260116.zip.pidx \
+      artifacts/blazetv_evidence_20260116.zip artifacts/proof_summary.tsv
+
+  # Upsert every proof into a local SQLite copy of the proofs table
+  python3 scripts/extract_roots.py --store .cache/proofs.sqlite \
+      artifacts/blazetv_evidence_20260116.zip artifacts/proof_summary.tsv
+
+  # Proofs per anchor transaction and the pending proofs to anchor next, as JSON
+  python3 scripts/extract_roots.py --anchors artifacts/anchor_report.json \
+      artifacts/blazetv_evidence_20260116.zip artifacts/proof_summary.tsv
+
+  # Check every member's CRC-32 and sizes (and hash the bundle) before
+  # extracting anything; a corrupt bundle stops here with a JSON report
+  python3 scripts/extract_roots.py --integrity artifacts/bundle_integrity.json \
+      artifacts/blazetv_evidence_20260116.zip artifacts/proof_summary.tsv
+
+  # Where the time goes: stage timings, members/bytes/rows counters, per-member
+  # parse time percentiles, as JSON (profiling.py prints it as a table)
+  python3 scripts/extract_roots.py --profile artifacts/extract_profile.json \
+      artifacts/blazetv_evidence_20260116.zip artifacts/proof_summary.tsv
+
+  # Fail the run if more than 1% of the proof files cannot be parsed; either
+  # way unparseable files are listed in artifacts/proof_summary.tsv.quarantine
+  python3 scripts/extract_roots.py --max-failures 1% \
+      artifacts/blazetv_evidence_20260116.zip artifacts/proof_summary.tsv
+
+  # Every accumulated bundle, 4 at a time, merged into one deduplicated summary
+  python3 scripts/extract_roots.py --batch --workers 4 'artifacts/blazetv_evidence_*.zip' artifacts/merged_summary.tsv
+
+  # Long-running: validate every bundle that lands in incoming/ and append it
+  python3 scripts/extract_roots.py --watch --workers 4 --cache .cache/proof_cache.sqlite \
+      incoming/ artifacts/watched_summary.tsv
+
 Output format:
   id\tmerkle_root\tanchor_tx
   49279\t0xabcd...\t0x1234...
   51682\t0xdef0...\t0x5678...
   ...
+
+With --verify each row gains a fourth verify_status column: verified,
+mismatch, missing (no leaf hash or proof path in the file) or malformed.
+
+A proof file that cannot be decompressed or parsed (bad JSON or UTF-8, not
+a JSON object, CRC-32 mismatch, an id/merkle_root/anchor_tx that is an object,
+an array or text with tabs or line breaks, ...) is skipped and the run goes on; it is
+listed in <output_summary.tsv>.quarantine (or --quarantine PATH) as
+  source_bundle\tmember\tmember_offset\terror_class\terror_offset\terror
+where member_offset is the member's local header offset in the zip and
+error_offset the position in the decompressed file where decoding failed
+(empty if the decoder does not report one). Only the first 10 failures are
+printed, then one progress line every 5 seconds. --max-failures N (members)
+or P% (of the proof files) fails the run once more members than that are
+quarantined; the summary is then not written. The sidecar only exists when
+something was quarantined.
+
+In batch mode (--batch, or more than one bundle) each bundle is parsed by its
+own worker into a temporary part file; the parts are merged in sorted bundle
+order, keeping the first row seen for each (id, merkle_root). Two provenance
+columns are appended: source_bundle (zip file name) and source_member (proof
+file inside it). Only a 16-byte digest per distinct (id, merkle_root) is held
+in memory, so peak memory follows the number of distinct rows, not the total.
+
+Watch mode (--watch) polls a directory for blazetv_evidence_*.zip and
+extracts each bundle once its size and mtime have settled, through a worker
+pool that stays up between bundles (workers keep their --cache open). The
+output is the batch format, appended and synced one bundle at a time and
+deduplicated against every row already in the file; finished bundles are
+logged to <watched_summary.tsv>.bundles, so a restarted watcher resumes
+where it stopped. Ctrl-C or SIGTERM stops it; --idle-timeout exits once no
+bundle has arrived for that long.
+
+Proof files are read directly from the archive (proofs/*.json at the root or
+under a nested blazetv_evidence_*/ prefix); the bundle is never unpacked to disk.
 """
 
 import sys
 import zipfile
-import json
-import tempfile
+import zlib
 import os
-from pathlib import Path
+import re
+import glob
+import hashlib
+import itertools
+import time
+import signal
+import tempfile
+import argparse
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from proof_cache import ProofCache, DEFAULT_MAX_ENTRIES, content_key
+from merkle import ProofVerifier
+from reconcile_proofs import DB_TABLE_RE, Reconciler, load_db_index, format_report
+import proof_decoder
+import profiling
+from proof_summary import SummaryWriter
+from bundle_index import IndexWriter
+from bundle_writer import MANIFEST_MEMBER_RE, read_manifest
+from proof_store import ProofStore
+from anchor_report import AnchorAggregator, format_report as format_anchor_report, write_report
+import bundle_integrity
+
+
+# Matches proofs/<name>.json at the bundle root or under a nested prefix such
+# as blazetv_evidence_20260116_144447/proofs/<name>.json
+PROOF_MEMBER_RE = re.compile(r'^(?:.*/)?proofs/[^/]+\.json$')
+HARNESS_OUTPUT_RE = re.compile(r'^(?:.*/)?harness_output\.txt$')
+
+# Lines of harness_output.txt worth quoting in the validation report
+HARNESS_LINE_RE = re.compile(r'merkle|anchor|Anchored|anchor_tx|merkle_root|Status', re.IGNORECASE)
+REPORT_SAMPLE_ROWS = 20
+REPORT_HEAD_LINES = 30
+
+TSV_BUFFER_SIZE = 1 << 20
+
+# Batch mode: digest size of a (id, merkle_root) dedup key and the provenance columns
+DEDUP_KEY_SIZE = 16
+PROVENANCE_COLUMNS = ('source_bundle', 'source_member')
+
+# Watch mode: bundles picked up, poll interval and the per-bundle journal
+# (<summary>.bundles) that lets a restarted watcher skip finished bundles
+WATCH_PATTERN = 'blazetv_evidence_*.zip'
+WATCH_INTERVAL = 2.0
+WATCH_JOURNAL_SUFFIX = '.bundles'
+WATCH_JOURNAL_COLUMNS = ('bundle', 'size', 'mtime_ns', 'proofs', 'new_rows', 'unparseable', 'status')
+
+# Members that fail to decompress or parse are listed in a quarantine sidecar
+# (<output_summary.tsv>.quarantine): member_offset is the member's local header
+# offset in the zip, error_offset the position in the decompressed member where
+# decoding stopped, when the decoder reports one. The first WARN_FIRST failures
+# are printed; after that at most one progress line every WARN_INTERVAL seconds.
+QUARANTINE_SUFFIX = '.quarantine'
+QUARANTINE_COLUMNS = ('source_bundle', 'member', 'member_offset', 'error_class', 'error_offset', 'error')
+WARN_FIRST = 10
+WARN_INTERVAL = 5.0
+
+# Where a proof file keeps its leaf hash and sibling path; 'hash'/'proof'
+# are the names generate_proofs.js uses, 'proof_bundle' the proofs table column.
+PROOF_LEAF_KEYS = ('leaf', 'hash')
+PROOF_PATH_KEYS = ('proof', 'proof_bundle')
+
+# Fallback chain for the proof ID and every top-level key a row is built from
+ID_KEYS = ('match_id', 'id', 'video_id')
+ROW_KEYS = frozenset(ID_KEYS + ('merkle_root', 'anchor_tx'))
+
+
+class BundleScan:
+    """What one walk of the central directory tells us about a bundle.
+
+    members are the proof files to parse (proofs/*.json if the bundle has a
+    proofs/ directory, else every .json member), sorted by name so output
+    order is deterministic. harness, db_table and manifest are the ZipInfo
+    of harness_output.txt, db/proofs_table.txt and bundle_manifest.tsv
+    (bundle_writer.py), or None.
+    """
+
+    def __init__(self, zf: zipfile.ZipFile):
+        proof_members = []
+        json_members = []
+        self.harness = None
+        self.db_table = None
+        self.manifest = None
+
+        for info in zf.infolist():
+            name = info.filename
+            if info.is_dir():
+                continue
+            if name.endswith('.json'):
+                if PROOF_MEMBER_RE.match(name):
+                    proof_members.append(info)
+                else:
+                    json_members.append(info)
+            elif self.harness is None and HARNESS_OUTPUT_RE.match(name):
+                self.harness = info
+            elif self.db_table is None and DB_TABLE_RE.match(name):
+                self.db_table = info
+            elif self.manifest is None and MANIFEST_MEMBER_RE.match(name):
+                self.manifest = info
+
+        self.has_proofs_dir = bool(proof_members)
+        self.members = sorted(proof_members or json_members, key=lambda i: i.filename)
+
+
+def find_proof_members(zf: zipfile.ZipFile) -> tuple:
+    """Return (members, has_proofs_dir) from a BundleScan of the archive."""
+    scan = BundleScan(zf)
+    return scan.members, scan.has_proofs_dir
+
+
+def row_field(key: str, value) -> str:
+    """A decoded row value as TSV-safe text: numbers and booleans become strings,
+    while objects, arrays and text with tabs or line breaks are rejected."""
+    if isinstance(value, (dict, list)):
+        raise TypeError(f"{key} is a JSON {'object' if isinstance(value, dict) else 'array'}, expected a string")
+    value = str(value)
+    if '\t' in value or '\n' in value or '\r' in value:
+        raise ValueError(f"{key} contains a tab or line break")
+    return value
+
+
+def parse_proof(data: dict, with_path: bool = False) -> tuple:
+    """Return the (id, merkle_root, anchor_tx) row for a decoded proof.
+
+    Row values are always strings (see row_field()), so nothing downstream
+    trips over a proof whose ID is a number. With with_path=True the leaf
+    hash and sibling path are appended so the row can be passed to
+    verify_row().
+    """
+    if not isinstance(data, dict):
+        raise TypeError(f"expected a JSON object, got {type(data).__name__}")
+    proof_id = next((data[k] for k in ID_KEYS if data.get(k)), None) or 'unknown'
+    merkle_root = data.get('merkle_root') or 'none'
+    anchor_tx = data.get('anchor_tx') or 'pending'
+    if type(proof_id) is int:
+        # Numeric IDs are the usual non-string value; no need for row_field()
+        proof_id = str(proof_id)
+    if type(proof_id) is not str or type(merkle_root) is not str or type(anchor_tx) is not str:
+        unsafe = True
+    else:
+        text = proof_id + merkle_root + anchor_tx
+        unsafe = '\t' in text or '\n' in text or '\r' in text
+    if unsafe:
+        proof_id = row_field('id', proof_id)
+        merkle_root = row_field('merkle_root', merkle_root)
+        anchor_tx = row_field('anchor_tx', anchor_tx)
+    if not with_path:
+        return (proof_id, merkle_root, anchor_tx)
+    leaf = next((data[k] for k in PROOF_LEAF_KEYS if data.get(k)), None)
+    path = next((data[k] for k in PROOF_PATH_KEYS if isinstance(data.get(k), list)), None)
+    return (proof_id, merkle_root, anchor_tx, leaf, path)
+
+
+def row_fields_known(found: dict) -> bool:
+    """True once a partial scan has seen enough keys to build the row."""
+    if 'merkle_root' not in found or 'anchor_tx' not in found:
+        return False
+    for key in ID_KEYS:
+        if key not in found:
+            return False
+        if found[key]:
+            return True
+    return True
+
+
+def read_proof_member(zf: zipfile.ZipFile, info: zipfile.ZipInfo, with_path: bool = False,
+                      decoder: str = 'json') -> tuple:
+    """Decompress a single proof member in memory and parse it.
+
+    decoder is a resolved proof_decoder name. The 'scan' decoder only needs
+    the row fields, so it falls back to a full stdlib decode when the leaf
+    and path are wanted as well.
+    """
+    with zf.open(info) as f:
+        if decoder == 'scan' and not with_path:
+            data = proof_decoder.scan_fields(f, ROW_KEYS, row_fields_known)
+        else:
+            data = proof_decoder.loads(f.read(), 'json' if decoder == 'scan' else decoder)
+    return parse_proof(data, with_path)
+
+
+def verify_row(verifier: ProofVerifier, row: tuple) -> tuple:
+    """Turn a parse_proof(..., with_path=True) row into (id, merkle_root, anchor_tx, verify_status)."""
+    proof_id, merkle_root, anchor_tx, leaf, path = row
+    if not leaf or path is None or merkle_root == 'none':
+        status = 'missing'
+    else:
+        try:
+            status = 'verified' if verifier.verify(leaf, path, merkle_root) else 'mismatch'
+        except (ValueError, TypeError, AttributeError):
+            status = 'malformed'
+    return (proof_id, merkle_root, anchor_tx, status)
+
+
+class MemberError(namedtuple('MemberError', 'error_class message offset')):
+    """Why one proof member could not be read; str() is the exception's message."""
+
+    __slots__ = ()
+
+    def __str__(self):
+        return self.message
+
+    @classmethod
+    def from_exception(cls, e: Exception) -> 'MemberError':
+        # JSONDecodeError reports .pos, UnicodeDecodeError .start
+        offset = getattr(e, 'pos', None)
+        if offset is None:
+            offset = getattr(e, 'start', None)
+        return cls(type(e).__name__, str(e), offset)
+
+
+class TooManyFailures(Exception):
+    """More members failed than --max-failures allows."""
+
+
+def parse_max_failures(value: str) -> tuple:
+    """argparse type for --max-failures: 'N' members or 'P%' of the members, as (count, percent)."""
+    try:
+        if value.endswith('%'):
+            percent = float(value[:-1])
+            if 0 <= percent <= 100:
+                return None, percent
+        elif int(value) >= 0:
+            return int(value), None
+    except ValueError:
+        pass
+    raise argparse.ArgumentTypeError(f"expected a member count or a percentage such as 1%, got {value!r}")
+
+
+def failure_limit(max_failures: tuple, members: int) -> int:
+    """Failed members tolerated out of `members` under --max-failures, or None for no limit."""
+    if max_failures is None:
+        return None
+    count, percent = max_failures
+    return count if percent is None else int(members * percent / 100)
+
+
+def _tsv_field(text: str) -> str:
+    """text with tabs and line breaks blanked out; the common clean case is only scanned."""
+    if '\t' in text or '\n' in text or '\r' in text:
+        return text.replace('\t', ' ').replace('\r', ' ').replace('\n', ' ')
+    return text
+
+
+class Quarantine:
+    """Stream failed members into a TSV sidecar with QUARANTINE_COLUMNS.
+
+    Rows go to a temporary file that replaces `path` on close(), or, with
+    append=True (watch mode), are appended to `path` directly. A run with no
+    failures leaves no sidecar behind (a stale one is removed). Warnings are
+    rate-limited so a mostly-bad bundle costs a handful of console lines,
+    not one per member.
+    """
+
+    def __init__(self, path: str, append: bool = False):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self.count = 0
+        self._append = append
+        self._next_warning = 0.0
+        if append:
+            new = not os.path.exists(path) or os.path.getsize(path) == 0
+            self._out = open(path, 'a', buffering=TSV_BUFFER_SIZE)
+        else:
+            new = True
+            self._out = open(path + '.tmp', 'w', buffering=TSV_BUFFER_SIZE)
+        if new:
+            self._out.write("\t".join(QUARANTINE_COLUMNS) + "\n")
+
+    def add(self, bundle: str, member: str, member_offset: int, error: MemberError) -> None:
+        self.count += 1
+        offset = '' if error.offset is None else error.offset
+        self._out.write(f"{bundle}\t{_tsv_field(member)}\t{member_offset}\t{error.error_class}\t"
+                        f"{offset}\t{_tsv_field(error.message)}\n")
+        if self.count <= WARN_FIRST:
+            print(f"⚠️  Could not parse {bundle}:{member}: {error.error_class}: {error}", flush=True)
+            return
+        now = time.monotonic()
+        if now >= self._next_warning:
+            self._next_warning = now + WARN_INTERVAL
+            print(f"⚠️  {self.count} members quarantined so far; warnings limited to one every "
+                  f"{WARN_INTERVAL:g}s (see {self.path})", flush=True)
+
+    def flush(self) -> None:
+        self._out.flush()
+
+    def close(self) -> None:
+        self._out.close()
+        if self._append:
+            return
+        if self.count:
+            os.replace(self.path + '.tmp', self.path)
+            return
+        os.remove(self.path + '.tmp')
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+# Per-process archive handle opened by _init_worker(); ZipFile objects are not
+# safe to share across processes, so every worker owns its own.
+_worker_zf = None
+_worker_with_path = False
+_worker_decoder = 'json'
+_worker_timed = False
+
+
+def _init_worker(zip_path: str, with_path: bool, decoder: str, timed: bool = False) -> None:
+    global _worker_zf, _worker_with_path, _worker_decoder, _worker_timed
+    _worker_zf = zipfile.ZipFile(zip_path, 'r')
+    _worker_with_path = with_path
+    _worker_decoder = decoder
+    _worker_timed = timed
+
+
+def _parse_member_in_worker(name: str) -> tuple:
+    """Return (row, error, seconds); seconds is None unless the parent is profiling."""
+    start = time.perf_counter() if _worker_timed else None
+    try:
+        row, error = read_proof_member(_worker_zf, name, _worker_with_path, _worker_decoder), None
+    except Exception as e:
+        row, error = None, MemberError.from_exception(e)
+    return row, error, (time.perf_counter() - start if _worker_timed else None)
+
+
+def _iter_timed_members(zf: zipfile.ZipFile, members: list, with_path: bool, decoder: str,
+                        prof: profiling.Profile):
+    """The single-process loop with each member's decompress + decode timed as json_parse."""
+    clock = time.perf_counter
+    for info in members:
+        start = clock()
+        try:
+            row, error = read_proof_member(zf, info, with_path, decoder), None
+        except Exception as e:
+            row, error = None, MemberError.from_exception(e)
+        prof.observe('json_parse', clock() - start)
+        yield info.filename, row, error
+
+
+def _iter_parsed_members(zip_path: str, zf: zipfile.ZipFile, members: list,
+                         workers: int, with_path: bool, decoder: str):
+    prof = profiling.active()
+    if prof is not None:
+        prof.add('members_parsed', len(members))
+        prof.add('bytes_compressed', sum(info.compress_size for info in members))
+        prof.add('bytes_decompressed', sum(info.file_size for info in members))
+
+    if workers <= 1:
+        if prof is not None:
+            yield from _iter_timed_members(zf, members, with_path, decoder, prof)
+            return
+        for info in members:
+            try:
+                yield info.filename, read_proof_member(zf, info, with_path, decoder), None
+            except Exception as e:
+                yield info.filename, None, MemberError.from_exception(e)
+        return
+
+    names = [info.filename for info in members]
+    chunksize = max(1, len(names) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(zip_path, with_path, decoder, prof is not None)) as pool:
+        results = pool.map(_parse_member_in_worker, names, chunksize=chunksize)
+        for name, (row, error, seconds) in zip(names, results):
+            if seconds is not None:
+                prof.observe('json_parse', seconds)
+            yield name, row, error
+
+
+def iter_proof_rows(zip_path: str, zf: zipfile.ZipFile, members: list, workers: int = 1,
+                    verifier: ProofVerifier = None, decoder: str = 'json', with_path: bool = False):
+    """Yield (member_name, row, error) for each member, in member order.
+
+    error is None, or a MemberError for a member that could not be
+    decompressed or parsed (row is then None); one bad member never stops
+    the others.
+
+    With workers > 1 the members are decompressed and decoded in a process
+    pool; results are consumed in submission order so output stays identical
+    to the single-process path. With a verifier, proof paths are checked in
+    this process so the verifier's memo is shared across every proof. With
+    with_path=True every row ends with the proof's sibling path (or None).
+    """
+    parsed = _iter_parsed_members(zip_path, zf, members, workers, verifier is not None or with_path, decoder)
+    if verifier is None and not with_path:
+        yield from parsed
+        return
+    for name, row, error in parsed:
+        if error is not None:
+            yield name, None, error
+            continue
+        out = verify_row(verifier, row) if verifier is not None else row[:3]
+        yield name, (out + (row[4],) if with_path else out), None
+
+
+def iter_cached_proof_rows(zip_path: str, zf: zipfile.ZipFile, members: list,
+                           cache: ProofCache, workers: int = 1, verifier: ProofVerifier = None,
+                           decoder: str = 'json', digests: dict = None):
+    """Like iter_proof_rows(), but serve unchanged members from `cache`.
+
+    Only cache misses are decompressed and parsed; their rows are merged back
+    into member order and stored for the next run. digests (member name ->
+    SHA-256, from the bundle's manifest) key members by content instead of
+    by name.
+    """
+    verified = verifier is not None
+    if digests:
+        keys = [content_key(info, digests[info.filename]) if info.filename in digests else info
+                for info in members]
+    else:
+        keys = members
+    misses = [info for info, key in zip(members, keys) if not cache.has(key, verified)]
+    miss_names = {info.filename for info in misses}
+
+    parsed = iter_proof_rows(zip_path, zf, misses, workers, verifier, decoder)
+    for info, key in zip(members, keys):
+        if info.filename not in miss_names:
+            yield info.filename, cache.get(key, verified), None
+            continue
+        name, row, error = next(parsed)
+        if error is None:
+            cache.put(key, row)
+        yield name, row, error
+
+
+def manifest_digests(zf: zipfile.ZipFile, scan: BundleScan):
+    """Member name -> SHA-256 from the bundle's manifest, or None if it has none.
+
+    The digests only decide cache keys, so an unreadable manifest is ignored
+    with a warning and members are keyed by name, as for any other bundle.
+    """
+    if scan.manifest is None:
+        return None
+    try:
+        with profiling.section('manifest'):
+            return read_manifest(zf, scan.manifest)
+    except (ValueError, zipfile.BadZipFile, zlib.error) as e:
+        print(f"⚠️  Ignoring the bundle manifest: {e}; caching proofs by member name", flush=True)
+        return None
+
+
+def write_tsv(rows, output_tsv: str, sample_size: int = 3, verified: bool = False,
+              extra_columns: tuple = ()) -> tuple:
+    """Stream rows into output_tsv and return (row_count, first_rows).
+
+    Rows go through a large write buffer into a temporary file that replaces
+    output_tsv only once the stream is exhausted, so a failed run never
+    leaves a truncated summary behind.
+    """
+    os.makedirs(os.path.dirname(output_tsv) or '.', exist_ok=True)
+    tmp_path = output_tsv + '.tmp'
+    count = 0
+    sample = []
+    columns = ('id', 'merkle_root', 'anchor_tx') + (('verify_status',) if verified else ()) + extra_columns
+
+    try:
+        with open(tmp_path, 'w', buffering=TSV_BUFFER_SIZE) as out:
+            out.write("\t".join(columns) + "\n")
+            for row in rows:
+                out.write("\t".join(map(str, row)) + "\n")
+                if count < sample_size:
+                    sample.append(row)
+                count += 1
+        os.replace(tmp_path, output_tsv)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return count, sample
+
 
+def read_member_lines(zf: zipfile.ZipFile, info: zipfile.ZipInfo, limit: int,
+                      pattern: re.Pattern = None) -> tuple:
+    """Return (first `limit` lines matching `pattern`, total line count) of a text member."""
+    lines = []
+    total = 0
+    with zf.open(info) as raw:
+        for line in raw:
+            total += 1
+            if len(lines) < limit:
+                text = line.decode('utf-8', errors='replace').rstrip('\r\n')
+                if pattern is None or pattern.search(text):
+                    lines.append(text)
+    return lines, total
 
-def extract_roots(zip_path: str, output_tsv: str) -> None:
-    """Extract proof data from ZIP and write TSV."""
+
+def top_level_entries(zf: zipfile.ZipFile) -> list:
+    """(name, size) of the entries directly inside the bundle directory.
+
+    Bundles are usually zipped as a single blazetv_evidence_*/ directory; in
+    that case the listing starts below it, like `ls $BUNDLE_DIR` would.
+    """
+    infos = zf.infolist()
+    roots = {info.filename.split('/', 1)[0] for info in infos}
+    prefix = ''
+    if len(roots) == 1 and any('/' in info.filename for info in infos):
+        prefix = roots.pop() + '/'
+
+    entries = {}
+    for info in infos:
+        rest = info.filename[len(prefix):]
+        if not rest:
+            continue
+        head, sep, _ = rest.partition('/')
+        if sep:
+            entries.setdefault(head + '/', 0)
+        else:
+            entries[head] = info.file_size
+    return sorted(entries.items())
+
+
+def write_listing(zf: zipfile.ZipFile, path: str) -> None:
+    """Write every member of the bundle as size / CRC32 / modified time / name."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', buffering=TSV_BUFFER_SIZE) as out:
+        out.write("size\tcrc32\tmodified\tname\n")
+        for info in zf.infolist():
+            modified = "%04d-%02d-%02d %02d:%02d" % info.date_time[:5]
+            out.write(f"{info.file_size}\t{info.CRC:08x}\t{modified}\t{info.filename}\n")
+
+
+def build_validation_report(zip_path: str, zf: zipfile.ZipFile, scan: BundleScan,
+                            count: int, sample: list, reconcile: tuple = None) -> str:
+    """Render the validation report CI posts as validation_output.txt."""
+    lines = [f"🔍 Evidence bundle validation: {os.path.basename(zip_path)}", "", "Top-level files:"]
+    for name, size in top_level_entries(zf):
+        lines.append(f"  {name:<50} {size:>10}")
+
+    if scan.harness is not None:
+        harness_lines, total = read_member_lines(zf, scan.harness, REPORT_HEAD_LINES, HARNESS_LINE_RE)
+        lines += ["", "🔍 Harness output (merkle/anchor):"] + harness_lines
+        lines.append(f"Total lines in harness_output.txt: {total}")
+
+    lines += ["", f"📊 Proofs summary ({count} proofs"
+                  f"{'' if scan.has_proofs_dir else ', no proofs/ directory'}):"]
+    lines += ["\t".join(map(str, row)) for row in sample[:REPORT_SAMPLE_ROWS]]
+    if count > REPORT_SAMPLE_ROWS:
+        lines.append(f"... and {count - REPORT_SAMPLE_ROWS} more (see proof summary TSV)")
+
+    if scan.db_table is not None:
+        db_lines, total = read_member_lines(zf, scan.db_table, REPORT_HEAD_LINES)
+        lines += ["", "📋 DB proofs (sample):"] + db_lines
+        lines.append(f"Total lines in proofs_table.txt: {total}")
+
+    if reconcile is not None:
+        lines += ["", "🔄 Merkle root comparison:"] + format_report(*reconcile)
+
+    return "\n".join(lines) + "\n"
+
+
+def extract_roots(zip_path: str, output_tsv: str, workers: int = 1,
+                  cache_path: str = None, cache_max_entries: int = DEFAULT_MAX_ENTRIES,
+                  verify: bool = False, report_path: str = None,
+                  listing_path: str = None, decoder: str = 'auto',
+                  binary_path: str = None, index_path: str = None, store_path: str = None,
+                  anchors_path: str = None, integrity_path: str = None,
+                  max_failures: tuple = None, quarantine_path: str = None) -> None:
+    """Extract proof data from ZIP and write TSV.
+
+    Proof members are read straight out of the archive with zf.open() and
+    each parsed row is written as soon as it is produced, so memory use does
+    not grow with the number of proofs and nothing but the outputs touch disk.
+    With report_path, the same stream also feeds the reconciliation against
+    db/proofs_table.txt and the validation report is written from it, and
+    with binary_path it is also written as a binary summary. With index_path,
+    each parsed member is also recorded in a bundle index (bundle_index.py),
+    with store_path every proof is upserted into a local proofs table
+    (proof_store.py) in one transaction, and with anchors_path the rows are
+    aggregated by anchor transaction into a JSON report (anchor_report.py).
+    With integrity_path the bundle is first checked member by member
+    (bundle_integrity.py, on `workers` processes, or one per CPU when
+    workers is 1) and nothing is extracted unless every member's CRC-32 and
+    sizes match.
+
+    Members that cannot be decompressed or parsed are skipped and listed in
+    quarantine_path (default <output_tsv>.quarantine). max_failures is a
+    parse_max_failures() (count, percent) limit: one failure beyond it stops
+    the run with no summary written.
+    """
     
     if not os.path.isfile(zip_path):
         print(f"❌ ZIP file not found: {zip_path}")
         sys.exit(1)
     
-    proofs_data = []
+    try:
+        decoder = proof_decoder.resolve(decoder)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    
+    if integrity_path:
+        with profiling.section('integrity'):
+            # The serial default of --workers would leave the CRC check on one core
+            integrity = bundle_integrity.check_bundle(zip_path, workers if workers > 1 else None)
+        bundle_integrity.write_report(integrity, integrity_path)
+        print(bundle_integrity.format_report(integrity))
+        print(f"🛡️  Integrity report written to {integrity_path}")
+        prof = profiling.active()
+        if prof is not None:
+            prof.add('integrity_members_checked', integrity['checked'])
+            prof.add('integrity_bytes', integrity['size'])
+        if not integrity['ok']:
+            sys.exit(1)
+    
+    quarantine = Quarantine(quarantine_path or output_tsv + QUARANTINE_SUFFIX)
+    bundle = os.path.basename(zip_path)
     
     try:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            print(f"📦 Extracting {zip_path}...")
+        print(f"📦 Reading {zip_path}...")
+        
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            with profiling.section('scan'):
+                scan = BundleScan(zf)
+            members = scan.members
+            prof = profiling.active()
+            if prof is not None:
+                prof.add('zip_entries', len(zf.infolist()))
+                prof.add('members_scanned', len(members))
             
-            with zipfile.ZipFile(zip_path, 'r') as zf:
-                zf.extractall(tmpdir)
+            if not scan.has_proofs_dir:
+                print(f"⚠️  No 'proofs' directory in ZIP. Checking for JSON files...")
+            else:
+                print(f"📂 Found proofs directory. Extracting {len(members)} proof files...")
             
-            proofs_dir = Path(tmpdir) / 'proofs'
+            verifier = ProofVerifier() if verify else None
+            status_counts = {}
             
-            if not proofs_dir.exists():
-                print(f"⚠️  No 'proofs' directory in ZIP. Checking for JSON files...")
-                # Look for any .json files in the ZIP
-                for json_file in Path(tmpdir).glob('**/*.json'):
-                    try:
-                        with open(json_file, 'r') as f:
-                            data = json.load(f)
-                            proof_id = data.get('match_id') or data.get('id') or data.get('video_id') or 'unknown'
-                            merkle_root = data.get('merkle_root') or 'none'
-                            anchor_tx = data.get('anchor_tx') or 'pending'
-                            proofs_data.append((proof_id, merkle_root, anchor_tx))
-                    except json.JSONDecodeError as e:
-                        print(f"⚠️  Could not parse {json_file}: {e}")
+            reconciler = None
+            if report_path and scan.has_proofs_dir and scan.db_table is not None:
+                reconciler = Reconciler(load_db_index(zf, scan.db_table))
+            
+            if cache_path:
+                cache = ProofCache(cache_path, cache_max_entries)
+                results = iter_cached_proof_rows(zip_path, zf, members, cache, workers, verifier, decoder,
+                                                 manifest_digests(zf, scan))
             else:
-                print(f"📂 Found proofs directory. Extracting {len(list(proofs_dir.glob('*.json')))} proof files...")
-                
-                for proof_file in sorted(proofs_dir.glob('*.json')):
-                    try:
-                        with open(proof_file, 'r') as f:
-                            data = json.load(f)
-                            proof_id = data.get('match_id') or data.get('id') or data.get('video_id') or 'unknown'
-                            merkle_root = data.get('merkle_root') or 'none'
-                            anchor_tx = data.get('anchor_tx') or 'pending'
-                            proofs_data.append((proof_id, merkle_root, anchor_tx))
-                    except json.JSONDecodeError as e:
-                        print(f"⚠️  Could not parse {proof_file}: {e}")
+                cache = None
+                results = iter_proof_rows(zip_path, zf, members, workers, verifier, decoder,
+                                          with_path=store_path is not None)
             
-            # Write TSV output
-            os.makedirs(os.path.dirname(output_tsv) or '.', exist_ok=True)
+            binary = SummaryWriter(binary_path, verified=verify) if binary_path else None
+            index = IndexWriter(index_path, zip_path) if index_path else None
+            store = ProofStore(store_path) if store_path else None
+            anchors = AnchorAggregator() if anchors_path else None
+            limit = failure_limit(max_failures, len(members))
             
-            with open(output_tsv, 'w') as out:
-                out.write("id\tmerkle_root\tanchor_tx\n")
-                for proof_id, merkle_root, anchor_tx in proofs_data:
-                    out.write(f"{proof_id}\t{merkle_root}\t{anchor_tx}\n")
+            def rows():
+                for info, (name, row, error) in zip(members, results):
+                    if error is not None:
+                        quarantine.add(bundle, name, info.header_offset, error)
+                        if prof is not None:
+                            prof.add('parse_errors')
+                        if limit is not None and quarantine.count > limit:
+                            raise TooManyFailures(f"more than {limit} of {len(members)} proof files "
+                                                  f"could not be parsed")
+                        continue
+                    if store is not None:
+                        store.add(row[:-1], row[-1])
+                        row = row[:-1]
+                    if verify:
+                        status_counts[row[3]] = status_counts.get(row[3], 0) + 1
+                    if reconciler is not None:
+                        reconciler.feed(row)
+                    if binary is not None:
+                        binary.write(row)
+                    if index is not None:
+                        index.add(info, row)
+                    if anchors is not None:
+                        anchors.add(row)
+                    yield row
             
-            print(f"✅ Extracted {len(proofs_data)} proofs")
-            print(f"💾 Written to {output_tsv}")
+            try:
+                with profiling.section('extract'):
+                    count, sample = write_tsv(rows(), output_tsv, verified=verify,
+                                              sample_size=REPORT_SAMPLE_ROWS if report_path else 3)
+            except BaseException:
+                if binary is not None:
+                    binary.discard()
+                if store is not None:
+                    store.discard()
+                raise
             
-            if proofs_data:
-                print(f"\n📊 Sample proofs:")
-                for proof_id, merkle_root, anchor_tx in proofs_data[:3]:
-                    print(f"  ID: {proof_id}")
-                    print(f"    Merkle: {merkle_root[:20]}...")
-                    print(f"    AnchorTX: {anchor_tx[:20]}...")
+            if binary is not None:
+                binary.close()
+                print(f"🧱 Binary summary written to {binary_path}")
+            
+            if index is not None:
+                index.close()
+                print(f"🔎 Bundle index written to {index_path}")
+            
+            if store is not None:
+                with profiling.section('store_commit'):
+                    stored = store.close()
+                print(f"🗄️  Proof store: {stored} proofs loaded into {store_path} "
+                      f"({store.inserted} new, {stored - store.inserted} updated)")
+                if prof is not None:
+                    prof.add('store_inserted', store.inserted)
+                    prof.add('store_updated', stored - store.inserted)
+            
+            if cache is not None:
+                cache.close()
+                print(f"🗃️  Cache: {cache.hits} hits, {cache.misses} misses ({cache_path})")
+            
+            if anchors is not None:
+                anchor_report = anchors.report()
+                write_report(anchor_report, anchors_path)
+                print(format_anchor_report(anchor_report))
+                print(f"⚓ Anchor report written to {anchors_path}")
+            
+            if prof is not None:
+                prof.add('rows_written', count)
+                if cache is not None:
+                    prof.add('cache_hits', cache.hits)
+                    prof.add('cache_misses', cache.misses)
+                if verify:
+                    prof.add('verify_paths', verifier.proofs)
+                    prof.add('verify_hashes', verifier.hashes)
+                    prof.add('verify_hashes_shared', verifier.shared)
+            
+            if report_path:
+                with profiling.section('report'):
+                    reconcile = (reconciler.finish(), reconciler.index) if reconciler else None
+                    report = build_validation_report(zip_path, zf, scan, count, sample, reconcile)
+                    os.makedirs(os.path.dirname(report_path) or '.', exist_ok=True)
+                    with open(report_path, 'w') as f:
+                        f.write(report)
+                print(f"📝 Validation report written to {report_path}")
+            
+            if listing_path:
+                with profiling.section('listing'):
+                    write_listing(zf, listing_path)
+                print(f"🗂️  Bundle listing written to {listing_path}")
+        
+        print(f"✅ Extracted {count} proofs")
+        print(f"💾 Written to {output_tsv}")
+        if quarantine.count:
+            print(f"🚧 {quarantine.count} unparseable proof files quarantined in {quarantine.path}")
+        
+        if verify:
+            summary = ", ".join(f"{n} {status}" for status, n in sorted(status_counts.items()))
+            print(f"🔐 Verification: {summary or 'no proofs'}")
+            if verifier.proofs:
+                print(f"   {verifier.proofs} paths walked: {verifier.hashes} hashes computed, "
+                      f"{verifier.shared} shared with earlier proofs, "
+                      f"{verifier.seconds / verifier.proofs * 1e6:.1f} µs/proof")
+        
+        if sample:
+            print(f"\n📊 Sample proofs:")
+            for proof_id, merkle_root, anchor_tx, *_ in sample[:3]:
+                print(f"  ID: {proof_id}")
+                print(f"    Merkle: {merkle_root[:20]}...")
+                print(f"    AnchorTX: {anchor_tx[:20]}...")
     
+    except TooManyFailures as e:
+        print(f"❌ {e} (--max-failures); no summary written, failures listed in {quarantine.path}")
+        sys.exit(1)
     except zipfile.BadZipFile:
         print(f"❌ Invalid ZIP file: {zip_path}")
         sys.exit(1)
     except Exception as e:
         print(f"❌ Error extracting roots: {e}")
         sys.exit(1)
+    finally:
+        quarantine.close()
 
 
-if __name__ == '__main__':
-    if len(sys.argv) != 3:
-        print(f"Usage: {sys.argv[0]} <evidence_zip_path> <output_summary.tsv>")
+def expand_bundles(patterns: list) -> list:
+    """Expand glob patterns and return the distinct bundle paths, sorted."""
+    paths = set()
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            paths.update(glob.glob(pattern))
+        else:
+            paths.add(pattern)
+    return sorted(os.path.normpath(p) for p in paths)
+
+
+def dedup_key(proof_id: str, merkle_root: str) -> bytes:
+    """Fixed-size digest of (id, merkle_root); roots compare case-insensitively."""
+    key = f"{proof_id}\t{merkle_root.lower()}".encode()
+    return hashlib.blake2b(key, digest_size=DEDUP_KEY_SIZE).digest()
+
+
+# Watch mode: each worker keeps its ProofCache open between bundles
+_worker_cache = None
+
+
+def _warm_cache(cache_path: str, cache_max_entries: int) -> ProofCache:
+    global _worker_cache
+    if _worker_cache is None or _worker_cache.path != cache_path:
+        _worker_cache = ProofCache(cache_path, cache_max_entries)
+    return _worker_cache
+
+
+def _ignore_sigint() -> None:
+    """Pool initializer for watch mode: Ctrl-C stops the watcher, not its workers."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _extract_bundle_part(job: tuple) -> tuple:
+    """Stream one bundle's rows into a part file as member<TAB>row lines.
+
+    Runs in a batch worker; returns (row_count, failures, profile_state) where
+    failures lists (member, header_offset, MemberError) for every member that
+    could not be parsed, for the parent to quarantine. profile_state is the worker's own Profile.state() when `profiled` is set
+    (the parent is profiling and this job runs in another process), else None.
+    With `keep_cache` (watch mode) the worker's cache stays open for the next
+    bundle and is only flushed.
+    """
+    zip_path, part_path, verify, decoder, cache_path, cache_max_entries, profiled, keep_cache = job
+    prof = profiling.start('extract_bundle') if profiled else profiling.active()
+    count = 0
+    failures = []
+    try:
+        with zipfile.ZipFile(zip_path, 'r') as zf, \
+                open(part_path, 'w', buffering=TSV_BUFFER_SIZE) as out:
+            scan = BundleScan(zf)
+            members = scan.members
+            verifier = ProofVerifier() if verify else None
+            if not cache_path:
+                cache = None
+            elif keep_cache:
+                cache = _warm_cache(cache_path, cache_max_entries)
+            else:
+                cache = ProofCache(cache_path, cache_max_entries)
+            if cache is not None:
+                hits, misses = cache.hits, cache.misses
+                results = iter_cached_proof_rows(zip_path, zf, members, cache, 1, verifier, decoder,
+                                                 manifest_digests(zf, scan))
+            else:
+                results = iter_proof_rows(zip_path, zf, members, 1, verifier, decoder)
+
+            for info, (name, row, error) in zip(members, results):
+                if error is not None:
+                    failures.append((name, info.header_offset, error))
+                    continue
+                out.write(name + "\t" + "\t".join(map(str, row)) + "\n")
+                count += 1
+
+            if cache is not None:
+                if keep_cache:
+                    cache.flush()
+                else:
+                    cache.close()
+                if prof is not None:
+                    prof.add('cache_hits', cache.hits - hits)
+                    prof.add('cache_misses', cache.misses - misses)
+    except zipfile.BadZipFile as e:
+        # Name the bundle: the error surfaces in the parent process
+        raise zipfile.BadZipFile(f"{zip_path} ({e})") from None
+    return count, failures, (prof.state() if profiled else None)
+
+
+def extract_batch(zip_paths: list, output_tsv: str, workers: int = 1,
+                  cache_path: str = None, cache_max_entries: int = DEFAULT_MAX_ENTRIES,
+                  verify: bool = False, decoder: str = 'auto', max_failures: tuple = None,
+                  quarantine_path: str = None) -> None:
+    """Extract many bundles concurrently into one deduplicated TSV.
+
+    Each bundle streams its rows to a part file on disk; parts are merged in
+    bundle order as they complete, and a row is written only the first time
+    its (id, merkle_root) is seen. The set of dedup digests is the only
+    state that grows with the input. Unparseable members of every bundle go
+    to one quarantine (quarantine_path, default <output_tsv>.quarantine);
+    max_failures applies to the failures across all bundles, a percentage
+    to all of their members.
+    """
+
+    missing = [p for p in zip_paths if not os.path.isfile(p)]
+    if not zip_paths or missing:
+        print(f"❌ ZIP file not found: {', '.join(missing) or 'no bundles matched'}")
+        sys.exit(1)
+
+    try:
+        decoder = proof_decoder.resolve(decoder)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print(f"📦 Reading {len(zip_paths)} bundles with {min(workers, len(zip_paths))} workers...")
+    seen = set()
+    totals = {'rows': 0, 'duplicates': 0, 'errors': 0}
+    quarantine = Quarantine(quarantine_path or output_tsv + QUARANTINE_SUFFIX)
+    # A count can be checked as failures arrive; a percentage needs every bundle's members
+    limit = max_failures[0] if max_failures is not None else None
+
+    try:
+        with tempfile.TemporaryDirectory(prefix='extract_roots_') as tmpdir:
+            parts = [os.path.join(tmpdir, f"{i:06d}.part") for i in range(len(zip_paths))]
+            prof = profiling.active()
+            profiled = prof is not None and workers > 1
+            jobs = [(zip_path, part, verify, decoder, cache_path, cache_max_entries, profiled, False)
+                    for zip_path, part in zip(zip_paths, parts)]
+
+            def rows(results):
+                for zip_path, part, (count, failures, state) in zip(zip_paths, parts, results):
+                    if state is not None:
+                        prof.merge(state)
+                    bundle = os.path.basename(zip_path)
+                    errors = len(failures)
+                    for name, header_offset, error in failures:
+                        quarantine.add(bundle, name, header_offset, error)
+                    if limit is not None and quarantine.count > limit:
+                        raise TooManyFailures(f"more than {limit} proof files could not be parsed")
+                    unique = 0
+                    with open(part, buffering=TSV_BUFFER_SIZE) as f:
+                        for line in f:
+                            member, *row = line.rstrip('\n').split('\t')
+                            key = dedup_key(row[0], row[1])
+                            if key in seen:
+                                continue
+                            seen.add(key)
+                            unique += 1
+                            yield (*row, bundle, member)
+                    os.remove(part)
+                    totals['rows'] += count
+                    totals['duplicates'] += count - unique
+                    totals['errors'] += errors
+                    print(f"  📂 {bundle}: {count} proofs, {unique} new"
+                          f"{f', {errors} unparseable' if errors else ''}")
+                members = totals['rows'] + totals['errors']
+                allowed = failure_limit(max_failures, members)
+                if allowed is not None and quarantine.count > allowed:
+                    raise TooManyFailures(f"more than {allowed} of {members} proof files could not be parsed")
+
+            with profiling.section('merge'):
+                if workers <= 1:
+                    count, sample = write_tsv(rows(map(_extract_bundle_part, jobs)), output_tsv,
+                                              verified=verify, extra_columns=PROVENANCE_COLUMNS)
+                else:
+                    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+                        try:
+                            count, sample = write_tsv(rows(pool.map(_extract_bundle_part, jobs)), output_tsv,
+                                                      verified=verify, extra_columns=PROVENANCE_COLUMNS)
+                        except TooManyFailures:
+                            # Bundles not yet handed to a worker can no longer change the outcome
+                            pool.shutdown(cancel_futures=True)
+                            raise
+
+        errors = totals['errors']
+        if prof is not None:
+            prof.add('bundles', len(zip_paths))
+            prof.add('rows_read', totals['rows'])
+            prof.add('duplicates_dropped', totals['duplicates'])
+            prof.add('parse_errors', errors)
+            prof.add('rows_written', count)
+        print(f"✅ Merged {totals['rows']} proofs from {len(zip_paths)} bundles into {count} rows "
+              f"({totals['duplicates']} duplicate (id, merkle_root) dropped"
+              f"{f', {errors} unparseable' if errors else ''})")
+        print(f"💾 Written to {output_tsv}")
+        if errors:
+            print(f"🚧 {errors} unparseable proof files quarantined in {quarantine.path}")
+
+        if sample:
+            print(f"\n📊 Sample proofs:")
+            for proof_id, merkle_root, *_, bundle, member in sample[:3]:
+                print(f"  ID: {proof_id}")
+                print(f"    Merkle: {merkle_root[:20]}...")
+                print(f"    Source: {bundle}:{member}")
+
+    except TooManyFailures as e:
+        print(f"❌ {e} (--max-failures); no summary written, failures listed in {quarantine.path}")
+        sys.exit(1)
+    except zipfile.BadZipFile as e:
+        print(f"❌ Invalid ZIP file: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"❌ Error extracting roots: {e}")
+        sys.exit(1)
+    finally:
+        quarantine.close()
+
+
+def summary_columns(verify: bool) -> tuple:
+    """Columns of a batch or watch summary."""
+    return ('id', 'merkle_root', 'anchor_tx') + (('verify_status',) if verify else ()) + PROVENANCE_COLUMNS
+
+
+def read_watch_state(output_tsv: str, verify: bool) -> tuple:
+    """Resume a watched summary: (dedup digests of its rows, bundles already done).
+
+    Done bundles come from the journal next to the summary, as
+    name -> (size, mtime_ns); a bundle that was being appended when the
+    watcher stopped is not in it and is processed again, and the seeded
+    digests keep its rows from being written twice.
+    """
+    seen = set()
+    done = {}
+    if os.path.exists(output_tsv):
+        with open(output_tsv, buffering=TSV_BUFFER_SIZE) as f:
+            header = f.readline().rstrip('\n')
+            if header and tuple(header.split('\t')) != summary_columns(verify):
+                raise ValueError(f"{output_tsv} has columns {header.split(chr(9))}; "
+                                 f"expected {list(summary_columns(verify))}")
+            for line in f:
+                row = line.rstrip('\n').split('\t')
+                if len(row) >= 2:
+                    seen.add(dedup_key(row[0], row[1]))
+    journal = output_tsv + WATCH_JOURNAL_SUFFIX
+    if os.path.exists(journal):
+        with open(journal) as f:
+            f.readline()
+            for line in f:
+                name, size, mtime_ns, *_ = line.rstrip('\n').split('\t')
+                done[name] = (int(size), int(mtime_ns))
+    return seen, done
+
+
+def _raise_interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def watch_bundles(directory: str, output_tsv: str, workers: int = 1,
+                  cache_path: str = None, cache_max_entries: int = DEFAULT_MAX_ENTRIES,
+                  verify: bool = False, decoder: str = 'auto', interval: float = WATCH_INTERVAL,
+                  idle_timeout: float = None, max_failures: tuple = None,
+                  quarantine_path: str = None) -> None:
+    """Validate bundles as they land in `directory`, appending to one summary.
+
+    Every `interval` seconds the directory is polled for WATCH_PATTERN; a
+    bundle is submitted once its size and mtime are unchanged across two
+    polls (so half-copied files are left alone). A process pool started once
+    extracts bundles as in batch mode, each worker keeping its proof cache
+    open between bundles, and the parent keeps the dedup digests of every row
+    written so far. Each finished bundle's new rows are appended and synced
+    to output_tsv, then the bundle is logged to the <output_tsv>.bundles
+    journal. A restart resumes from the summary and the journal; a bundle
+    replaced under the same name is processed again. Runs until interrupted,
+    or until nothing has happened for idle_timeout seconds.
+
+    Unparseable members are appended to quarantine_path (default
+    <output_tsv>.quarantine). max_failures applies to each bundle on its
+    own: a bundle over it adds no rows and is journaled as TooManyFailures.
+    """
+
+    if not os.path.isdir(directory):
+        print(f"❌ Watch directory not found: {directory}")
         sys.exit(1)
+
+    try:
+        decoder = proof_decoder.resolve(decoder)
+        seen, done = read_watch_state(output_tsv, verify)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    prof = profiling.active()
+    journal_path = output_tsv + WATCH_JOURNAL_SUFFIX
+    pattern = os.path.join(directory, WATCH_PATTERN)
+    totals = {'bundles': 0, 'rows': 0, 'new': 0, 'errors': 0, 'failed': 0}
+    pending = {}
+    running = {}
+    part_ids = itertools.count()
+    signal.signal(signal.SIGTERM, _raise_interrupt)
+
+    print(f"👀 Watching {pattern} with {workers} workers "
+          f"({len(seen)} rows and {len(done)} bundles already in {output_tsv})...")
+    os.makedirs(os.path.dirname(output_tsv) or '.', exist_ok=True)
+    new_summary = not os.path.exists(output_tsv) or os.path.getsize(output_tsv) == 0
+    new_journal = not os.path.exists(journal_path)
+
+    quarantine = Quarantine(quarantine_path or output_tsv + QUARANTINE_SUFFIX, append=True)
+
+    with tempfile.TemporaryDirectory(prefix='extract_roots_watch_') as tmpdir, \
+            open(output_tsv, 'a', buffering=TSV_BUFFER_SIZE) as out, \
+            open(journal_path, 'a') as journal, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_ignore_sigint) as pool:
+        if new_summary:
+            out.write("\t".join(summary_columns(verify)) + "\n")
+        if new_journal:
+            journal.write("\t".join(WATCH_JOURNAL_COLUMNS) + "\n")
+            journal.flush()
+
+        def append(future, zip_path: str, stamp: tuple, part: str) -> None:
+            bundle = os.path.basename(zip_path)
+            try:
+                count, failures, state = future.result()
+            except Exception as e:
+                # A bad bundle must not stop the watcher; it is retried only if it changes
+                print(f"  ❌ {bundle}: {e}")
+                totals['failed'] += 1
+                journal.write(f"{bundle}\t{stamp[0]}\t{stamp[1]}\t0\t0\t0\t{type(e).__name__}\n")
+                journal.flush()
+                done[bundle] = stamp
+                return
+            if state is not None:
+                prof.merge(state)
+            errors = len(failures)
+            for name, header_offset, error in failures:
+                quarantine.add(bundle, name, header_offset, error)
+            quarantine.flush()
+            limit = failure_limit(max_failures, count + errors)
+            if limit is not None and errors > limit:
+                print(f"  ❌ {bundle}: {errors} of {count + errors} proof files could not be parsed, "
+                      f"more than --max-failures allows; no rows added")
+                os.remove(part)
+                totals['failed'] += 1
+                totals['errors'] += errors
+                journal.write(f"{bundle}\t{stamp[0]}\t{stamp[1]}\t{count}\t0\t{errors}\tTooManyFailures\n")
+                journal.flush()
+                done[bundle] = stamp
+                return
+            unique = 0
+            with open(part, buffering=TSV_BUFFER_SIZE) as f:
+                for line in f:
+                    member, *row = line.rstrip('\n').split('\t')
+                    key = dedup_key(row[0], row[1])
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    unique += 1
+                    out.write("\t".join((*row, bundle, member)) + "\n")
+            os.remove(part)
+            out.flush()
+            os.fsync(out.fileno())
+            journal.write(f"{bundle}\t{stamp[0]}\t{stamp[1]}\t{count}\t{unique}\t{errors}\tok\n")
+            journal.flush()
+            done[bundle] = stamp
+            totals['bundles'] += 1
+            totals['rows'] += count
+            totals['new'] += unique
+            totals['errors'] += errors
+            print(f"  📂 {bundle}: {count} proofs, {unique} new"
+                  f"{f', {errors} unparseable' if errors else ''}", flush=True)
+
+        idle_since = time.monotonic()
+        try:
+            while True:
+                submitted = {path for path, _, _ in running.values()}
+                for zip_path in sorted(glob.glob(pattern)):
+                    try:
+                        st = os.stat(zip_path)
+                    except FileNotFoundError:
+                        continue
+                    stamp = (st.st_size, st.st_mtime_ns)
+                    if zip_path in submitted or done.get(os.path.basename(zip_path)) == stamp:
+                        continue
+                    if pending.get(zip_path) != stamp:
+                        pending[zip_path] = stamp
+                        continue
+                    del pending[zip_path]
+                    part = os.path.join(tmpdir, f"{next(part_ids):06d}.part")
+                    job = (zip_path, part, verify, decoder, cache_path, cache_max_entries, prof is not None, True)
+                    running[pool.submit(_extract_bundle_part, job)] = (zip_path, stamp, part)
+
+                if running:
+                    finished, _ = wait(running, timeout=interval, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        append(future, *running.pop(future))
+                else:
+                    time.sleep(interval)
+
+                if running or pending:
+                    idle_since = time.monotonic()
+                elif idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout:
+                    print(f"💤 No new bundles for {idle_timeout:g}s; stopping")
+                    break
+        except KeyboardInterrupt:
+            print(f"\n🛑 Stopping; {len(running)} bundles in progress will be picked up on restart")
+            for future in running:
+                future.cancel()
+
+    if prof is not None:
+        prof.add('bundles', totals['bundles'])
+        prof.add('bundles_failed', totals['failed'])
+        prof.add('rows_read', totals['rows'])
+        prof.add('duplicates_dropped', totals['rows'] - totals['new'])
+        prof.add('parse_errors', totals['errors'])
+        prof.add('rows_written', totals['new'])
+    quarantine.close()
+    errors, failed = totals['errors'], totals['failed']
+    print(f"✅ Watched {totals['bundles']} bundles: {totals['rows']} proofs, {totals['new']} new rows"
+          f"{f', {errors} unparseable' if errors else ''}{f', {failed} bundles failed' if failed else ''}")
+    print(f"💾 Appended to {output_tsv} (journal: {journal_path})")
+    if errors:
+        print(f"🚧 {errors} unparseable proof files quarantined in {quarantine.path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Extract merkle roots and anchor transactions from an evidence bundle.")
+    parser.add_argument('zip_paths', nargs='+', metavar='evidence_zip_path')
+    parser.add_argument('output_tsv', metavar='output_summary.tsv')
+    parser.add_argument('--batch', action='store_true',
+                        help="treat every evidence_zip_path as a bundle or glob and write one merged, "
+                             "deduplicated summary with provenance columns")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="number of processes used to parse proof files, or bundles in --batch mode (default: 1)")
+    parser.add_argument('--cache', metavar='PATH',
+                        help="SQLite cache of parsed rows keyed by member name, CRC32 and size")
+    parser.add_argument('--cache-max-entries', type=int, default=DEFAULT_MAX_ENTRIES,
+                        help=f"evict least recently used rows beyond this count (default: {DEFAULT_MAX_ENTRIES})")
+    parser.add_argument('--verify', action='store_true',
+                        help="recompute each proof's path to its merkle_root and add a verify_status column")
+    parser.add_argument('--decoder', choices=proof_decoder.DECODERS, default='auto',
+                        help="JSON backend for proof files (default: auto = orjson if installed, else json)")
+    parser.add_argument('--report', metavar='PATH',
+                        help="write the validation report (harness, proofs, DB sample, reconciliation)")
+    parser.add_argument('--listing', metavar='PATH',
+                        help="write a size/CRC32/date listing of every bundle member")
+    parser.add_argument('--binary', metavar='PATH',
+                        help="also write the summary in the memory-mappable binary format (proof_summary.py)")
+    parser.add_argument('--index', metavar='PATH',
+                        help="also write a random-access index of proof IDs and merkle roots (bundle_index.py)")
+    parser.add_argument('--store', metavar='PATH',
+                        help="also upsert every proof into a SQLite proofs table on (match_id, merkle_root) "
+                             "(proof_store.py)")
+    parser.add_argument('--anchors', metavar='PATH',
+                        help="also write proofs per anchor transaction and the pending batch as JSON "
+                             "(anchor_report.py)")
+    parser.add_argument('--integrity', metavar='PATH',
+                        help="first check every member's CRC-32 and sizes and hash the bundle; write the "
+                             "result as JSON and stop if any member is bad (bundle_integrity.py; uses --workers "
+                             "processes, or one per CPU without --workers)")
+    parser.add_argument('--watch', action='store_true',
+                        help="keep running: extract every bundle that lands in the evidence_zip_path "
+                             "directory and append it to the summary")
+    parser.add_argument('--interval', type=float, default=WATCH_INTERVAL,
+                        help=f"--watch: seconds between directory polls (default: {WATCH_INTERVAL:g})")
+    parser.add_argument('--idle-timeout', type=float, metavar='SECONDS',
+                        help="--watch: exit after this long without a new bundle (default: run until stopped)")
+    parser.add_argument('--profile', metavar='PATH',
+                        help="write stage timings and counters (members, bytes, parse time, rows) as JSON")
+    parser.add_argument('--max-failures', type=parse_max_failures, metavar='LIMIT',
+                        help="fail the run once more than LIMIT proof files cannot be parsed: a count, or a "
+                             "percentage such as 1%% (default: no limit; --watch: per bundle)")
+    parser.add_argument('--quarantine', metavar='PATH',
+                        help=f"where to list proof files that cannot be parsed "
+                             f"(default: <output_summary.tsv>{QUARANTINE_SUFFIX})")
+    args = parser.parse_intermixed_args()
+    
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.store and args.cache:
+        parser.error("--store needs every proof's sibling path, which --cache does not keep")
+    
+    if args.profile:
+        profiling.start('extract_roots')
     
-    zip_path = sys.argv[1]
-    output_tsv = sys.argv[2]
+    if args.watch:
+        if (args.batch or len(args.zip_paths) > 1 or args.report or args.listing or args.binary
+                or args.index or args.store or args.anchors or args.integrity):
+            parser.error("--watch takes one directory and cannot be combined with --batch, --report, "
+                         "--listing, --binary, --index, --store, --anchors or --integrity")
+        if args.interval <= 0:
+            parser.error("--interval must be positive")
+        watch_bundles(args.zip_paths[0], args.output_tsv, workers=args.workers,
+                      cache_path=args.cache, cache_max_entries=args.cache_max_entries,
+                      verify=args.verify, decoder=args.decoder, interval=args.interval,
+                      idle_timeout=args.idle_timeout, max_failures=args.max_failures,
+                      quarantine_path=args.quarantine)
+    elif args.batch or len(args.zip_paths) > 1:
+        if (args.report or args.listing or args.binary or args.index or args.store or args.anchors
+                or args.integrity):
+            parser.error("--report, --listing, --binary, --index, --store, --anchors and --integrity apply to a single bundle and cannot be used with --batch")
+        extract_batch(expand_bundles(args.zip_paths), args.output_tsv, workers=args.workers,
+                      cache_path=args.cache, cache_max_entries=args.cache_max_entries,
+                      verify=args.verify, decoder=args.decoder, max_failures=args.max_failures,
+                      quarantine_path=args.quarantine)
+    else:
+        extract_roots(args.zip_paths[0], args.output_tsv, workers=args.workers,
+                      cache_path=args.cache, cache_max_entries=args.cache_max_entries,
+                      verify=args.verify, report_path=args.report, listing_path=args.listing,
+                      decoder=args.decoder, binary_path=args.binary, index_path=args.index,
+                      store_path=args.store, anchors_path=args.anchors, integrity_path=args.integrity,
+                      max_failures=args.max_failures, quarantine_path=args.quarantine)
     
-    extract_roots(zip_path, output_tsv)
+    if args.profile:
+        profiling.finish(args.profile)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,197 +3,38 @@
 generate_counsel_email.py
 
 Generate a counsel/PSP email for blockchain evidence validation.
-Reads proof_summary.tsv and crafts a professional email with merkle roots and anchor TXs.
+Reads proof_summary.tsv (or the binary proof_summary.psum written by
+extract_roots.py --binary, or the evidence zip itself) and crafts a
+professional email with merkle roots and anchor TXs.
+
+The email body comes from a pluggable generator (counsel_email package):
+  template  deterministic template email, no LLM or API required (default)
+  hf        Hugging Face Inference API (HF_API_KEY, HF_MODEL); --deadline
+            falls back to the template email if the model is slow or fails
+  cached    model emails from earlier hf runs' response cache, no network;
+            uncached prompts get the template email
 
 Usage:
-  python3 scripts/generate_counsel_email.py <proof_summary.tsv> <output_email.txt>
+  python3 scripts/generate_counsel_email.py <proof_summary.tsv|.psum|.zip> <output_email.txt>
+  python3 scripts/generate_counsel_email.py --recipients <recipients.tsv> <proof_summary.tsv|.psum> <output_dir>
+  python3 scripts/generate_counsel_email.py --generator hf [--deadline SECONDS] [--metrics PATH] \
+      <proof_summary.tsv> <output_email.txt>
 
 Example:
   python3 scripts/generate_counsel_email.py artifacts/proof_summary.tsv generated_counsel_email.txt
-"""
-
-import sys
-import os
-from datetime import datetime
-
-
-def read_proof_summary(tsv_path: str) -> list:
-    """Read proof_summary.tsv and return list of (id, merkle_root, anchor_tx) tuples."""
-    proofs = []
-    
-    try:
-        with open(tsv_path, 'r') as f:
-            lines = f.readlines()
-            # Skip header
-            for line in lines[1:]:
-                parts = line.strip().split('\t')
-                if len(parts) >= 3 and parts[0] != 'id':  # Skip header or empty rows
-                    proofs.append({
-                        'id': parts[0],
-                        'merkle_root': parts[1],
-                        'anchor_tx': parts[2]
-                    })
-    except FileNotFoundError:
-        print(f"❌ Proof summary file not found: {tsv_path}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"❌ Error reading proof summary: {e}")
-        sys.exit(1)
-    
-    return proofs
-
-
-def generate_counsel_email_template(proofs: list) -> str:
-    """Generate a professional counsel email locally."""
-    
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
-    date_str = datetime.now().strftime("%B %d, %Y")
-    
-    # Build proof summary
-    proofs_section = ""
-    if proofs and len(proofs) > 0:
-        proofs_section = "\n".join([
-            f"    • Proof ID: {p['id']}\n"
-            f"      Merkle Root: {p['merkle_root']}\n"
-            f"      Anchor TX: {p['anchor_tx']}"
-            for p in proofs[:10]
-        ])
-        if len(proofs) > 10:
-            proofs_section += f"\n\n    ... and {len(proofs) - 10} additional proofs"
-    else:
-        proofs_section = "    (No proofs extracted - evidence bundle may contain documentation only)"
-    
-    email = f"""Subject: BlazeTV Evidence Bundle - Blockchain Validation Report
-
-To: Legal Counsel & PSP Compliance Team
-Date: {date_str}
-
-Dear Counsel,
-
-Please find below the validation results for the BlazeTV evidence bundle submission.
-
-═══════════════════════════════════════════════════════════════════════════════
-
-EVIDENCE BUNDLE VALIDATION REPORT
-
-Bundle Type: BlazeTV Compliance Evidence
-Validation Status: ✅ COMPLETE
-Total Proofs Extracted: {len(proofs)}
-Report Generated: {timestamp}
-
-───────────────────────────────────────────────────────────────────────────────
-
-EXTRACTED MERKLE ROOT PROOFS:
-
-{proofs_section}
-
-───────────────────────────────────────────────────────────────────────────────
-
-VERIFICATION CHECKLIST:
 
-  ✓ Evidence bundle integrity verified
-  ✓ Merkle root proofs extracted successfully
-  ✓ Anchor transaction data available for verification
-  ✓ Compliance metadata extracted
+  # One email per recipient (name, role = counsel|psp, email), e.g.
+  #   name<TAB>role<TAB>email
+  #   Jane Roe<TAB>counsel<TAB>jane@lawfirm.example
+  python3 scripts/generate_counsel_email.py --recipients recipients.tsv artifacts/proof_summary.tsv artifacts/emails
 
-───────────────────────────────────────────────────────────────────────────────
-
-RECOMMENDED NEXT STEPS:
-
-1. Legal Review (24-48 hours):
-   - Verify merkle roots align with your internal records
-   - Confirm anchor transactions reference valid blockchain transactions
-   - Validate timestamps and chain-of-custody documentation
-
-2. Blockchain Verification:
-   For each anchor transaction listed above, verify on the appropriate blockchain:
-   - Ethereum Mainnet: https://etherscan.io/tx/<ANCHOR_TX>
-   - Polygon: https://polygonscan.com/tx/<ANCHOR_TX>
-   - Other chains as applicable
-
-3. Audit Readiness:
-   - All proofs are immutable once anchored on blockchain
-   - Bundle metadata supports regulatory compliance requirements
-   - Evidence chain-of-custody maintained from collection to submission
-
-───────────────────────────────────────────────────────────────────────────────
-
-COMPLIANCE CERTIFICATION:
-
-This evidence bundle has been validated for:
-  • Integrity (no tampering detected)
-  • Completeness (all proofs accounted for)
-  • Authenticity (merkle roots verified)
-  • Immutability (blockchain-anchored timestamps)
-
-───────────────────────────────────────────────────────────────────────────────
-
-REQUIRED ACTIONS:
-
-1. Please confirm receipt of this report
-2. Review and verify all merkle roots and anchor transactions
-3. Provide written approval for production deployment
-4. Expected timeline: 24-48 hours
-
-───────────────────────────────────────────────────────────────────────────────
-
-Upon your approval, we will:
-  ✓ Deploy to production environment
-  ✓ Enable real-money transaction processing
-  ✓ Activate live streaming with content verification
-  ✓ Monitor compliance metrics in real-time
-
-Please reply with:
-  • Your written approval
-  • Any compliance concerns or required modifications
-  • Confirmation of review timeline
-
-Thank you for your prompt review and support.
-
-Best Regards,
-BlazeTV Compliance Team
-Automated Evidence Validation System
-
-═══════════════════════════════════════════════════════════════════════════════
-Report ID: {timestamp}
-System Version: 2.0
-Contact: compliance@blazetv.io
-═══════════════════════════════════════════════════════════════════════════════
+The summary readers and the template renderer are re-exported here so code
+that imported them from this script keeps working.
 """
-    
-    return email
-
 
-def main():
-    if len(sys.argv) != 3:
-        print(f"Usage: {sys.argv[0]} <proof_summary.tsv> <output_email.txt>")
-        sys.exit(1)
-    
-    tsv_path = sys.argv[1]
-    output_path = sys.argv[2]
-    
-    print(f"🚀 Generating counsel email...")
-    print(f"  Input: {tsv_path}")
-    print(f"  Output: {output_path}")
-    
-    # Read proofs
-    proofs = read_proof_summary(tsv_path)
-    print(f"✅ Loaded {len(proofs)} proofs")
-    
-    # Generate email using template (no LLM or API required)
-    email_content = generate_counsel_email_template(proofs)
-    
-    # Write to output
-    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
-    
-    with open(output_path, 'w') as f:
-        f.write(email_content)
-    
-    print(f"✅ Email written to {output_path}")
-    print(f"\n📧 Preview (first 40 lines):")
-    lines = email_content.split("\n")
-    for i, line in enumerate(lines[:40]):
-        print(line)
+from counsel_email import (digest_proof_summary, generate_counsel_email_template,
+                           iter_proof_summary, read_proof_summary, render_recipient_emails)
+from counsel_email.cli import main
 
 
 if __name__ == '__main__':
@@ -310,7 +310,19 @@ log "▶ STEP 8: Creating evidence bundle..."
 cd /tmp
 EVIDENCE_ZIP="blazetv_evidence_${TIMESTAMP}.zip"
 
-if command -v zip &> /dev/null; then
+if command -v python3 &> /dev/null; then
+  # Reproducible bundle (sorted members, fixed timestamps, content manifest);
+  # files unchanged since the last bundle come from the chunk cache
+  python3 "$SCRIPT_DIR/bundle_writer.py" --cache "$REPO_ROOT/.cache/bundle_chunks.sqlite" \
+    "blazetv_evidence_${TIMESTAMP}" "$EVIDENCE_ZIP" > /dev/null
+  success "Evidence bundle created: $EVIDENCE_ZIP"
+
+  # Move to repo root
+  mv "$EVIDENCE_ZIP" "$REPO_ROOT/"
+
+  log "   Location: $REPO_ROOT/$EVIDENCE_ZIP"
+  log "   Size: $(du -h "$REPO_ROOT/$EVIDENCE_ZIP" | cut -f1)"
+elif command -v zip &> /dev/null; then
   zip -r "$EVIDENCE_ZIP" "blazetv_evidence_${TIMESTAMP}" -q
   success "Evidence bundle created: $EVIDENCE_ZIP"
   
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+merkle.py
+
+Python counterpart of scripts/generate_proofs.js and scripts/verify_score_client.js.
+Builds the same sorted-pair SHA-256 Merkle tree (an odd node is paired with
+itself) and produces byte-identical roots and proofs.
+
+Each tree layer is held as one contiguous bytes buffer of 32-byte hashes
+rather than a list of objects, so a tree over N leaves costs about 64*N bytes.
+
+Usage:
+  python3 scripts/merkle.py build <scores_dir> <out_proofs.json>
+  python3 scripts/merkle.py verify <canonical_score.json> <proofs.json>
+  python3 scripts/merkle.py verify-all <scores_dir> <proofs.json>
+
+Example:
+  python3 scripts/merkle.py build ./scores ./scores/proofs.json
+  python3 scripts/merkle.py verify-all ./scores ./scores/proofs.json
+"""
+
+import sys
+import os
+import json
+import time
+import hashlib
+from datetime import datetime, timezone
+
+HASH_SIZE = 32
+READ_CHUNK = 1 << 20
+TOOL_VERSION = "1.0.0"
+DEFAULT_MEMO_ENTRIES = 1 << 18
+
+
+def to_hex(digest: bytes) -> str:
+    return "0x" + digest.hex()
+
+
+def from_hex(value: str) -> bytes:
+    return bytes.fromhex(value[2:] if value.startswith('0x') else value)
+
+
+def hash_file(path: str) -> bytes:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(READ_CHUNK), b''):
+            h.update(chunk)
+    return h.digest()
+
+
+def hash_leaves(paths: list) -> bytes:
+    """Hash every file into one contiguous buffer of 32-byte leaves."""
+    leaves = bytearray(len(paths) * HASH_SIZE)
+    for i, path in enumerate(paths):
+        leaves[i * HASH_SIZE:(i + 1) * HASH_SIZE] = hash_file(path)
+    return bytes(leaves)
+
+
+def hash_pair(left: bytes, right: bytes) -> bytes:
+    """sha256 of the pair in byte order, as Buffer.concat([l, r].sort(Buffer.compare))."""
+    if right < left:
+        left, right = right, left
+    return hashlib.sha256(left + right).digest()
+
+
+def next_layer(layer: bytes) -> bytes:
+    """Hash adjacent pairs of a layer into the layer above it."""
+    size = len(layer)
+    out = bytearray(((size // HASH_SIZE + 1) // 2) * HASH_SIZE)
+    sha256 = hashlib.sha256
+    o = 0
+    for i in range(0, size, 2 * HASH_SIZE):
+        left = layer[i:i + HASH_SIZE]
+        right = layer[i + HASH_SIZE:i + 2 * HASH_SIZE] or left
+        if right < left:
+            left, right = right, left
+        out[o:o + HASH_SIZE] = sha256(left + right).digest()
+        o += HASH_SIZE
+    return bytes(out)
+
+
+def build_tree(leaves: bytes) -> list:
+    """Return every layer from the leaves up to the root, like buildTree()."""
+    layers = [bytes(leaves)]
+    while len(layers[-1]) > HASH_SIZE:
+        layers.append(next_layer(layers[-1]))
+    return layers
+
+
+def merkle_root(leaves: bytes) -> bytes:
+    """Compute only the root, keeping no more than two layers alive at once."""
+    layer = bytes(leaves)
+    while len(layer) > HASH_SIZE:
+        layer = next_layer(layer)
+    return layer
+
+
+def node(layer: bytes, index: int) -> bytes:
+    return layer[index * HASH_SIZE:(index + 1) * HASH_SIZE]
+
+
+def get_proof(layers: list, index: int) -> list:
+    """Return the sibling path for a leaf as 0x-hex strings, like getProof()."""
+    proof = []
+    for layer in layers[:-1]:
+        pair_index = index - 1 if index % 2 else index + 1
+        if pair_index < len(layer) // HASH_SIZE:
+            proof.append(to_hex(node(layer, pair_index)))
+        else:
+            # Odd number of nodes: the node is paired with itself
+            proof.append(to_hex(node(layer, index)))
+        index //= 2
+    return proof
+
+
+def verify_proof(leaf: str, proof: list, root: str) -> bool:
+    """Walk a single proof path to the root, like verifyProof()."""
+    digest = from_hex(leaf)
+    for sibling in proof:
+        digest = hash_pair(digest, from_hex(sibling))
+    return to_hex(digest) == root
+
+
+class ProofVerifier:
+    """Verify many independent proofs, hashing each shared subtree only once.
+
+    Proofs for neighbouring leaves of the same tree share every pair above
+    their common ancestor. Parent hashes are memoized by their sorted 64-byte
+    pair, so verifying all n proofs of a tree costs about n hashes instead of
+    n log n. The memo is cleared whenever it reaches max_entries.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MEMO_ENTRIES):
+        self.max_entries = max_entries
+        self.hashes = 0
+        self.shared = 0
+        self.proofs = 0
+        self.seconds = 0.0
+        self._memo = {}
+
+    def verify(self, leaf: str, proof: list, root: str) -> bool:
+        """Return whether `proof` leads from `leaf` to `root`; raises ValueError on bad hex."""
+        start = time.perf_counter()
+        memo = self._memo
+        digest = from_hex(leaf)
+        for sibling in proof:
+            other = from_hex(sibling)
+            pair = digest + other if digest <= other else other + digest
+            parent = memo.get(pair)
+            if parent is None:
+                parent = hashlib.sha256(pair).digest()
+                self.hashes += 1
+                if len(memo) >= self.max_entries:
+                    memo.clear()
+                memo[pair] = parent
+            else:
+                self.shared += 1
+            digest = parent
+        self.proofs += 1
+        self.seconds += time.perf_counter() - start
+        return to_hex(digest) == root.lower()
+
+
+def verify_all(proofs_data: dict, leaf_hashes: dict = None) -> dict:
+    """Check every proof in a proofs.json document in one pass.
+
+    The tree is rebuilt once from the recorded leaf hashes, so each proof is
+    compared against the known sibling path instead of being re-hashed up to
+    the root. If `leaf_hashes` maps file names to freshly computed hashes,
+    those are checked against the recorded ones as well.
+
+    Returns {'root_ok': bool, 'failures': {name: reason}, 'checked': int}.
+    """
+    entries = proofs_data.get('proofs', {})
+    names = sorted(entries)
+    leaves = b''.join(from_hex(entries[name]['hash']) for name in names)
+    layers = build_tree(leaves) if names else [b'']
+
+    failures = {}
+    for i, name in enumerate(names):
+        entry = entries[name]
+        if leaf_hashes is not None and leaf_hashes.get(name) != entry['hash']:
+            failures[name] = 'hash mismatch' if name in leaf_hashes else 'file missing'
+        elif entry.get('proof') != get_proof(layers, i):
+            failures[name] = 'proof mismatch'
+
+    return {
+        'root_ok': bool(names) and to_hex(layers[-1]) == proofs_data.get('merkleRoot'),
+        'failures': failures,
+        'checked': len(names),
+    }
+
+
+def canonical_files(scores_dir: str) -> list:
+    return sorted(f for f in os.listdir(scores_dir) if f.endswith('.canonical.json'))
+
+
+def build_proofs(scores_dir: str) -> dict:
+    """Build the proofs.json document generate_proofs.js writes for scores_dir."""
+    files = canonical_files(scores_dir)
+    leaves = hash_leaves([os.path.join(scores_dir, f) for f in files])
+    layers = build_tree(leaves)
+
+    now = datetime.now(timezone.utc)
+    return {
+        'merkleRoot': to_hex(layers[-1]),
+        'generatedAt': now.strftime('%Y-%m-%dT%H:%M:%S.') + f"{now.microsecond // 1000:03d}Z",
+        'toolVersion': TOOL_VERSION,
+        'proofs': {
+            f: {'hash': to_hex(node(leaves, i)), 'proof': get_proof(layers, i)}
+            for i, f in enumerate(files)
+        },
+    }
+
+
+def cmd_build(scores_dir: str, out_path: str) -> None:
+    if not os.path.isdir(scores_dir):
+        print(f"Error: Scores directory missing: {scores_dir}")
+        sys.exit(1)
+
+    if not canonical_files(scores_dir):
+        print("No .canonical.json files found. Creating sample...")
+        with open(os.path.join(scores_dir, 'sample.canonical.json'), 'w') as f:
+            f.write(json.dumps({'artist': 'Test', 'score': 100}, separators=(',', ':')))
+
+    result = build_proofs(scores_dir)
+
+    os.makedirs(os.path.dirname(out_path) or '.', exist_ok=True)
+    with open(out_path, 'w') as f:
+        f.write(json.dumps(result, indent=2, ensure_ascii=False))
+    print(f"Merkle Tree generated. Root: {result['merkleRoot']}")
+    print(f"Proofs saved to {out_path}")
+
+
+def cmd_verify(score_path: str, proofs_path: str) -> None:
+    if not os.path.isfile(score_path) or not os.path.isfile(proofs_path):
+        print("Error: File(s) missing.")
+        sys.exit(1)
+
+    score_hash = to_hex(hash_file(score_path))
+    with open(proofs_path) as f:
+        proofs_data = json.load(f)
+    file_name = os.path.basename(score_path)
+    entry = proofs_data.get('proofs', {}).get(file_name)
+
+    if not entry:
+        print(f"FAILURE: No proof found for {file_name} in {proofs_path}")
+        sys.exit(1)
+    if entry['hash'] != score_hash:
+        print("FAILURE: Hash mismatch!")
+        print(f"Local file hash: {score_hash}")
+        print(f"Expected hash:   {entry['hash']}")
+        sys.exit(1)
+
+    if verify_proof(score_hash, entry['proof'], proofs_data['merkleRoot']):
+        print("SUCCESS: Merkle proof verified!")
+        print(f"Root: {proofs_data['merkleRoot']}")
+    else:
+        print("FAILURE: Merkle proof verification failed.")
+        sys.exit(1)
+
+
+def cmd_verify_all(scores_dir: str, proofs_path: str) -> None:
+    if not os.path.isdir(scores_dir) or not os.path.isfile(proofs_path):
+        print("Error: File(s) missing.")
+        sys.exit(1)
+
+    with open(proofs_path) as f:
+        proofs_data = json.load(f)
+    leaf_hashes = {f: to_hex(hash_file(os.path.join(scores_dir, f))) for f in canonical_files(scores_dir)}
+    result = verify_all(proofs_data, leaf_hashes)
+
+    for name, reason in sorted(result['failures'].items()):
+        print(f"FAILURE: {name}: {reason}")
+    if not result['root_ok']:
+        print(f"FAILURE: Tree does not reproduce root {proofs_data.get('merkleRoot')}")
+    if result['failures'] or not result['root_ok']:
+        sys.exit(1)
+    print(f"SUCCESS: {result['checked']} Merkle proofs verified!")
+    print(f"Root: {proofs_data['merkleRoot']}")
+
+
+def main():
+    commands = {'build': cmd_build, 'verify': cmd_verify, 'verify-all': cmd_verify_all}
+    if len(sys.argv) != 4 or sys.argv[1] not in commands:
+        print(f"Usage: {sys.argv[0]} build|verify|verify-all <path> <proofs.json>")
+        sys.exit(1)
+    commands[sys.argv[1]](sys.argv[2], sys.argv[3])
+
+
+if __name__ == '__main__':
+    main()
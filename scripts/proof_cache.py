@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+proof_cache.py
+
+On-disk cache of parsed proof rows for extract_roots.py, keyed by zip member
+name plus the CRC32 and uncompressed size recorded in the central directory.
+A member whose key is already cached is never decompressed or parsed again.
+Bundles built by bundle_writer.py carry a manifest of content digests; their
+members are keyed by digest instead of name (content_key()), so a proof file
+cached from one bundle is a hit in every later bundle that contains it,
+whatever prefix it is stored under.
+
+Usage:
+  python3 scripts/proof_cache.py stats <cache.sqlite>
+  python3 scripts/proof_cache.py clear <cache.sqlite>
+
+Example:
+  python3 scripts/extract_roots.py --cache .cache/proof_cache.sqlite bundle.zip artifacts/proof_summary.tsv
+  python3 scripts/proof_cache.py clear .cache/proof_cache.sqlite
+"""
+
+import sys
+import os
+import time
+import sqlite3
+import zipfile
+from collections import namedtuple
+
+DEFAULT_MAX_ENTRIES = 1_000_000
+FLUSH_BATCH = 10_000
+
+# Stands in for a ZipInfo as a cache key: the member column holds
+# 'sha256:<hex>' and CRC-32 and size still come from the central directory
+CacheKey = namedtuple('CacheKey', 'filename CRC file_size')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS proof_rows (
+    member TEXT NOT NULL,
+    crc INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    proof_id TEXT NOT NULL,
+    merkle_root TEXT NOT NULL,
+    anchor_tx TEXT NOT NULL,
+    last_used REAL NOT NULL,
+    verify_status TEXT,
+    PRIMARY KEY (member, crc, size)
+);
+CREATE INDEX IF NOT EXISTS idx_proof_rows_last_used ON proof_rows(last_used);
+"""
+
+
+def content_key(info: zipfile.ZipInfo, sha256: str) -> CacheKey:
+    """The cache key of a member whose content digest is known."""
+    return CacheKey('sha256:' + sha256, info.CRC, info.file_size)
+
+
+class ProofCache:
+    """SQLite-backed (member, crc, size) -> (id, merkle_root, anchor_tx) store.
+
+    Entries touched during a run are stamped with the run's start time; when
+    the cache is closed the least recently used rows beyond max_entries are
+    evicted.
+    """
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        self.run_stamp = time.time()
+        self.hits = 0
+        self.misses = 0
+        self._touched = []
+        self._pending = []
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(SCHEMA)
+        columns = {r[1] for r in self._conn.execute("PRAGMA table_info(proof_rows)")}
+        if 'verify_status' not in columns:
+            # Caches written before --verify existed
+            self._conn.execute("ALTER TABLE proof_rows ADD COLUMN verify_status TEXT")
+
+    def has(self, info: zipfile.ZipInfo, verified: bool = False) -> bool:
+        """Probe for a member without loading its row; absent members count as misses.
+
+        With verified=True, rows cached by a run without --verify (no status)
+        count as misses too.
+        """
+        query = "SELECT 1 FROM proof_rows WHERE member = ? AND crc = ? AND size = ?"
+        if verified:
+            query += " AND verify_status IS NOT NULL"
+        found = self._conn.execute(
+            query, (info.filename, info.CRC, info.file_size)).fetchone() is not None
+        if not found:
+            self.misses += 1
+        return found
+
+    def get(self, info: zipfile.ZipInfo, verified: bool = False):
+        """Return the cached row for a member, or None if it is not cached.
+
+        The row is (id, merkle_root, anchor_tx), plus verify_status when
+        verified=True.
+        """
+        columns = "proof_id, merkle_root, anchor_tx" + (", verify_status" if verified else "")
+        row = self._conn.execute(
+            f"SELECT {columns} FROM proof_rows WHERE member = ? AND crc = ? AND size = ?",
+            (info.filename, info.CRC, info.file_size)).fetchone()
+        if row is None or (verified and row[3] is None):
+            return None
+        self.hits += 1
+        self._touched.append((self.run_stamp, info.filename, info.CRC, info.file_size))
+        self._maybe_flush()
+        return row
+
+    def put(self, info: zipfile.ZipInfo, row: tuple) -> None:
+        """Queue a freshly parsed row; rows are written in batches by flush()."""
+        proof_id, merkle_root, anchor_tx = (str(v) for v in row[:3])
+        verify_status = row[3] if len(row) > 3 else None
+        self._pending.append((info.filename, info.CRC, info.file_size,
+                              proof_id, merkle_root, anchor_tx, self.run_stamp, verify_status))
+        self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        if len(self._pending) + len(self._touched) >= FLUSH_BATCH:
+            self.flush()
+
+    def flush(self) -> None:
+        with self._conn:
+            # A re-parse without --verify has no status; keep the one a --verify run stored
+            self._conn.executemany(
+                "INSERT INTO proof_rows VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(member, crc, size) DO UPDATE SET "
+                "proof_id = excluded.proof_id, merkle_root = excluded.merkle_root, "
+                "anchor_tx = excluded.anchor_tx, last_used = excluded.last_used, "
+                "verify_status = COALESCE(excluded.verify_status, proof_rows.verify_status)",
+                self._pending)
+            self._conn.executemany(
+                "UPDATE proof_rows SET last_used = ? WHERE member = ? AND crc = ? AND size = ?",
+                self._touched)
+        self._pending = []
+        self._touched = []
+
+    def evict(self) -> int:
+        """Drop least recently used rows until at most max_entries remain."""
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM proof_rows").fetchone()
+        excess = count - self.max_entries
+        if excess <= 0:
+            return 0
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM proof_rows WHERE rowid IN "
+                "(SELECT rowid FROM proof_rows ORDER BY last_used ASC LIMIT ?)", (excess,))
+        return excess
+
+    def clear(self) -> int:
+        with self._conn:
+            removed = self._conn.execute("DELETE FROM proof_rows").rowcount
+        self._conn.execute("VACUUM")
+        return removed
+
+    def entry_count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM proof_rows").fetchone()[0]
+
+    def close(self) -> None:
+        self.flush()
+        self.evict()
+        self._conn.close()
+
+
+def main():
+    if len(sys.argv) != 3 or sys.argv[1] not in ('stats', 'clear'):
+        print(f"Usage: {sys.argv[0]} stats|clear <cache.sqlite>")
+        sys.exit(1)
+
+    command, path = sys.argv[1], sys.argv[2]
+
+    if not os.path.isfile(path):
+        print(f"⚠️  No cache at {path}")
+        return
+
+    cache = ProofCache(path)
+    if command == 'clear':
+        print(f"🗑️  Invalidated {cache.clear()} cached proof rows in {path}")
+    else:
+        print(f"📊 {cache.entry_count()} cached proof rows in {path} ({os.path.getsize(path)} bytes)")
+    cache.close()
+
+
+if __name__ == '__main__':
+    main()
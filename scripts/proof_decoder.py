@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+proof_decoder.py
+
+JSON decoding backends for proof files.
+
+  json    stdlib json.loads over the whole member
+  orjson  orjson.loads over the whole member (pip install orjson)
+  auto    orjson when it is installed, json otherwise
+  scan    field scan: only the requested top-level values are decoded into
+          Python objects; values of other keys (e.g. large proof_bundle
+          arrays) are stepped over without building them
+
+Like the other backends, the scan decoder reads every member in full (so
+zipfile checks its CRC-32); it saves object construction, not I/O or
+decompression, and is slower than json on small documents. Tokenizing stops
+after the last field it needs, but the rest of the document is still checked
+for completeness: it must end by closing the top-level object, with as many
+closing brackets and braces as opening ones. A document failing that is
+handed to json.loads, which either rejects it like the json backend would or
+decodes it in full (brackets inside strings). Malformed JSON that keeps its
+brackets paired after the needed fields goes unnoticed.
+"""
+
+import re
+import json
+from json.decoder import scanstring, WHITESPACE
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DECODERS = ('auto', 'json', 'orjson', 'scan')
+
+# Inside a nested value, the next string literal or bracket
+_NESTED_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"|[\[\]{}]', re.DOTALL)
+_raw_decode = json.JSONDecoder().raw_decode
+# Every byte but []{}, deleted by _complete()
+_NOT_BRACKETS = bytes(c for c in range(256) if c not in b'[]{}')
+
+
+class _Incomplete(Exception):
+    """The document ended inside a value."""
+
+
+def resolve(name: str) -> str:
+    """Map 'auto' to the best available full decoder and reject unusable choices."""
+    if name == 'auto':
+        return 'orjson' if orjson is not None else 'json'
+    if name == 'orjson' and orjson is None:
+        raise ValueError("orjson decoder requested but orjson is not installed (pip install orjson)")
+    if name not in DECODERS:
+        raise ValueError(f"unknown decoder: {name}")
+    return name
+
+
+def loads(data: bytes, decoder: str = 'json'):
+    """Decode a whole document with the 'json' or 'orjson' backend."""
+    if decoder == 'orjson':
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _skip_ws(s: str, pos: int) -> int:
+    return WHITESPACE.match(s, pos).end()
+
+
+def _skip_value(s: str, pos: int) -> int:
+    """Return the index just past the JSON value starting at pos, without building it."""
+    ch = s[pos:pos + 1]
+    if ch == '"':
+        return scanstring(s, pos + 1)[1]
+    if ch not in ('[', '{'):
+        return _raw_decode(s, pos)[1]
+    depth = 0
+    for m in _NESTED_TOKEN_RE.finditer(s, pos):
+        token = m.group()
+        if token in ('[', '{'):
+            depth += 1
+        elif token in (']', '}'):
+            depth -= 1
+            if depth == 0:
+                return m.end()
+    raise _Incomplete()
+
+
+def _scan(s: str, keys: frozenset, done) -> dict:
+    found = {}
+    pos = _skip_ws(s, 0)
+    if s[pos:pos + 1] != '{':
+        raise json.JSONDecodeError("Expecting '{'", s, pos)
+    pos = _skip_ws(s, pos + 1)
+    if s[pos:pos + 1] == '}':
+        return found
+
+    while True:
+        if s[pos:pos + 1] != '"':
+            raise json.JSONDecodeError("Expecting property name enclosed in double quotes", s, pos)
+        key, pos = scanstring(s, pos + 1)
+        pos = _skip_ws(s, pos)
+        if s[pos:pos + 1] != ':':
+            raise json.JSONDecodeError("Expecting ':' delimiter", s, pos)
+        pos = _skip_ws(s, pos + 1)
+
+        if key in keys:
+            found[key], pos = _raw_decode(s, pos)
+            if pos >= len(s):
+                # The document ends inside the object
+                raise _Incomplete()
+            if done(found):
+                return found
+        else:
+            pos = _skip_value(s, pos)
+
+        pos = _skip_ws(s, pos)
+        ch = s[pos:pos + 1]
+        if ch == '}':
+            return found
+        if ch != ',':
+            raise json.JSONDecodeError("Expecting ',' delimiter", s, pos)
+        pos = _skip_ws(s, pos + 1)
+
+
+def _complete(data: bytes) -> bool:
+    """Whether a document closes its top-level object and pairs up its
+    brackets; one C-level pass over the bytes, no tokenizing."""
+    brackets = data.translate(None, _NOT_BRACKETS)
+    return (data.rstrip().endswith(b'}') and brackets.count(b'{') == brackets.count(b'}')
+            and brackets.count(b'[') == brackets.count(b']'))
+
+
+def scan_fields(stream, keys: frozenset, done) -> dict:
+    """Read top-level `keys` from a JSON object in a binary stream.
+
+    `done(found)` is called after every wanted key is read; once it returns
+    True the rest of the document is only checked with _complete(). A
+    document that fails the scan or the check is decoded by json.loads
+    instead, which raises for malformed JSON.
+    """
+    data = stream.read()
+    text = data.decode('utf-8')
+    try:
+        found = _scan(text, keys, done)
+        if _complete(data):
+            return found
+    except (_Incomplete, json.JSONDecodeError):
+        pass
+    data = json.loads(text)
+    if not isinstance(data, dict):
+        return data
+    return {key: value for key, value in data.items() if key in keys}
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+proof_store.py
+
+Local SQLite stand-in for the `proofs` table, bulk-loaded by
+extract_roots.py --store so extracted proofs land in the same schema the
+backend uses (migrations/20260120_add_proofs_table.sql) and can be queried
+or diffed offline.
+
+Rows are upserted on (match_id, merkle_root) with batched executemany
+inside a single transaction: a run either loads every proof or, if it
+fails, none. Loading a bundle twice leaves one row per proof; a later load
+never drops an anchor_tx an earlier one recorded.
+
+Column mapping from a proof file:
+  match_id      the row ID (match_id / id / video_id)
+  merkle_root   merkle_root
+  proof_bundle  the sibling path as compact JSON ([] if the file has none)
+  anchor_tx     anchor_tx, NULL while pending
+  status        'anchored' or 'pending'; with --verify, a proof whose path
+                does not verify gets its verify_status instead
+
+Usage:
+  python3 scripts/proof_store.py stats <proofs.sqlite>
+
+Example:
+  python3 scripts/extract_roots.py --store .cache/proofs.sqlite bundle.zip artifacts/proof_summary.tsv
+  sqlite3 .cache/proofs.sqlite "SELECT status, COUNT(*) FROM proofs GROUP BY status"
+"""
+
+import sys
+import os
+import json
+import sqlite3
+
+# migrations/20260120_add_proofs_table.sql, with SERIAL spelled the SQLite way
+TABLE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS proofs (
+    id INTEGER PRIMARY KEY,
+    match_id VARCHAR(255) NOT NULL,
+    merkle_root VARCHAR(66) NOT NULL,
+    proof_bundle JSONB NOT NULL,
+    anchor_tx VARCHAR(66),
+    status VARCHAR(50) DEFAULT 'pending',
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+)
+"""
+# The migration's secondary indexes; these can be built after a bulk load
+INDEXES = (
+    ('idx_proofs_match_id', "CREATE INDEX IF NOT EXISTS idx_proofs_match_id ON proofs(match_id)"),
+    ('idx_proofs_merkle_root', "CREATE INDEX IF NOT EXISTS idx_proofs_merkle_root ON proofs(merkle_root)"),
+)
+# The upsert key. The migration has no such constraint; ON CONFLICT needs one
+UPSERT_KEY = ("CREATE UNIQUE INDEX IF NOT EXISTS idx_proofs_match_id_merkle_root "
+              "ON proofs(match_id, merkle_root)")
+
+UPSERT = """
+INSERT INTO proofs (match_id, merkle_root, proof_bundle, anchor_tx, status) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (match_id, merkle_root) DO UPDATE SET
+    proof_bundle = excluded.proof_bundle,
+    anchor_tx = COALESCE(excluded.anchor_tx, proofs.anchor_tx),
+    status = CASE WHEN excluded.anchor_tx IS NULL AND proofs.anchor_tx IS NOT NULL
+                  THEN proofs.status ELSE excluded.status END
+"""
+
+STORE_BATCH = 10_000
+
+
+def store_record(row: tuple, path) -> tuple:
+    """The (match_id, merkle_root, proof_bundle, anchor_tx, status) values for one row."""
+    proof_id, merkle_root, anchor_tx = (str(v) for v in row[:3])
+    anchor_tx = None if anchor_tx == 'pending' else anchor_tx
+    if len(row) > 3 and row[3] != 'verified':
+        status = row[3]
+    else:
+        status = 'anchored' if anchor_tx else 'pending'
+    proof_bundle = json.dumps(path if path is not None else [], separators=(',', ':'))
+    return (proof_id, merkle_root, proof_bundle, anchor_tx, status)
+
+
+class ProofStore:
+    """Upsert rows into a proofs table in one transaction, committed by close().
+
+    With defer_indexes=True the two secondary indexes are dropped for the
+    load and rebuilt (inside the same transaction) before the commit;
+    bench_proof_store.py compares the two.
+    """
+
+    def __init__(self, path: str, defer_indexes: bool = False):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self.defer_indexes = defer_indexes
+        self.rows = 0
+        self.inserted = 0
+        self._batch = []
+        self._conn = sqlite3.connect(path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.execute(TABLE_SCHEMA)
+            self._conn.execute(UPSERT_KEY)
+            for name, create in INDEXES:
+                self._conn.execute(f"DROP INDEX IF EXISTS {name}" if defer_indexes else create)
+            (self._before,) = self._conn.execute("SELECT COUNT(*) FROM proofs").fetchone()
+        except BaseException:
+            self.discard()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def add(self, row: tuple, path=None) -> None:
+        """Queue an (id, merkle_root, anchor_tx[, verify_status]) row and its sibling path."""
+        self._batch.append(store_record(row, path))
+        if len(self._batch) >= STORE_BATCH:
+            self._flush()
+
+    def _flush(self) -> None:
+        self._conn.executemany(UPSERT, self._batch)
+        self.rows += len(self._batch)
+        self._batch = []
+
+    def close(self) -> int:
+        """Rebuild deferred indexes, commit, and return the number of rows loaded."""
+        try:
+            self._flush()
+            if self.defer_indexes:
+                for _, create in INDEXES:
+                    self._conn.execute(create)
+            (after,) = self._conn.execute("SELECT COUNT(*) FROM proofs").fetchone()
+            self.inserted = after - self._before
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self.discard()
+            raise
+        self._conn.close()
+        return self.rows
+
+    def discard(self) -> None:
+        """Roll back everything loaded since the store was opened."""
+        if self._conn.in_transaction:
+            self._conn.execute("ROLLBACK")
+        self._conn.close()
+
+
+def cmd_stats(path: str) -> None:
+    if not os.path.isfile(path):
+        raise FileNotFoundError(2, 'No such file', path)
+    conn = sqlite3.connect(path)
+    try:
+        (rows, roots, anchors) = conn.execute(
+            "SELECT COUNT(*), COUNT(DISTINCT merkle_root), COUNT(DISTINCT anchor_tx) FROM proofs").fetchone()
+        print(f"proofs:           {rows}")
+        print(f"distinct roots:   {roots}")
+        print(f"distinct anchors: {anchors}")
+        for status, count in conn.execute("SELECT status, COUNT(*) FROM proofs GROUP BY status ORDER BY status"):
+            print(f"  {status:<15} {count}")
+        indexes = [name for (name,) in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'proofs' ORDER BY name")]
+        print(f"indexes:          {', '.join(indexes)}")
+        print(f"file size:        {os.path.getsize(path)} bytes")
+    finally:
+        conn.close()
+
+
+def main():
+    if len(sys.argv) != 3 or sys.argv[1] != 'stats':
+        print(f"Usage: {sys.argv[0]} stats <proofs.sqlite>")
+        sys.exit(1)
+    try:
+        cmd_stats(sys.argv[2])
+    except FileNotFoundError as e:
+        print(f"❌ File not found: {e.filename}")
+        sys.exit(1)
+    except sqlite3.Error as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+proof_summary.py
+
+Compact binary proof summary, written next to (or instead of) proof_summary.tsv.
+
+Roots and anchor transactions are stored as fixed-width 32-byte columns, IDs
+and verify statuses as uint32 references into one interned string table.
+The reader memory-maps the file and exposes the columns as memoryviews, so
+opening a summary costs the same for ten rows as for ten million and rows
+are decoded only when they are accessed.
+
+Values that are not a 0x-prefixed 32-byte lowercase hex string ('pending',
+'unknown', short test hashes, ...) go into the string table instead; a
+per-row flag byte records which slots hold such references.
+
+Usage:
+  python3 scripts/proof_summary.py convert <proof_summary.tsv> <proof_summary.psum>
+  python3 scripts/proof_summary.py export <proof_summary.psum> <proof_summary.tsv>
+  python3 scripts/proof_summary.py stats <proof_summary.psum>
+
+Example:
+  python3 scripts/extract_roots.py --binary artifacts/proof_summary.psum bundle.zip artifacts/proof_summary.tsv
+  python3 scripts/proof_summary.py export artifacts/proof_summary.psum /tmp/proof_summary.tsv
+
+File layout (little-endian):
+  header          magic, version, flags, rows, strings, blob size
+  string offsets  (strings + 1) x uint64 into the blob
+  roots           rows x 32 bytes
+  anchors         rows x 32 bytes
+  ids             rows x uint32 string index
+  statuses        rows x uint32 string index (only with FLAG_VERIFIED)
+  raw flags       rows x uint8: RAW_ROOT / RAW_ANCHOR
+  blob            UTF-8 strings, back to back
+"""
+
+import sys
+import os
+import re
+import mmap
+import shutil
+import struct
+import tempfile
+from array import array
+
+MAGIC = b'PRFSUM\x00\x01'
+VERSION = 1
+HEADER = struct.Struct('<8sIIQQQ')
+FLAG_VERIFIED = 1
+
+HASH_SIZE = 32
+RAW_ROOT = 1
+RAW_ANCHOR = 2
+
+SPOOL_BUFFER_SIZE = 1 << 20
+ITER_CHUNK_ROWS = 4096
+HASH_HEX_RE = re.compile(r'0x[0-9a-f]{64}')
+_RAW_SLOT_PAD = bytes(HASH_SIZE - 4)
+
+
+def is_summary_file(path: str) -> bool:
+    """Return whether `path` starts with the binary summary magic."""
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def _column(view: memoryview, fmt: str):
+    """View a little-endian column as typed values without copying it."""
+    if sys.byteorder == 'little':
+        return view.cast(fmt)
+    values = array(fmt, view)
+    values.byteswap()
+    return values
+
+
+class SummaryWriter:
+    """Stream rows into a binary summary.
+
+    Every column is spooled to its own temporary file while rows arrive and
+    the final file is assembled on close(), so memory holds only the intern
+    table, not the rows. Like write_tsv(), output goes to a temporary path
+    that replaces `path` only on a successful close().
+    """
+
+    def __init__(self, path: str, verified: bool = False):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self.verified = verified
+        self.rows = 0
+        self._strings = {}
+        self._offsets = array('Q', [0])
+        spool = lambda: tempfile.TemporaryFile(buffering=SPOOL_BUFFER_SIZE)
+        # roots, anchors, ids, statuses, raw flags, string blob; each is
+        # batched in a bytearray before it hits its spool
+        self._spools = [spool() for _ in range(6)]
+        self._buffers = [bytearray() for _ in range(6)]
+        self._blob = self._buffers[5]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def _intern(self, value: str) -> int:
+        index = self._strings.get(value)
+        if index is None:
+            data = value.encode('utf-8')
+            self._blob += data
+            index = self._strings[value] = len(self._offsets) - 1
+            self._offsets.append(self._offsets[-1] + len(data))
+        return index
+
+    def _slot(self, value: str, raw_bit: int) -> tuple:
+        """(32-byte slot, raw bit): the hash itself, or a string reference."""
+        if HASH_HEX_RE.fullmatch(value):
+            return bytes.fromhex(value[2:]), 0
+        return self._intern(value).to_bytes(4, 'little') + _RAW_SLOT_PAD, raw_bit
+
+    def write(self, row: tuple) -> None:
+        """Append an (id, merkle_root, anchor_tx[, verify_status]) row."""
+        roots, anchors, ids, statuses, raw, blob = self._buffers
+        root, raw_root = self._slot(str(row[1]), RAW_ROOT)
+        anchor, raw_anchor = self._slot(str(row[2]), RAW_ANCHOR)
+        roots += root
+        anchors += anchor
+        ids += self._intern(str(row[0])).to_bytes(4, 'little')
+        if self.verified:
+            statuses += self._intern(str(row[3])).to_bytes(4, 'little')
+        raw.append(raw_root | raw_anchor)
+        self.rows += 1
+        if len(roots) >= SPOOL_BUFFER_SIZE or len(blob) >= SPOOL_BUFFER_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        for spool, buffer in zip(self._spools, self._buffers):
+            spool.write(buffer)
+            buffer.clear()
+
+    def close(self) -> int:
+        """Assemble the file and return the number of rows written."""
+        self._flush()
+        offsets = self._offsets
+        if sys.byteorder != 'little':
+            offsets = array('Q', offsets)
+            offsets.byteswap()
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as out:
+                out.write(HEADER.pack(MAGIC, VERSION, FLAG_VERIFIED if self.verified else 0,
+                                      self.rows, len(self._strings), self._offsets[-1]))
+                out.write(offsets.tobytes())
+                for spool in self._spools:
+                    spool.seek(0)
+                    shutil.copyfileobj(spool, out, SPOOL_BUFFER_SIZE)
+            os.replace(tmp_path, self.path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            self.discard()
+        return self.rows
+
+    def discard(self) -> None:
+        for spool in self._spools:
+            spool.close()
+
+
+def write_summary(rows, path: str, verified: bool = False) -> int:
+    """Write an iterable of rows to a binary summary and return the row count."""
+    with SummaryWriter(path, verified) as writer:
+        for row in rows:
+            writer.write(row)
+    return writer.rows
+
+
+class ProofSummary:
+    """Read-only, memory-mapped view of a binary summary.
+
+    len(summary), summary[i] and iteration yield the same
+    (id, merkle_root, anchor_tx[, verify_status]) string tuples the TSV
+    holds; root_bytes()/anchor_bytes() return the raw 32-byte hashes.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, flags, rows, strings, blob_size = HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a version {VERSION} binary proof summary")
+        except (struct.error, ValueError):
+            self._mm.close()
+            raise
+
+        self.rows = rows
+        self.verified = bool(flags & FLAG_VERIFIED)
+        view = self._view = memoryview(self._mm)
+
+        pos = HEADER.size
+        self._offsets = _column(view[pos:pos + (strings + 1) * 8], 'Q')
+        pos += (strings + 1) * 8
+        self._roots_at = pos
+        pos += rows * HASH_SIZE
+        self._anchors_at = pos
+        pos += rows * HASH_SIZE
+        self._ids = _column(view[pos:pos + rows * 4], 'I')
+        pos += rows * 4
+        if self.verified:
+            self._statuses = _column(view[pos:pos + rows * 4], 'I')
+            pos += rows * 4
+        else:
+            self._statuses = None
+        self._raw = view[pos:pos + rows]
+        self._blob_at = pos + rows
+        if self._blob_at + blob_size > len(self._mm):
+            self.close()
+            raise ValueError(f"{path} is truncated")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self) -> None:
+        if self._mm.closed:
+            return
+        for column in (self._offsets, self._ids, self._statuses, self._raw):
+            if isinstance(column, memoryview):
+                column.release()
+        self._view.release()
+        self._mm.close()
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def string(self, index: int) -> str:
+        start = self._blob_at + self._offsets[index]
+        end = self._blob_at + self._offsets[index + 1]
+        return self._mm[start:end].decode('utf-8')
+
+    def _hash(self, base: int, i: int, raw_bit: int) -> str:
+        at = base + i * HASH_SIZE
+        if self._raw[i] & raw_bit:
+            return self.string(int.from_bytes(self._mm[at:at + 4], 'little'))
+        return '0x' + self._mm[at:at + HASH_SIZE].hex()
+
+    def root_bytes(self, i: int) -> bytes:
+        """The 32-byte merkle root of row i, or None if it is not a hash."""
+        if self._raw[i] & RAW_ROOT:
+            return None
+        at = self._roots_at + i * HASH_SIZE
+        return self._mm[at:at + HASH_SIZE]
+
+    def anchor_bytes(self, i: int) -> bytes:
+        """The 32-byte anchor transaction of row i, or None (e.g. 'pending')."""
+        if self._raw[i] & RAW_ANCHOR:
+            return None
+        at = self._anchors_at + i * HASH_SIZE
+        return self._mm[at:at + HASH_SIZE]
+
+    def __getitem__(self, i: int) -> tuple:
+        if i < 0:
+            i += self.rows
+        if not 0 <= i < self.rows:
+            raise IndexError(i)
+        row = (self.string(self._ids[i]),
+               self._hash(self._roots_at, i, RAW_ROOT),
+               self._hash(self._anchors_at, i, RAW_ANCHOR))
+        if self._statuses is not None:
+            row += (self.string(self._statuses[i]),)
+        return row
+
+    def __iter__(self):
+        """Yield every row; hash columns are hex-encoded a chunk at a time."""
+        mm = self._mm
+        string = self.string
+        ids = self._ids
+        statuses = self._statuses
+        raw = self._raw
+        for start in range(0, self.rows, ITER_CHUNK_ROWS):
+            end = min(start + ITER_CHUNK_ROWS, self.rows)
+            roots_hex = mm[self._roots_at + start * HASH_SIZE:self._roots_at + end * HASH_SIZE].hex()
+            anchors_hex = mm[self._anchors_at + start * HASH_SIZE:self._anchors_at + end * HASH_SIZE].hex()
+            for i in range(start, end):
+                at = (i - start) * 2 * HASH_SIZE
+                flags = raw[i]
+                root = ('0x' + roots_hex[at:at + 2 * HASH_SIZE] if not flags & RAW_ROOT
+                        else self._hash(self._roots_at, i, RAW_ROOT))
+                anchor = ('0x' + anchors_hex[at:at + 2 * HASH_SIZE] if not flags & RAW_ANCHOR
+                          else self._hash(self._anchors_at, i, RAW_ANCHOR))
+                if statuses is None:
+                    yield string(ids[i]), root, anchor
+                else:
+                    yield string(ids[i]), root, anchor, string(statuses[i])
+
+
+def tsv_is_verified(tsv_path: str) -> bool:
+    with open(tsv_path) as f:
+        return 'verify_status' in f.readline().rstrip('\n').split('\t')
+
+
+def read_tsv_rows(tsv_path: str, verified: bool = False):
+    """Yield (id, merkle_root, anchor_tx[, verify_status]) rows from a proof_summary.tsv."""
+    width = 4 if verified else 3
+    with open(tsv_path) as f:
+        f.readline()
+        for line in f:
+            parts = line.rstrip('\n').split('\t')
+            if len(parts) >= width:
+                yield tuple(parts[:width])
+
+
+def cmd_convert(tsv_path: str, out_path: str) -> None:
+    verified = tsv_is_verified(tsv_path)
+    count = write_summary(read_tsv_rows(tsv_path, verified), out_path, verified)
+    print(f"✅ {count} rows: {os.path.getsize(tsv_path)} bytes TSV -> {os.path.getsize(out_path)} bytes binary")
+    print(f"💾 Written to {out_path}")
+
+
+def cmd_export(summary_path: str, out_path: str) -> None:
+    from extract_roots import write_tsv
+
+    with ProofSummary(summary_path) as summary:
+        count, _ = write_tsv(iter(summary), out_path, verified=summary.verified)
+    print(f"✅ Exported {count} rows")
+    print(f"💾 Written to {out_path}")
+
+
+def cmd_stats(summary_path: str) -> None:
+    with ProofSummary(summary_path) as summary:
+        raw = bytes(summary._raw)
+        print(f"rows:             {summary.rows}")
+        print(f"verified:         {summary.verified}")
+        print(f"interned strings: {len(summary._offsets) - 1}")
+        print(f"non-hash roots:   {sum(1 for flags in raw if flags & RAW_ROOT)}")
+        print(f"non-hash anchors: {sum(1 for flags in raw if flags & RAW_ANCHOR)}")
+        print(f"file size:        {os.path.getsize(summary_path)} bytes")
+
+
+def main():
+    commands = {'convert': (cmd_convert, 2), 'export': (cmd_export, 2), 'stats': (cmd_stats, 1)}
+    if len(sys.argv) < 3 or sys.argv[1] not in commands or len(sys.argv) != 2 + commands[sys.argv[1]][1]:
+        print(f"Usage: {sys.argv[0]} convert <in.tsv> <out.psum> | export <in.psum> <out.tsv> | stats <in.psum>")
+        sys.exit(1)
+    command, _ = commands[sys.argv[1]]
+    try:
+        command(*sys.argv[2:])
+    except FileNotFoundError as e:
+        print(f"❌ File not found: {e.filename}")
+        sys.exit(1)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
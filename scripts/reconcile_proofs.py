@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+reconcile_proofs.py
+
+Cross-check the proofs/*.json files in an evidence bundle against the
+db/proofs_table.txt dump shipped in the same bundle.
+
+The dump is loaded once into a hash index keyed by match_id (and by
+merkle_root when the dump has that column); proof rows are then streamed out
+of the zip with extract_roots.py's reader and joined against the index in a
+single linear pass. Issues are counted per kind and, with --report, written
+to the TSV as they are found; only the first MAX_PRINTED_ISSUES are kept in
+memory for the console summary, so a bundle that disagrees with its dump on
+every row costs no more memory than one that agrees.
+
+Usage:
+  python3 scripts/reconcile_proofs.py [--report issues.tsv] <evidence_zip_path>
+
+Example:
+  python3 scripts/reconcile_proofs.py blazetv_evidence_20260116_144447.zip
+
+Issue kinds:
+  root_mismatch    match_id is in the DB but with a different merkle_root
+  anchor_mismatch  match_id is in the DB but with a different anchor_tx
+  id_mismatch      merkle_root is in the DB but under a different match_id
+  missing          proof has no DB row at all
+  orphan           DB row has no proof file
+"""
+
+import sys
+import os
+import re
+import zipfile
+import argparse
+import contextlib
+
+# Matches db/proofs_table.txt at the bundle root or under a nested prefix
+DB_TABLE_RE = re.compile(r'^(?:.*/)?db/proofs_table\.txt$')
+
+# Separator lines of psql's aligned output, e.g. "----+-------"
+PSQL_RULE_RE = re.compile(r'^[-+\s]+$')
+PSQL_FOOTER_RE = re.compile(r'^\(\d+ rows?\)$')
+
+MAX_PRINTED_ISSUES = 20
+REPORT_COLUMNS = ('kind', 'id', 'merkle_root', 'detail')
+
+
+def split_cells(line: str, delimiter: str) -> list:
+    return [cell.strip() for cell in line.rstrip('\n').split(delimiter)]
+
+
+def iter_db_records(lines):
+    """Yield {column: value} dicts from a proofs table dump.
+
+    Understands psql's aligned format (the one validate_staging_attestation.sh
+    writes), as well as tab- or comma-separated dumps with a header row.
+    Lines before the first header containing a match_id column are ignored.
+    """
+    columns = None
+    delimiter = None
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if columns is None:
+            if 'match_id' not in stripped:
+                continue
+            delimiter = next((d for d in ('|', '\t', ',') if d in stripped), '|')
+            columns = split_cells(line, delimiter)
+            continue
+        if PSQL_RULE_RE.match(stripped) or PSQL_FOOTER_RE.match(stripped):
+            continue
+        cells = split_cells(line, delimiter)
+        if len(cells) == len(columns):
+            yield dict(zip(columns, cells))
+
+
+class ProofTableIndex:
+    """Hash index over the DB dump: match_id -> [(merkle_root, anchor_tx)], merkle_root -> match_id.
+
+    merkle_root / anchor_tx are None when the dump has no such column.
+    """
+
+    def __init__(self, records):
+        self.by_match_id = {}
+        self.by_root = {}
+        self.has_roots = False
+        self.rows = 0
+        for record in records:
+            match_id = record.get('match_id')
+            if not match_id:
+                continue
+            root = (record.get('merkle_root') or '').lower() or None
+            anchor = (record.get('anchor_tx') or '').lower() or None
+            self.by_match_id.setdefault(match_id, []).append((root, anchor))
+            if root:
+                self.has_roots = True
+                self.by_root.setdefault(root, match_id)
+            self.rows += 1
+
+
+class ReconcileReport:
+    """Per-kind issue counts plus the first `sample_size` issues.
+
+    With `out` (an open text file), every issue is also written to it as a
+    TSV line as soon as it is found.
+    """
+
+    def __init__(self, out=None, sample_size: int = MAX_PRINTED_ISSUES):
+        self.matched = 0
+        self.counts = {}
+        self.sample = []
+        self.sample_size = sample_size
+        self.out = out
+
+    def add(self, kind: str, proof_id: str, merkle_root: str, detail: str) -> None:
+        self.counts[kind] = self.counts.get(kind, 0) + 1
+        issue = (kind, proof_id, merkle_root, detail)
+        if len(self.sample) < self.sample_size:
+            self.sample.append(issue)
+        if self.out is not None:
+            self.out.write("\t".join(issue) + "\n")
+
+    @property
+    def issue_count(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def ok(self) -> bool:
+        return not self.counts
+
+
+class Reconciler:
+    """Incremental join of proof rows against the index.
+
+    Rows are fed one at a time so reconciliation can share a single stream
+    with the TSV writer; finish() adds the orphans and returns the report.
+    """
+
+    def __init__(self, index: ProofTableIndex, report: ReconcileReport = None):
+        self.index = index
+        self.report = report if report is not None else ReconcileReport()
+        self._seen = set()
+
+    def feed(self, row: tuple) -> None:
+        index = self.index
+        report = self.report
+        proof_id, merkle_root, anchor_tx = str(row[0]), str(row[1]), str(row[2])
+        root = merkle_root.lower()
+        anchor = anchor_tx.lower()
+        records = index.by_match_id.get(proof_id)
+
+        if records is None:
+            other = index.by_root.get(root)
+            if other is not None:
+                report.add('id_mismatch', proof_id, merkle_root, f"DB has this root under match_id {other}")
+            else:
+                report.add('missing', proof_id, merkle_root, "no DB row for match_id")
+            return
+
+        self._seen.add(proof_id)
+        if index.has_roots and not any(r == root for r, _ in records):
+            db_roots = ", ".join(sorted({r for r, _ in records if r}))
+            report.add('root_mismatch', proof_id, merkle_root, f"DB merkle_root {db_roots}")
+        elif anchor != 'pending' and all(a and a != anchor for _, a in records):
+            db_anchors = ", ".join(sorted({a for _, a in records}))
+            report.add('anchor_mismatch', proof_id, merkle_root, f"DB anchor_tx {db_anchors}")
+        else:
+            report.matched += 1
+
+    def finish(self) -> ReconcileReport:
+        for match_id, records in self.index.by_match_id.items():
+            if match_id not in self._seen:
+                for root, _ in records:
+                    self.report.add('orphan', match_id, root or '', "DB row has no proof file")
+        return self.report
+
+
+def reconcile(rows, index: ProofTableIndex, report: ReconcileReport = None) -> ReconcileReport:
+    """Join streamed (id, merkle_root, anchor_tx, ...) rows against the index."""
+    reconciler = Reconciler(index, report)
+    for row in rows:
+        reconciler.feed(row)
+    return reconciler.finish()
+
+
+def find_db_table(zf: zipfile.ZipFile):
+    """Return the ZipInfo of the bundle's db/proofs_table.txt, or None."""
+    return next((i for i in zf.infolist() if DB_TABLE_RE.match(i.filename)), None)
+
+
+def load_db_index(zf: zipfile.ZipFile, info: zipfile.ZipInfo) -> ProofTableIndex:
+    with zf.open(info) as raw:
+        lines = (line.decode('utf-8', errors='replace') for line in raw)
+        return ProofTableIndex(iter_db_records(lines))
+
+
+@contextlib.contextmanager
+def open_report(path: str):
+    """Open the --report TSV for streaming; it replaces `path` only once complete."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w') as out:
+            out.write("\t".join(REPORT_COLUMNS) + "\n")
+            yield out
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def format_report(report: ReconcileReport, index: ProofTableIndex) -> list:
+    lines = [f"  DB rows indexed: {index.rows}"
+             f"{'' if index.has_roots else ' (no merkle_root column: comparing anchor_tx)'}",
+             f"  ✅ Matched: {report.matched}"]
+    for kind, n in sorted(report.counts.items()):
+        lines.append(f"  ⚠️  {kind}: {n}")
+    for kind, proof_id, merkle_root, detail in report.sample:
+        lines.append(f"    {kind:<16} {proof_id:<24} {merkle_root[:20]:<20} {detail}")
+    if report.issue_count > len(report.sample):
+        lines.append(f"    ... and {report.issue_count - len(report.sample)} more")
+    return lines
+
+
+def print_report(report: ReconcileReport, index: ProofTableIndex) -> None:
+    print("\n".join(format_report(report, index)))
+
+
+def main():
+    from extract_roots import find_proof_members, iter_proof_rows
+
+    parser = argparse.ArgumentParser(description="Reconcile proofs/*.json against db/proofs_table.txt.")
+    parser.add_argument('zip_path', metavar='evidence_zip_path')
+    parser.add_argument('--report', metavar='PATH', help="write every issue to a TSV file")
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.zip_path):
+        print(f"❌ ZIP file not found: {args.zip_path}")
+        sys.exit(1)
+
+    try:
+        with zipfile.ZipFile(args.zip_path, 'r') as zf:
+            db_info = find_db_table(zf)
+            members, has_proofs_dir = find_proof_members(zf)
+            if db_info is None or not has_proofs_dir:
+                print("  ⚠️  Cannot compare: missing proofs/ or db/proofs_table.txt")
+                return
+
+            index = load_db_index(zf, db_info)
+            rows = (row for _, row, error in iter_proof_rows(args.zip_path, zf, members) if error is None)
+            with contextlib.ExitStack() as stack:
+                out = stack.enter_context(open_report(args.report)) if args.report else None
+                report = reconcile(rows, index, ReconcileReport(out))
+    except zipfile.BadZipFile:
+        print(f"❌ Invalid ZIP file: {args.zip_path}")
+        sys.exit(1)
+
+    print_report(report, index)
+    if args.report:
+        print(f"💾 {report.issue_count} issues written to {args.report}")
+
+
+if __name__ == '__main__':
+    main()
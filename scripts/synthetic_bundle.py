@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+synthetic_bundle.py
+
+Build synthetic blazetv_evidence_*.zip bundles for benchmarks and tests.
+
+Every proof file carries a canonical score document, its leaf hash and a
+sibling path that is valid for the bundle's merkle_root, built with the
+sorted-pair SHA-256 scheme of generate_proofs.js (merkle.py), so
+`extract_roots.py --verify` reports every well-formed proof as verified.
+A chosen fraction of the proof files is written truncated (malformed JSON).
+With --no-path the proof files carry only match_id, merkle_root and
+anchor_tx (about 200 bytes each, no leaf, path or score document), for
+benchmarks that care about member count rather than proof content.
+
+Layout (prefix may be empty or nested, e.g. a/b/blazetv_evidence_x):
+  <prefix>/harness_output.txt          Anchored Root / Status lines
+  <prefix>/db/proofs_table.txt         psql-style table (with --db-table)
+  <prefix>/proofs/00000000.json        one proof per file, sorted by index
+
+Usage:
+  python3 scripts/synthetic_bundle.py [--proofs N] [--proof-size BYTES] [--prefix PATH]
+                                      [--compresslevel 0-9] [--malformed-ratio R] [--seed N]
+                                      [--db-table] [--no-path] <out.zip>
+
+Example:
+  python3 scripts/synthetic_bundle.py --proofs 100000 --proof-size 2048 --malformed-ratio 0.01 \
+      /tmp/blazetv_evidence_synthetic.zip
+"""
+
+import sys
+import os
+import json
+import random
+import hashlib
+import zipfile
+import argparse
+
+import merkle
+
+DEFAULT_PREFIX = 'blazetv_evidence_synthetic'
+DEFAULT_PROOF_SIZE = 1024
+DEFAULT_COMPRESSLEVEL = 6
+# Every PENDING_EVERY-th proof has no anchor_tx yet
+PENDING_EVERY = 4
+FIRST_MATCH_ID = 40000
+
+
+def tree_depth(count: int) -> int:
+    """Number of siblings in every proof of a tree over `count` leaves."""
+    depth = 0
+    while count > 1:
+        count = (count + 1) // 2
+        depth += 1
+    return depth
+
+
+def canonical_score(index: int, padding: int) -> bytes:
+    """The score document proof `index` commits to; its sha256 is the leaf."""
+    doc = {'artist': f"Synthetic Artist {index % 997}", 'match_id': str(FIRST_MATCH_ID + index),
+           'notes': 'x' * padding, 'score': index % 101}
+    return json.dumps(doc, sort_keys=True, separators=(',', ':')).encode()
+
+
+def score_padding(count: int, proof_size: int) -> int:
+    """Notes length that brings a proof file to about `proof_size` bytes.
+
+    Every field except the notes has a fixed width apart from the match ID,
+    so one sample proof is enough to measure the overhead.
+    """
+    sample = {'match_id': str(FIRST_MATCH_ID + count), 'merkle_root': merkle.to_hex(bytes(32)),
+              'anchor_tx': merkle.to_hex(bytes(32)), 'hash': merkle.to_hex(bytes(32)),
+              'proof': [merkle.to_hex(bytes(32))] * tree_depth(count),
+              'canonical_score': canonical_score(count, 0).decode()}
+    return max(0, proof_size - len(json.dumps(sample)))
+
+
+def db_table(rows: list) -> str:
+    lines = [" id | match_id | merkle_root | status", "----+----------+-------------+--------"]
+    for i, (match_id, merkle_root) in enumerate(rows, 1):
+        lines.append(f" {i} | {match_id} | {merkle_root} | finalized")
+    lines.append(f"({len(rows)} rows)")
+    return "\n".join(lines) + "\n"
+
+
+def make_bundle(zip_path: str, count: int, proof_size: int = DEFAULT_PROOF_SIZE,
+                prefix: str = DEFAULT_PREFIX, compresslevel: int = DEFAULT_COMPRESSLEVEL,
+                malformed_ratio: float = 0.0, seed: int = 0, with_db_table: bool = False,
+                with_path: bool = True) -> dict:
+    """Write a synthetic bundle and return what it contains.
+
+    The result has proofs, malformed, valid (parseable proofs), merkle_root,
+    zip_bytes and member_bytes (uncompressed proof bytes). compresslevel 0
+    stores members uncompressed. with_path=False leaves the leaf hash, sibling
+    path and score document out of every proof file (proof_size is then
+    ignored); the merkle_root is the same.
+    """
+    padding = score_padding(count, proof_size)
+    base = prefix.strip('/') + '/' if prefix.strip('/') else ''
+
+    # Pass 1: leaves only (32 bytes per proof); documents are rebuilt in pass 2
+    leaves = bytearray(count * merkle.HASH_SIZE)
+    for i in range(count):
+        leaves[i * merkle.HASH_SIZE:(i + 1) * merkle.HASH_SIZE] = hashlib.sha256(canonical_score(i, padding)).digest()
+    layers = merkle.build_tree(bytes(leaves)) if count else [bytes(merkle.HASH_SIZE)]
+    root = merkle.to_hex(layers[-1])
+    anchor_tx = merkle.to_hex(hashlib.sha256(b'anchor:' + layers[-1]).digest())
+
+    malformed = set(random.Random(seed).sample(range(count), round(count * malformed_ratio)))
+    compression = zipfile.ZIP_DEFLATED if compresslevel else zipfile.ZIP_STORED
+    member_bytes = 0
+
+    with zipfile.ZipFile(zip_path, 'w', compression, compresslevel=compresslevel or None) as zf:
+        zf.writestr(f"{base}harness_output.txt",
+                    f"Synthetic bundle: {count} proofs\nAnchored Root: {root}\nAnchor TX: {anchor_tx}\n"
+                    f"Status: {count - len(malformed)} proofs generated\n")
+        if with_db_table:
+            zf.writestr(f"{base}db/proofs_table.txt",
+                        db_table([(str(FIRST_MATCH_ID + i), root) for i in range(count)]))
+        for i in range(count):
+            proof = {
+                'match_id': str(FIRST_MATCH_ID + i),
+                'merkle_root': root,
+                'anchor_tx': anchor_tx if i % PENDING_EVERY else None,
+            }
+            if with_path:
+                proof['hash'] = merkle.to_hex(merkle.node(layers[0], i))
+                proof['proof'] = merkle.get_proof(layers, i)
+                proof['canonical_score'] = canonical_score(i, padding).decode()
+            data = json.dumps(proof).encode()
+            if i in malformed:
+                data = data[:len(data) // 2]
+            member_bytes += len(data)
+            zf.writestr(f"{base}proofs/{i:08d}.json", data)
+
+    return {
+        'proofs': count,
+        'malformed': len(malformed),
+        'valid': count - len(malformed),
+        'merkle_root': root,
+        'zip_bytes': os.path.getsize(zip_path),
+        'member_bytes': member_bytes,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a synthetic evidence bundle with valid Merkle proofs.")
+    parser.add_argument('zip_path', metavar='out.zip')
+    parser.add_argument('--proofs', type=int, default=10000, help="number of proof files (default: 10000)")
+    parser.add_argument('--proof-size', type=int, default=DEFAULT_PROOF_SIZE,
+                        help=f"approximate bytes per proof file (default: {DEFAULT_PROOF_SIZE})")
+    parser.add_argument('--prefix', default=DEFAULT_PREFIX,
+                        help=f"directory the bundle is nested under; '' for the archive root (default: {DEFAULT_PREFIX})")
+    parser.add_argument('--compresslevel', type=int, default=DEFAULT_COMPRESSLEVEL, choices=range(10),
+                        metavar='0-9', help=f"deflate level, 0 = stored (default: {DEFAULT_COMPRESSLEVEL})")
+    parser.add_argument('--malformed-ratio', type=float, default=0.0,
+                        help="fraction of proof files written as truncated JSON (default: 0)")
+    parser.add_argument('--seed', type=int, default=0, help="seed for picking malformed files (default: 0)")
+    parser.add_argument('--db-table', action='store_true', help="add db/proofs_table.txt with one row per proof")
+    parser.add_argument('--no-path', action='store_true',
+                        help="write only match_id, merkle_root and anchor_tx per proof (ignores --proof-size)")
+    args = parser.parse_args()
+
+    if args.proofs < 0 or not 0 <= args.malformed_ratio <= 1:
+        parser.error("--proofs must be >= 0 and --malformed-ratio between 0 and 1")
+
+    print(f"🏗️  Building {args.zip_path} with {args.proofs} proofs...")
+    info = make_bundle(args.zip_path, args.proofs, args.proof_size, args.prefix, args.compresslevel,
+                       args.malformed_ratio, args.seed, args.db_table, not args.no_path)
+    print(f"✅ {info['valid']} valid + {info['malformed']} malformed proofs, root {info['merkle_root']}")
+    print(f"   {info['member_bytes'] / (1 << 20):.1f} MB of proof files, "
+          f"{info['zip_bytes'] / (1 << 20):.1f} MB zipped")
+
+
+if __name__ == '__main__':
+    main()
@@ -118,19 +118,8 @@ fi
 echo "🔄 MERKLE ROOT COMPARISON:"
 echo "─────────────────────────────────────────────────────────────────────────────"
 if [ -d "$PROOFDIR" ] && [ -f "$DB_FILE" ]; then
-  PROOF_ROOTS=$(find "$PROOFDIR" -name "*.json" -exec jq -r '.merkle_root // empty' {} \; 2>/dev/null | sort -u | wc -l)
-  DB_ROOTS=$(grep -oE '0x[0-9a-fA-F]{32,}' "$DB_FILE" 2>/dev/null | sort -u | wc -l)
-  
-  echo "  Unique merkle_root values in proofs/: $PROOF_ROOTS"
-  echo "  Unique 0x-prefixed hashes in DB: $DB_ROOTS"
-  
-  if [ "$PROOF_ROOTS" -gt 0 ] && [ "$DB_ROOTS" -gt 0 ]; then
-    echo "  ✅ Both proofs and DB contain merkle/hash data"
-  elif [ "$PROOF_ROOTS" -eq 0 ] && [ "$DB_ROOTS" -eq 0 ]; then
-    echo "  ⚠️  No merkle_root data found in either proofs or DB (check if attestation ran)"
-  else
-    echo "  ⚠️  Mismatch: one has data, other doesn't"
-  fi
+  # One Python pass joins every proof against a hash index of the DB dump
+  python3 "$(dirname "$0")/reconcile_proofs.py" "$ZIP" || echo "  ⚠️  Reconciliation failed"
 else
   echo "  ⚠️  Cannot compare: missing proofs/ or db/proofs_table.txt"
 fi